@@ -0,0 +1,77 @@
+"""Benchmark the use cases against the in-memory and Django ORM repositories.
+
+    python -m src.benchmarks --rows 1000 10000 --save src/benchmarks/baseline.json
+    python -m src.benchmarks --rows 1000 10000 --compare src/benchmarks/baseline.json
+
+The ORM backend runs against a throwaway test database created for the run.
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m src.benchmarks', description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--backends', nargs='+', default=None, help='memory and/or orm (default: both)')
+    parser.add_argument('--scenarios', nargs='+', default=None, help='default: all')
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--save', type=Path, help='write the results as a JSON baseline')
+    parser.add_argument('--compare', type=Path, help='compare the results against a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed p50 latency growth (default: 0.2)')
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.django_project.settings')
+    import django
+    from django.conf import settings
+    django.setup()
+    # DEBUG makes every cursor record its queries, which is measurable overhead.
+    settings.DEBUG = False
+
+    from django.core.management import call_command
+    from django.db import connection
+
+    from src.benchmarks.runner import compare, format_results, load_baseline, measure, save_baseline
+    from src.benchmarks.scenarios import BACKENDS, SCENARIOS, seed
+
+    backends = args.backends or list(BACKENDS)
+    scenarios = args.scenarios or list(SCENARIOS)
+    unknown = set(backends) - set(BACKENDS) | set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f'unknown backends or scenarios: {", ".join(sorted(unknown))}')
+
+    old_database_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    results = []
+    try:
+        for rows in args.rows:
+            for backend in backends:
+                if backend == 'orm':
+                    call_command('flush', interactive=False, verbosity=0)
+                fixture = seed(backend, rows)
+                for scenario in scenarios:
+                    operation = SCENARIOS[scenario](fixture)
+                    result = measure(scenario, backend, rows, operation, iterations=args.iterations)
+                    results.append(result)
+                    print(format_results([result]).splitlines()[-1], file=sys.stderr)
+    finally:
+        connection.creation.destroy_test_db(old_database_name, verbosity=0)
+
+    print(format_results(results))
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f'\nBaseline saved to {args.save}')
+
+    if args.compare:
+        report, regressions = compare(results, load_baseline(args.compare), threshold=args.threshold)
+        print(f'\nCompared with {args.compare}\n{report}')
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""Measure the cost of building domain entities: validated constructor vs rehydrate,
+against a baseline with the entity layout they replaced.
+
+    python -m src.benchmarks.entities --rows 100000
+
+Reports throughput (entities per second) and memory retained per entity, measured with
+tracemalloc on a list of ``rows`` entities. The input rows are built beforehand, so
+only the entities themselves are counted.
+
+The baseline entities are plain (unslotted) dataclasses that allocate their Notification
+in the constructor, as the domain entities did before they were slotted; they run the
+same validation, so the difference is the layout alone.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
+from uuid import UUID, uuid4
+
+from src.core.castmembers.domain.castmember import CastMember, CastMemberType
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+
+
+@dataclass
+class EntityBenchmarkResult:
+    entity: str
+    constructor: str
+    rows: int
+    entities_per_sec: float
+    bytes_per_entity: float
+
+
+def rows_for(entity: str, rows: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    metadata = {'created_at': now, 'updated_at': now, 'version': 1}
+    if entity == 'category':
+        return [
+            {'id': uuid4(), 'name': f'Category {index}', 'description': 'Description', 'is_active': True, **metadata}
+            for index in range(rows)
+        ]
+    if entity == 'genre':
+        categories = {uuid4(), uuid4()}
+        return [
+            {'id': uuid4(), 'name': f'Genre {index}', 'is_active': True, 'categories': set(categories), **metadata}
+            for index in range(rows)
+        ]
+    return [
+        {'id': uuid4(), 'name': f'Cast member {index}', 'type': CastMemberType.ACTOR, **metadata}
+        for index in range(rows)
+    ]
+
+
+class BaselineNotification:
+    def __init__(self) -> None:
+        self._errors: list[str] = []
+
+    def add_error(self, message: str) -> None:
+        self._errors.append(message)
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self._errors)
+
+    @property
+    def messages(self) -> str:
+        return "; ".join(self._errors)
+
+
+@dataclass(kw_only=True)
+class BaselineEntity:
+    id: UUID = field(default_factory=uuid4)
+    notification: BaselineNotification = field(default_factory=BaselineNotification)
+    created_at: datetime | None = field(default=None, compare=False)
+    updated_at: datetime | None = field(default=None, compare=False)
+    version: int = field(default=0, compare=False)
+
+    def __post_init__(self):
+        self._validate()
+
+    def _raise_on_errors(self) -> None:
+        if self.notification.has_errors:
+            raise ValueError(self.notification.messages)
+
+
+@dataclass
+class BaselineCategory(BaselineEntity):
+    name: str
+    description: str = ''
+    is_active: bool = True
+
+    _validate = Category._validate
+
+
+@dataclass
+class BaselineGenre(BaselineEntity):
+    name: str
+    is_active: bool = True
+    categories: set[UUID] = field(default_factory=set)
+
+    _validate = Genre._validate
+
+
+@dataclass
+class BaselineCastMember(BaselineEntity):
+    name: str
+    type: CastMemberType
+
+    _validate = CastMember._validate
+
+
+ENTITIES: dict[str, type] = {
+    'category': Category,
+    'genre': Genre,
+    'cast_member': CastMember,
+}
+
+BASELINE_ENTITIES: dict[type, type] = {
+    Category: BaselineCategory,
+    Genre: BaselineGenre,
+    CastMember: BaselineCastMember,
+}
+
+CONSTRUCTORS: dict[str, Callable[[type], Callable[..., object]]] = {
+    'baseline': lambda entity_class: BASELINE_ENTITIES[entity_class],
+    'validated': lambda entity_class: entity_class,
+    'rehydrate': lambda entity_class: entity_class.rehydrate,
+}
+
+
+def measure_entities(entity: str, constructor: str, rows: int) -> EntityBenchmarkResult:
+    build = CONSTRUCTORS[constructor](ENTITIES[entity])
+    data = rows_for(entity, rows)
+
+    gc.collect()
+    start = time.perf_counter()
+    entities = [build(**row) for row in data]
+    elapsed = time.perf_counter() - start
+    del entities
+
+    gc.collect()
+    tracemalloc.start()
+    entities = [build(**row) for row in data]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return EntityBenchmarkResult(
+        entity=entity,
+        constructor=constructor,
+        rows=rows,
+        entities_per_sec=rows / elapsed,
+        # The list itself holds one pointer per entity; leave it out.
+        bytes_per_entity=(retained - entities.__sizeof__()) / rows,
+    )
+
+
+def format_results(results: list[EntityBenchmarkResult]) -> str:
+    lines = [f'{"entity":<12} {"constructor":<12} {"rows":>8} {"entities/sec":>14} {"bytes/entity":>13}']
+    for result in results:
+        lines.append(
+            f'{result.entity:<12} {result.constructor:<12} {result.rows:>8} '
+            f'{result.entities_per_sec:>14,.0f} {result.bytes_per_entity:>13.1f}'
+        )
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m src.benchmarks.entities', description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    results = [
+        measure_entities(entity, constructor, args.rows)
+        for entity in ENTITIES
+        for constructor in CONSTRUCTORS
+    ]
+    print(format_results(results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""Concurrent create throughput for each database configuration.
+
+    python -m src.benchmarks.load --threads 8 --creates 250
+    python -m src.benchmarks.load --configurations postgresql postgresql-persistent
+
+Each configuration runs in its own process, since the database settings are read from
+the environment at startup (see settings.py), against a throwaway database: a temporary
+SQLite file, or the test database of the PostgreSQL server set in DATABASE_HOST etc.
+
+Every thread creates categories through the CreateCategory use case, one request at a
+time: connections are released after each one as Django does when a request finishes,
+so CONN_MAX_AGE decides whether the next request reconnects. Creates that fail (e.g.
+"database is locked") are counted as errors rather than retried.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+from src.benchmarks.runner import percentile
+
+
+CONFIGURATIONS: dict[str, dict[str, str]] = {
+    # SQLite's defaults (rollback journal, full sync) and a new connection per request.
+    'sqlite': {'DATABASE_ENGINE': 'sqlite', 'DATABASE_SQLITE_TUNED': 'false', 'DATABASE_CONN_MAX_AGE': '0'},
+    'sqlite-tuned': {'DATABASE_ENGINE': 'sqlite', 'DATABASE_SQLITE_TUNED': 'true', 'DATABASE_CONN_MAX_AGE': '60'},
+    'postgresql': {'DATABASE_ENGINE': 'postgresql', 'DATABASE_CONN_MAX_AGE': '0'},
+    'postgresql-persistent': {'DATABASE_ENGINE': 'postgresql', 'DATABASE_CONN_MAX_AGE': '60'},
+}
+DEFAULT_CONFIGURATIONS = ('sqlite', 'sqlite-tuned')
+
+
+@dataclass
+class LoadResult:
+    configuration: str
+    threads: int
+    creates: int
+    errors: int
+    connections: int
+    creates_per_sec: float
+    p50_ms: float
+    p99_ms: float
+
+
+def run_load(configuration: str, threads: int, creates_per_thread: int) -> LoadResult:
+    """Run the load in this process, against the current default database."""
+    from django.db import OperationalError, close_old_connections, connections
+    from django.db.backends.signals import connection_created
+
+    from src.core.category.application.use_cases.create_category import CreateCategory, CreateCategoryRequest
+    from src.django_project.category_app.repository import DjangoORMCategoryRepository
+
+    lock = threading.Lock()
+    samples: list[float] = []
+    errors = 0
+    opened = 0
+
+    def count_connection(**kwargs) -> None:
+        nonlocal opened
+        with lock:
+            opened += 1
+
+    def worker(number: int, start: threading.Barrier) -> None:
+        nonlocal errors
+        use_case = CreateCategory(repository=DjangoORMCategoryRepository())
+        thread_samples, thread_errors = [], 0
+        start.wait()
+        for index in range(creates_per_thread):
+            close_old_connections()
+            began = time.perf_counter()
+            try:
+                use_case.execute(CreateCategoryRequest(name=f'Category {number}-{index}', description='Load test'))
+            except OperationalError:
+                thread_errors += 1
+            else:
+                thread_samples.append(time.perf_counter() - began)
+            close_old_connections()
+        connections.close_all()
+
+        with lock:
+            samples.extend(thread_samples)
+            errors += thread_errors
+
+    connection_created.connect(count_connection)
+    start = threading.Barrier(threads + 1)
+    workers = [threading.Thread(target=worker, args=(number, start)) for number in range(threads)]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    connection_created.disconnect(count_connection)
+
+    samples.sort()
+    return LoadResult(
+        configuration=configuration,
+        threads=threads,
+        creates=len(samples),
+        errors=errors,
+        connections=opened,
+        creates_per_sec=len(samples) / elapsed,
+        p50_ms=percentile(samples, 0.50) * 1000 if samples else 0.0,
+        p99_ms=percentile(samples, 0.99) * 1000 if samples else 0.0,
+    )
+
+
+def format_results(results: list[LoadResult]) -> str:
+    header = (
+        f'{"configuration":<22} {"threads":>7} {"creates":>8} {"errors":>7} {"conns":>6} '
+        f'{"creates/sec":>12} {"p50 ms":>9} {"p99 ms":>9}'
+    )
+    lines = [header, '-' * len(header)]
+    for result in results:
+        lines.append(
+            f'{result.configuration:<22} {result.threads:>7} {result.creates:>8} {result.errors:>7} '
+            f'{result.connections:>6} {result.creates_per_sec:>12.1f} {result.p50_ms:>9.3f} {result.p99_ms:>9.3f}'
+        )
+    return '\n'.join(lines)
+
+
+def _worker_main(configuration: str, threads: int, creates_per_thread: int) -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.django_project.settings')
+    import django
+    from django.conf import settings
+    django.setup()
+    settings.DEBUG = False
+
+    from django.db import connection
+
+    with tempfile.TemporaryDirectory() as directory:
+        if connection.vendor == 'sqlite':
+            # The default SQLite test database lives in memory; this needs a real file.
+            connection.settings_dict['TEST']['NAME'] = os.path.join(directory, 'load.sqlite3')
+        old_database_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        connection.close()
+        try:
+            result = run_load(configuration, threads, creates_per_thread)
+        finally:
+            connection.creation.destroy_test_db(old_database_name, verbosity=0)
+
+    print(json.dumps(asdict(result)))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m src.benchmarks.load', description=__doc__.splitlines()[0])
+    parser.add_argument('--configurations', nargs='+', default=list(DEFAULT_CONFIGURATIONS),
+                        choices=list(CONFIGURATIONS))
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--creates', type=int, default=250, help='creates per thread (default: 250)')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker_main(args.worker, args.threads, args.creates)
+        return 0
+
+    results = []
+    for configuration in args.configurations:
+        completed = subprocess.run(
+            [sys.executable, '-m', 'src.benchmarks.load', '--worker', configuration,
+             '--threads', str(args.threads), '--creates', str(args.creates)],
+            env={**os.environ, **CONFIGURATIONS[configuration]},
+            stdout=subprocess.PIPE,
+            check=True,
+            text=True,
+        )
+        result = LoadResult(**json.loads(completed.stdout.splitlines()[-1]))
+        results.append(result)
+        print(format_results([result]).splitlines()[-1], file=sys.stderr)
+
+    print(format_results(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
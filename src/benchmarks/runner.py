@@ -0,0 +1,123 @@
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@dataclass
+class BenchmarkResult:
+    scenario: str
+    backend: str
+    rows: int
+    iterations: int
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    queries_per_op: float
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return self.scenario, self.backend, self.rows
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    # Nearest-rank percentile; samples must be sorted.
+    return samples[max(0, math.ceil(fraction * len(samples)) - 1)]
+
+
+def measure(
+    scenario: str,
+    backend: str,
+    rows: int,
+    operation: Callable[[int], object],
+    iterations: int,
+    warmup: int = 5,
+) -> BenchmarkResult:
+    """Time ``operation(i)`` for ``iterations`` calls, after a few untimed warm-up calls.
+
+    Queries are counted on one extra call only: capturing them forces Django's debug
+    cursor, which would otherwise inflate the timings.
+    """
+    for index in range(warmup):
+        operation(-1 - index)
+
+    samples = []
+    started = time.perf_counter()
+    for index in range(iterations):
+        start = time.perf_counter()
+        operation(index)
+        samples.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+
+    with CaptureQueriesContext(connection) as queries:
+        operation(iterations)
+
+    samples.sort()
+    return BenchmarkResult(
+        scenario=scenario,
+        backend=backend,
+        rows=rows,
+        iterations=iterations,
+        ops_per_sec=iterations / elapsed,
+        p50_ms=percentile(samples, 0.50) * 1000,
+        p99_ms=percentile(samples, 0.99) * 1000,
+        queries_per_op=len(queries.captured_queries),
+    )
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    header = f'{"scenario":<20} {"backend":<8} {"rows":>7} {"ops/sec":>10} {"p50 ms":>9} {"p99 ms":>9} {"queries":>7}'
+    lines = [header, '-' * len(header)]
+    for result in results:
+        lines.append(
+            f'{result.scenario:<20} {result.backend:<8} {result.rows:>7} {result.ops_per_sec:>10.1f} '
+            f'{result.p50_ms:>9.3f} {result.p99_ms:>9.3f} {result.queries_per_op:>7.0f}'
+        )
+    return '\n'.join(lines)
+
+
+def save_baseline(results: list[BenchmarkResult], path: Path) -> None:
+    path.write_text(json.dumps([asdict(result) for result in results], indent=2) + '\n')
+
+
+def load_baseline(path: Path) -> list[BenchmarkResult]:
+    return [BenchmarkResult(**result) for result in json.loads(path.read_text())]
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    threshold: float = 0.2,
+) -> tuple[str, list[BenchmarkResult]]:
+    """Compare against a baseline, returning a report and the regressed results.
+
+    A result regresses when its median latency grows by more than ``threshold`` (the
+    median rather than ops/sec, which a single GC pause can swing) or when it issues
+    more queries per operation than before; the latter is what catches N+1s.
+    """
+    baseline_by_key = {result.key: result for result in baseline}
+    lines, regressions = [], []
+    for result in results:
+        previous = baseline_by_key.get(result.key)
+        if previous is None:
+            lines.append(f'{result.scenario:<20} {result.backend:<8} {result.rows:>7}  (no baseline)')
+            continue
+
+        latency_change = result.p50_ms / previous.p50_ms - 1
+        throughput_change = result.ops_per_sec / previous.ops_per_sec - 1
+        regressed = latency_change > threshold or result.queries_per_op > previous.queries_per_op
+        if regressed:
+            regressions.append(result)
+        lines.append(
+            f'{result.scenario:<20} {result.backend:<8} {result.rows:>7} '
+            f'p50 {latency_change:>+8.1%}  ops/sec {throughput_change:>+8.1%}  '
+            f'queries {previous.queries_per_op:.0f} -> {result.queries_per_op:.0f}'
+            + ('  REGRESSION' if regressed else '')
+        )
+
+    return '\n'.join(lines), regressions
@@ -0,0 +1,152 @@
+from dataclasses import dataclass
+from typing import Callable
+from uuid import UUID
+
+from src.core.castmembers.application.use_cases.create_castmembers import CreateCastMember, CreateCastMemberRequest
+from src.core.castmembers.application.use_cases.list_castmembers import ListCastMember, ListCastMemberRequest
+from src.core.castmembers.application.use_cases.update_castmembers import UpdateCastMember, UpdateCastMemberRequest
+from src.core.castmembers.domain.castmember import CastMember, CastMemberType
+from src.core.castmembers.domain.castmember_repository import CastMemberRepository
+from src.core.category.application.use_cases.create_category import CreateCategory, CreateCategoryRequest
+from src.core.category.application.use_cases.list_category import ListCategory, ListCategoryRequest
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.application.use_cases.create_genre import CreateGenre
+from src.core.genre.application.use_cases.list_genre import ListGenre
+from src.core.genre.application.use_cases.update_genre import UpdateGenre
+from src.core.genre.domain.genre import Genre
+from src.core.genre.domain.genre_repository import GenreRepository
+from src.django_project.container import IN_MEMORY_REPOSITORIES, ORM_REPOSITORIES, Container
+
+
+BACKEND_REPOSITORIES = {
+    'memory': IN_MEMORY_REPOSITORIES,
+    'orm': ORM_REPOSITORIES,
+}
+BACKENDS = tuple(BACKEND_REPOSITORIES)
+CATEGORIES_PER_GENRE = 3
+
+
+@dataclass
+class Fixture:
+    """A container over the repositories of one backend, seeded with ``rows`` rows of
+    each aggregate.
+
+    Benchmarks drive the plain repositories, not the cached ones, so they measure the
+    backends themselves.
+    """
+    backend: str
+    rows: int
+    container: Container
+    category_ids: list[UUID]
+    genre_ids: list[UUID]
+    cast_member_ids: list[UUID]
+
+
+def seed(backend: str, rows: int) -> Fixture:
+    """Build the repositories of ``backend``; ORM tables are expected to be empty."""
+    categories = [Category(name=f'Category {index}') for index in range(rows)]
+    genres = [
+        Genre(
+            name=f'Genre {index}',
+            categories={categories[(index + offset) % rows].id for offset in range(CATEGORIES_PER_GENRE)},
+        ) for index in range(rows)
+    ]
+    cast_members = [
+        CastMember(name=f'Cast member {index}', type=list(CastMemberType)[index % len(CastMemberType)])
+        for index in range(rows)
+    ]
+
+    if backend not in BACKEND_REPOSITORIES:
+        raise ValueError(f'Unknown backend: {backend}')
+
+    container = Container(BACKEND_REPOSITORIES[backend], decorators={})
+    container.repository(CategoryRepository).save_many(categories)
+    container.repository(GenreRepository).save_many(genres)
+    container.repository(CastMemberRepository).save_many(cast_members)
+
+    return Fixture(
+        backend=backend,
+        rows=rows,
+        container=container,
+        category_ids=[category.id for category in categories],
+        genre_ids=[genre.id for genre in genres],
+        cast_member_ids=[cast_member.id for cast_member in cast_members],
+    )
+
+
+# Each scenario builds, from a seeded fixture, an operation that takes the iteration
+# number; iterations spread their writes over the seeded rows.
+Operation = Callable[[int], object]
+
+
+def create_category(fixture: Fixture) -> Operation:
+    use_case = fixture.container.use_case(CreateCategory)
+    return lambda index: use_case.execute(CreateCategoryRequest(name=f'New category {index}'))
+
+
+def list_category(fixture: Fixture) -> Operation:
+    use_case = fixture.container.use_case(ListCategory)
+    return lambda index: use_case.execute(ListCategoryRequest())
+
+
+def create_genre(fixture: Fixture) -> Operation:
+    use_case = fixture.container.use_case(CreateGenre)
+    return lambda index: use_case.execute(CreateGenre.Input(
+        name=f'New genre {index}',
+        category_ids=_categories_for(fixture, index),
+    ))
+
+
+def update_genre(fixture: Fixture) -> Operation:
+    use_case = fixture.container.use_case(UpdateGenre)
+    return lambda index: use_case.execute(UpdateGenre.Input(
+        id=fixture.genre_ids[index % fixture.rows],
+        name=f'Updated genre {index}',
+        categories=_categories_for(fixture, index + 1),
+    ))
+
+
+def list_genre(fixture: Fixture) -> Operation:
+    use_case = fixture.container.use_case(ListGenre)
+    return lambda index: use_case.execute(ListGenre.Input())
+
+
+def create_cast_member(fixture: Fixture) -> Operation:
+    use_case = fixture.container.use_case(CreateCastMember)
+    return lambda index: use_case.execute(CreateCastMemberRequest(
+        name=f'New cast member {index}',
+        type=CastMemberType.ACTOR,
+    ))
+
+
+def update_cast_member(fixture: Fixture) -> Operation:
+    use_case = fixture.container.use_case(UpdateCastMember)
+    return lambda index: use_case.execute(UpdateCastMemberRequest(
+        id=fixture.cast_member_ids[index % fixture.rows],
+        name=f'Updated cast member {index}',
+    ))
+
+
+def list_cast_member(fixture: Fixture) -> Operation:
+    use_case = fixture.container.use_case(ListCastMember)
+    return lambda index: use_case.execute(ListCastMemberRequest())
+
+
+def _categories_for(fixture: Fixture, index: int) -> set[UUID]:
+    return {
+        fixture.category_ids[(index + offset) % fixture.rows]
+        for offset in range(min(CATEGORIES_PER_GENRE, fixture.rows))
+    }
+
+
+SCENARIOS: dict[str, Callable[[Fixture], Operation]] = {
+    'create_category': create_category,
+    'list_category': list_category,
+    'create_genre': create_genre,
+    'update_genre': update_genre,
+    'list_genre': list_genre,
+    'create_cast_member': create_cast_member,
+    'update_cast_member': update_cast_member,
+    'list_cast_member': list_cast_member,
+}
@@ -0,0 +1,91 @@
+import pytest
+
+from src.benchmarks.entities import CONSTRUCTORS, ENTITIES, measure_entities
+from src.benchmarks.load import run_load
+from src.benchmarks.runner import BenchmarkResult, compare, load_baseline, measure, percentile, save_baseline
+from src.benchmarks.scenarios import BACKENDS, SCENARIOS, seed
+from src.django_project.category_app.models import Category as CategoryModel
+
+
+def result(p50_ms: float = 1.0, queries_per_op: float = 1) -> BenchmarkResult:
+    return BenchmarkResult(
+        scenario='list_genre',
+        backend='orm',
+        rows=1000,
+        iterations=10,
+        ops_per_sec=1000 / p50_ms,
+        p50_ms=p50_ms,
+        p99_ms=p50_ms * 2,
+        queries_per_op=queries_per_op,
+    )
+
+
+def test_percentile_is_nearest_rank():
+    samples = [float(sample) for sample in range(1, 101)]
+
+    assert percentile(samples, 0.50) == 50
+    assert percentile(samples, 0.99) == 99
+    assert percentile([3.0], 0.99) == 3
+
+
+def test_compare_flags_slower_results_and_extra_queries():
+    baseline = [result()]
+
+    _, regressions = compare([result(p50_ms=1.1)], baseline, threshold=0.2)
+    assert regressions == []
+
+    _, regressions = compare([result(p50_ms=1.5)], baseline, threshold=0.2)
+    assert len(regressions) == 1
+
+    _, regressions = compare([result(queries_per_op=6)], baseline, threshold=0.2)
+    assert len(regressions) == 1
+
+
+def test_baseline_round_trip(tmp_path):
+    path = tmp_path / 'baseline.json'
+
+    save_baseline([result()], path)
+
+    assert load_baseline(path) == [result()]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_every_scenario_runs(backend):
+    fixture = seed(backend, rows=10)
+
+    for scenario, build in SCENARIOS.items():
+        benchmark = measure(scenario, backend, fixture.rows, build(fixture), iterations=3, warmup=1)
+
+        assert benchmark.iterations == 3
+        assert benchmark.p50_ms <= benchmark.p99_ms
+        if backend == 'memory':
+            assert benchmark.queries_per_op == 0
+        else:
+            assert benchmark.queries_per_op > 0
+
+
+@pytest.mark.parametrize('entity', list(ENTITIES))
+@pytest.mark.parametrize('constructor', list(CONSTRUCTORS))
+def test_measure_entities(entity, constructor):
+    result = measure_entities(entity, constructor, rows=100)
+
+    assert result.rows == 100
+    assert result.entities_per_sec > 0
+    assert result.bytes_per_entity > 0
+
+
+@pytest.mark.parametrize('entity', list(ENTITIES))
+def test_slotted_entities_retain_less_than_the_baseline(entity):
+    baseline = measure_entities(entity, 'baseline', rows=1000)
+    validated = measure_entities(entity, 'validated', rows=1000)
+
+    assert validated.bytes_per_entity < baseline.bytes_per_entity
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_load_counts_every_create():
+    result = run_load('sqlite-tuned', threads=2, creates_per_thread=3)
+
+    assert result.creates + result.errors == 6
+    assert CategoryModel.objects.count() == result.creates
@@ -0,0 +1,15 @@
+import pytest
+from django.core.cache import caches
+
+from src.django_project._shared import metrics
+from src.django_project._shared.cached_repository import reset_cache_stats, reset_hot_rows
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # The locmem cache outlives each test's database transaction.
+    for cache in caches.all():
+        cache.clear()
+    reset_cache_stats()
+    reset_hot_rows()
+    metrics.registry.reset()
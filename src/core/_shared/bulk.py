@@ -0,0 +1,34 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Sequence, TypeVar
+from uuid import UUID
+
+
+T = TypeVar('T')
+
+
+@dataclass
+class BulkItemError:
+    index: int
+    error: str
+
+
+@dataclass
+class BulkResponse:
+    ids: list[UUID] = field(default_factory=list)
+    errors: list[BulkItemError] = field(default_factory=list)
+
+
+def order_by_ids(items: list[T], ids: Sequence[UUID]) -> tuple[list[T], list[UUID]]:
+    """Put ``items`` (anything with an ``id``, read back by a get_many in any order) in
+    the order of ``ids``, once per id, and return them with the ids none of them had."""
+    items_by_id = {item.id: item for item in items}
+    ids = list(dict.fromkeys(ids))
+
+    return [items_by_id[id] for id in ids if id in items_by_id], [id for id in ids if id not in items_by_id]
+
+
+def repeated_ids(ids: Iterable[UUID]) -> set[UUID]:
+    """The ids that appear more than once in a bulk update. Every item carrying one of
+    them is rejected, since the request does not say which of them should win."""
+    return {id for id, count in Counter(ids).items() if count > 1}
@@ -0,0 +1,130 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, TypeVar
+from uuid import UUID
+
+from src.core._shared.entity import Entity
+
+
+T = TypeVar('T', bound=Entity)
+
+
+@dataclass(frozen=True)
+class ChangeToken:
+    """Position in a change feed: the (timestamp, id) of the last change a client has seen.
+
+    Changes are ordered by (updated_at, id) for live rows and (deleted_at, id) for
+    tombstones, so the token is a keyset cursor over both.
+    """
+    timestamp: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f'{self.timestamp.isoformat()}|{self.id}'.encode()
+        return urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str) -> 'ChangeToken':
+        try:
+            raw = urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+            timestamp, id = raw.split('|')
+            timestamp = datetime.fromisoformat(timestamp)
+            if timestamp.tzinfo is None:
+                raise ValueError('naive timestamp')
+            return cls(timestamp=timestamp, id=UUID(id))
+        except (ValueError, binascii.Error) as err:
+            raise ValueError(f'Invalid change token: {token}') from err
+
+
+@dataclass
+class Tombstone:
+    id: UUID
+    deleted_at: datetime
+
+
+@dataclass(frozen=True)
+class ChangeState:
+    """Summary of everything a repository holds, for conditional reads: it moves on every
+    create, update and delete, whoever made it (the count catches deletes that left no
+    tombstone)."""
+    count: int
+    last_changed_at: datetime | None = None
+
+
+@dataclass
+class ChangesMeta:
+    next_token: str | None = None
+    has_more: bool = False
+
+
+def touch(entity: Entity, previous: Entity | None = None) -> None:
+    """Stamp the persistence metadata of an entity written to an in-memory repository."""
+    now = datetime.now(timezone.utc)
+    entity.created_at = previous.created_at if previous is not None else now
+    entity.updated_at = now
+    entity.version = previous.version + 1 if previous is not None else 1
+
+
+def select_changes(
+    entities: Iterable[T],
+    tombstones: Iterable[Tombstone],
+    since: ChangeToken | None,
+    limit: int,
+) -> tuple[list[T], list[Tombstone]]:
+    """In-memory counterpart of the ORM change queries: the first ``limit`` entities and
+    tombstones after ``since``, each in feed order."""
+    def is_after(timestamp: datetime, id: UUID) -> bool:
+        return since is None or (timestamp, id) > (since.timestamp, since.id)
+
+    changed = sorted(
+        (entity for entity in entities if is_after(entity.updated_at, entity.id)),
+        key=lambda entity: (entity.updated_at, entity.id),
+    )
+    deleted = sorted(
+        (tombstone for tombstone in tombstones if is_after(tombstone.deleted_at, tombstone.id)),
+        key=lambda tombstone: (tombstone.deleted_at, tombstone.id),
+    )
+
+    return changed[:limit], deleted[:limit]
+
+
+def change_state(entities: Iterable[Entity], tombstones: Iterable[Tombstone]) -> ChangeState:
+    """In-memory counterpart of the ORM change state query."""
+    entities = list(entities)
+    timestamps = [
+        *(entity.updated_at for entity in entities),
+        *(tombstone.deleted_at for tombstone in tombstones),
+    ]
+    return ChangeState(count=len(entities), last_changed_at=max(timestamps, default=None))
+
+
+def merge_changes(
+    changed: list[T],
+    deleted: list[Tombstone],
+    since: ChangeToken | None,
+    page_size: int,
+) -> tuple[list[T], list[Tombstone], ChangesMeta]:
+    # Repositories return up to page_size + 1 rows of each kind; merge both in feed
+    # order, keep one page and continue from the last change on it.
+    changes = sorted(
+        [(entity.updated_at, entity.id, entity) for entity in changed]
+        + [(tombstone.deleted_at, tombstone.id, tombstone) for tombstone in deleted],
+        key=lambda change: change[:2],
+    )
+    page = changes[:page_size]
+
+    next_token = since
+    if page:
+        timestamp, id, _ = page[-1]
+        next_token = ChangeToken(timestamp=timestamp, id=id)
+
+    return (
+        [change for _, _, change in page if not isinstance(change, Tombstone)],
+        [change for _, _, change in page if isinstance(change, Tombstone)],
+        ChangesMeta(
+            next_token=next_token.encode() if next_token is not None else None,
+            has_more=len(changes) > page_size,
+        ),
+    )
@@ -1,16 +1,152 @@
+import copy
 from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import datetime
+from operator import attrgetter
+from typing import Callable, Sequence, TypeVar
 from uuid import UUID, uuid4
 
+from src.core._shared.events import DomainEvent
 from src.core._shared.notification import Notification
 
 
-@dataclass(kw_only=True)
+class Rehydrate:
+    """``Category.rehydrate(id=..., name=..., ...)`` builds an entity from trusted data,
+    such as a row loaded by a repository, without running the validation of
+    ``__post_init__``.
+
+    Each class gets its own function, generated on first use like the ``__init__`` that
+    dataclass writes (one assignment per field) minus the ``__post_init__`` call, and
+    handed out directly so a call costs no more than a plain function call.
+    """
+    def __init__(self) -> None:
+        self.functions: dict[type, Callable[..., 'Entity']] = {}
+
+    def __get__(self, instance, owner: type['Entity']) -> Callable[..., 'Entity']:
+        function = self.functions.get(owner)
+        if function is None:
+            function = self.functions[owner] = self._compile(owner)
+        return function
+
+    @staticmethod
+    def _compile(cls: type['Entity']) -> Callable[..., 'Entity']:
+        namespace = {'cls': cls, 'MISSING': MISSING}
+        parameters, assignments = [], []
+        for entity_field in fields(cls):
+            name = entity_field.name
+            if entity_field.default_factory is not MISSING:
+                namespace[f'_factory_{name}'] = entity_field.default_factory
+                parameters.append(f'{name}=MISSING')
+                assignments.append(f'    entity.{name} = _factory_{name}() if {name} is MISSING else {name}')
+            elif entity_field.default is not MISSING:
+                namespace[f'_default_{name}'] = entity_field.default
+                parameters.append(f'{name}=_default_{name}')
+                assignments.append(f'    entity.{name} = {name}')
+            else:
+                parameters.append(name)
+                assignments.append(f'    entity.{name} = {name}')
+
+        source = '\n'.join([
+            f'def rehydrate(*, {", ".join(parameters)}):',
+            '    entity = object.__new__(cls)',
+            *assignments,
+            '    return entity',
+        ])
+        exec(source, namespace)
+        return namespace['rehydrate']
+
+
+@dataclass(kw_only=True, slots=True)
 class Entity(ABC):
     id: UUID = field(default_factory=uuid4)
-    notification: Notification = field(default_factory=Notification)
+    # Persistence metadata, stamped by the repositories on save/update; it is not part
+    # of the entity's value, so it is left out of comparisons.
+    created_at: datetime | None = field(default=None, compare=False)
+    updated_at: datetime | None = field(default=None, compare=False)
+    version: int = field(default=0, compare=False)
+    # Created on the first validation error (see notification): valid entities, which
+    # are nearly all of them, never allocate one.
+    _notification: Notification | None = field(default=None, init=False, repr=False, compare=False)
+    # Domain events recorded since the entity was loaded, handed to the outbox by the
+    # repository that saves it (see pull_events). Allocated on the first event, too.
+    _events: list[DomainEvent] | None = field(default=None, init=False, repr=False, compare=False)
+
+    rehydrate = Rehydrate()
+
+    @classmethod
+    def create(cls, **fields) -> 'Entity':
+        """A new entity, validated like ``cls(...)``, that records its creation event."""
+        entity = cls(**fields)
+        entity._record(entity._created_event())
+        return entity
+
+    @classmethod
+    def replace(cls, **fields) -> 'Entity':
+        """A validated entity replacing the stored one with the same id wholesale (bulk
+        updates), recording an update event with its new state."""
+        entity = cls(**fields)
+        entity._record(entity._updated_event())
+        return entity
+
+    def pull_events(self) -> list[DomainEvent]:
+        events, self._events = self._events or [], None
+        return events
+
+    def _record(self, event: DomainEvent) -> None:
+        # Consecutive events of the same type coalesce (one update event per save rather
+        # than one per mutator called), and drop out when they cancel each other.
+        if self._events is None:
+            self._events = []
+        if self._events and type(self._events[-1]) is type(event):
+            event = self._events.pop().merge(event)
+            if event is None:
+                return
+        self._events.append(event)
+
+    def _created_event(self) -> DomainEvent:
+        raise NotImplementedError
+
+    def _updated_event(self) -> DomainEvent:
+        raise NotImplementedError
+
+    @property
+    def notification(self) -> Notification:
+        if self._notification is None:
+            self._notification = Notification()
+        return self._notification
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return False
         return self.id == other.id
+
+    def _raise_on_errors(self) -> None:
+        if self._notification is not None and self._notification.has_errors:
+            raise ValueError(self._notification.messages)
+
+
+E = TypeVar('E', bound=Entity)
+
+
+def detach(entity: E) -> E:
+    """A copy of ``entity`` sharing no mutable state with it (nor its pending events),
+    for the in-memory repositories to store and hand out: like a database row, what
+    they hold only changes on save/update, not when a caller mutates its entity."""
+    events, entity._events = entity._events, None
+    try:
+        return copy.deepcopy(entity)
+    finally:
+        entity._events = events
+
+
+def projector(fields: Sequence[str]) -> Callable[[Entity], tuple]:
+    """A function returning the values of ``fields`` of an entity, in that order (a
+    read-side row)."""
+    getter = attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda entity: (getter(entity),)
+    return getter
+
+
+def project(entity: Entity, fields: Sequence[str]) -> tuple:
+    return projector(fields)(entity)
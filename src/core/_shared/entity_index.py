@@ -0,0 +1,39 @@
+from collections import defaultdict
+from typing import Callable, Hashable, Iterable
+from uuid import UUID
+
+from src.core._shared.entity import Entity
+
+
+class EntityIndex:
+    """Secondary index from an attribute value to the ids of the entities holding it.
+
+    With ``many=True`` the key function returns several values per entity (e.g. the
+    category ids of a genre), each of which is indexed. The keys an entity was indexed
+    under are remembered, so it can be unindexed even after the entity has been mutated.
+    """
+
+    def __init__(self, key: Callable[[Entity], Hashable | Iterable[Hashable]], many: bool = False) -> None:
+        self._key = key
+        self._many = many
+        # dict values keep ids in the order they were indexed (an ordered set).
+        self._ids_by_value: defaultdict[Hashable, dict[UUID, None]] = defaultdict(dict)
+        self._values_by_id: dict[UUID, tuple[Hashable, ...]] = {}
+
+    def add(self, entity: Entity) -> None:
+        values = tuple(self._key(entity)) if self._many else (self._key(entity),)
+        self._values_by_id[entity.id] = values
+        for value in values:
+            self._ids_by_value[value][entity.id] = None
+
+    def remove(self, id: UUID) -> None:
+        for value in self._values_by_id.pop(id, ()):
+            ids = self._ids_by_value[value]
+            ids.pop(id, None)
+            if not ids:
+                del self._ids_by_value[value]
+
+    def get(self, value: Hashable) -> list[UUID]:
+        if value not in self._ids_by_value:
+            return []
+        return list(self._ids_by_value[value])
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from typing import ClassVar
+from uuid import UUID, uuid4
+
+
+@dataclass(frozen=True, kw_only=True)
+class DomainEvent:
+    """Something that happened to an aggregate, recorded by the entity (see Entity) and
+    published to consumers through the outbox.
+
+    Subclasses add the fields that make up the payload and set ``aggregate``.
+    """
+    aggregate: ClassVar[str] = ''
+
+    aggregate_id: UUID
+    id: UUID = field(default_factory=uuid4)
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def event_type(self) -> str:
+        return type(self).__name__
+
+    def payload(self) -> dict:
+        return {
+            event_field.name: getattr(self, event_field.name)
+            for event_field in fields(self)
+            if event_field.name not in ('aggregate_id', 'id', 'occurred_at')
+        }
+
+    def merge(self, later: 'DomainEvent') -> 'DomainEvent | None':
+        """Combine this event with a later one of the same type on the same entity, or
+        None when they cancel out. By default the later one wins (state snapshots)."""
+        return later
@@ -0,0 +1,116 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Sequence, TypeVar
+from uuid import UUID
+
+from src.core._shared.entity import Entity
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Fields a list can be ordered by; prefix with '-' for descending order. Ties are
+# always broken by id, so every ordering is total and can be paged with a cursor.
+ORDER_BY_FIELDS = ('id', 'name', 'created_at')
+ORDER_BY_CHOICES = [*ORDER_BY_FIELDS, *(f'-{field}' for field in ORDER_BY_FIELDS)]
+
+T = TypeVar('T', bound=Entity)
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position in an ordered list: the (value, id) of the last row a client has seen,
+    where value is that row's value for the field the list is ordered by.
+
+    The next page starts right after that key, so it does not depend on the row still
+    existing when the next page is read.
+    """
+    id: UUID
+    field: str = 'id'
+    value: str | datetime | None = None
+
+    def encode(self) -> str:
+        value = self.value.isoformat() if isinstance(self.value, datetime) else self.value
+        raw = json.dumps([self.field, value, str(self.id)], separators=(',', ':')).encode()
+        return urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str) -> 'PageCursor':
+        try:
+            field, value, id = json.loads(urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+            if field not in ORDER_BY_FIELDS:
+                raise ValueError(f'unknown field {field}')
+            if field == 'created_at':
+                value = datetime.fromisoformat(value)
+            elif field == 'name' and not isinstance(value, str):
+                raise ValueError('name is not a string')
+            return cls(id=UUID(id), field=field, value=None if field == 'id' else value)
+        except (ValueError, TypeError, binascii.Error) as err:
+            raise ValueError(f'Invalid cursor: {token}') from err
+
+
+@dataclass
+class ListOutputMeta:
+    next_cursor: str | None = None
+    page_size: int = DEFAULT_PAGE_SIZE
+
+
+def page_fields(fields: Sequence[str], order_by: str) -> tuple[str, ...]:
+    """The fields to read for a page: ``fields`` plus the one the list is ordered by, which
+    the next cursor is built from."""
+    field, _ = parse_order_by(order_by)
+    return tuple(fields) if field in fields else (*fields, field)
+
+
+def paginate(
+    rows: list[tuple],
+    fields: Sequence[str],
+    page_size: int,
+    order_by: str,
+) -> tuple[list[tuple], str | None]:
+    # Repositories are asked for one extra row: if it comes back, there is a next page
+    # and the key of the last row of the current page is the cursor to continue from.
+    if len(rows) <= page_size:
+        return rows, None
+
+    page = rows[:page_size]
+    field, _ = parse_order_by(order_by)
+    last = dict(zip(fields, page[-1]))
+    cursor = PageCursor(id=last['id'], field=field, value=None if field == 'id' else last[field])
+    return page, cursor.encode()
+
+
+def parse_order_by(order_by: str) -> tuple[str, bool]:
+    """Split an ORDER_BY_CHOICES value into (field, descending)."""
+    if order_by not in ORDER_BY_CHOICES:
+        raise ValueError(f'Cannot order by {order_by}')
+
+    return order_by.lstrip('-'), order_by.startswith('-')
+
+
+def matches_name(name: str, name_prefix: str | None = None, search: str | None = None) -> bool:
+    if name_prefix is not None and not name.startswith(name_prefix):
+        return False
+    if search is not None and search.casefold() not in name.casefold():
+        return False
+    return True
+
+
+def order_and_page(entities: Iterable[T], cursor: PageCursor | None, limit: int | None, order_by: str) -> list[T]:
+    """In-memory counterpart of the ORM keyset queries: order by (field, id) and return
+    up to ``limit`` entities after the key in ``cursor``."""
+    field, descending = parse_order_by(order_by)
+
+    def key(entity: T) -> tuple:
+        return getattr(entity, field), entity.id
+
+    entities = sorted(entities, key=key, reverse=descending)
+
+    if cursor is not None:
+        after = (cursor.id if field == 'id' else cursor.value, cursor.id)
+        entities = [entity for entity in entities if (key(entity) < after if descending else key(entity) > after)]
+
+    return entities[:limit] if limit is not None else entities
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.bulk import BulkItemError, BulkResponse, repeated_ids
+from src.core.castmembers.application.use_cases.create_castmembers import CreateCastMemberRequest
+from src.core.castmembers.domain.castmember import CastMember, CastMemberType
+from src.core.castmembers.domain.castmember_repository import CastMemberRepository
+
+
+@dataclass
+class BulkCreateCastMemberRequest:
+    items: list[CreateCastMemberRequest]
+
+
+@dataclass
+class BulkUpdateCastMemberItem:
+    id: UUID
+    name: str
+    type: CastMemberType
+
+
+@dataclass
+class BulkUpdateCastMemberRequest:
+    items: list[BulkUpdateCastMemberItem]
+
+
+@dataclass
+class BulkDeleteCastMemberRequest:
+    ids: list[UUID]
+
+
+class BulkCreateCastMember:
+    def __init__(self, repository: CastMemberRepository):
+        self.repository = repository
+
+    def execute(self, request: BulkCreateCastMemberRequest) -> BulkResponse:
+        cast_members = []
+        errors = []
+        for index, item in enumerate(request.items):
+            try:
+                cast_members.append(CastMember.create(
+                    name=item.name,
+                    type=item.type,
+                ))
+            except ValueError as err:
+                errors.append(BulkItemError(index=index, error=str(err)))
+
+        self.repository.save_many(cast_members)
+
+        return BulkResponse(ids=[cast_member.id for cast_member in cast_members], errors=errors)
+
+
+class BulkUpdateCastMember:
+    def __init__(self, repository: CastMemberRepository):
+        self.repository = repository
+
+    def execute(self, request: BulkUpdateCastMemberRequest) -> BulkResponse:
+        existing_ids = self.repository.existing_ids({item.id for item in request.items})
+        duplicate_ids = repeated_ids(item.id for item in request.items)
+
+        cast_members = []
+        errors = []
+        for index, item in enumerate(request.items):
+            if item.id in duplicate_ids:
+                errors.append(BulkItemError(
+                    index=index,
+                    error=f'Cast Member with id {item.id} is repeated in the request',
+                ))
+                continue
+
+            if item.id not in existing_ids:
+                errors.append(BulkItemError(index=index, error=f'Cast Member with id {item.id} not found'))
+                continue
+
+            try:
+                cast_members.append(CastMember.replace(
+                    id=item.id,
+                    name=item.name,
+                    type=item.type,
+                ))
+            except ValueError as err:
+                errors.append(BulkItemError(index=index, error=str(err)))
+
+        self.repository.update_many(cast_members)
+
+        return BulkResponse(ids=[cast_member.id for cast_member in cast_members], errors=errors)
+
+
+class BulkDeleteCastMember:
+    def __init__(self, repository: CastMemberRepository):
+        self.repository = repository
+
+    def execute(self, request: BulkDeleteCastMemberRequest) -> BulkResponse:
+        existing_ids = self.repository.existing_ids(set(request.ids))
+
+        errors = [
+            BulkItemError(index=index, error=f'Cast Member with id {id} not found')
+            for index, id in enumerate(request.ids) if id not in existing_ids
+        ]
+        deleted_ids = [id for id in dict.fromkeys(request.ids) if id in existing_ids]
+
+        self.repository.delete_many(set(deleted_ids))
+
+        return BulkResponse(ids=deleted_ids, errors=errors)
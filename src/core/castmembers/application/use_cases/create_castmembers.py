@@ -22,7 +22,7 @@ class CreateCastMember:
 
     def execute(self, request: CreateCastMemberRequest) -> CreateCastMemberResponse:
         try:
-            cast_member = CastMember(
+            cast_member = CastMember.create(
                 name=request.name,
                 type=request.type,
             )
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from src.core.castmembers.application.exceptions import CastMemberNotFound
+from src.core.castmembers.domain.castmember_repository import CastMemberRepository
 
 
 @dataclass
@@ -11,7 +12,7 @@ class DeleteCastMemberRequest:
 
 class DeleteCastMember:
 
-    def __init__(self, repository):
+    def __init__(self, repository: CastMemberRepository):
         self.repository = repository
 
     def execute(self, request: DeleteCastMemberRequest) -> None:
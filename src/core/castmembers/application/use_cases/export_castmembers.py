@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core.castmembers.application.use_cases.list_castmembers import CastMemberOutput
+from src.core.castmembers.domain.castmember_repository import CastMemberRepository
+
+
+@dataclass
+class ExportCastMemberRequest:
+    chunk_size: int = 1000
+
+
+class ExportCastMember:
+    def __init__(self, repository: CastMemberRepository):
+        self.repository = repository
+
+    def execute(self, request: ExportCastMemberRequest) -> Iterator[CastMemberOutput]:
+        for cast_member in self.repository.stream(chunk_size=request.chunk_size):
+            yield CastMemberOutput(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=cast_member.type,
+            )
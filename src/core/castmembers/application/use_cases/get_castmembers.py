@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.castmembers.application.exceptions import CastMemberNotFound
+from src.core.castmembers.application.use_cases.list_castmembers import CAST_MEMBER_OUTPUT_FIELDS, CastMemberOutput
+from src.core.castmembers.domain.castmember_repository import CastMemberRepository
+
+
+@dataclass
+class GetCastMemberRequest:
+    id: UUID
+
+
+class GetCastMember:
+    def __init__(self, repository: CastMemberRepository):
+        self.repository = repository
+
+    # Reads a row projected straight into CastMemberOutput, without building the entity.
+    def execute(self, request: GetCastMemberRequest) -> CastMemberOutput:
+        row = self.repository.get_row(request.id, CAST_MEMBER_OUTPUT_FIELDS)
+
+        if row is None:
+            raise CastMemberNotFound(f"Cast Member with id {request.id} not found")
+
+        return CastMemberOutput(*row)
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core._shared.bulk import order_by_ids
+from src.core.castmembers.application.use_cases.list_castmembers import CAST_MEMBER_OUTPUT_FIELDS, CastMemberOutput
+from src.core.castmembers.domain.castmember_repository import CastMemberRepository
+
+
+@dataclass
+class GetManyCastMembersRequest:
+    ids: list[UUID]
+
+
+@dataclass
+class GetManyCastMembersResponse:
+    data: list[CastMemberOutput]
+    not_found: list[UUID] = field(default_factory=list)
+
+
+class GetManyCastMembers:
+    def __init__(self, repository: CastMemberRepository):
+        self.repository = repository
+
+    # One batched read for every id, projected straight into CastMemberOutput and
+    # returned in the order they were asked for.
+    def execute(self, request: GetManyCastMembersRequest) -> GetManyCastMembersResponse:
+        rows = self.repository.get_rows(set(request.ids), CAST_MEMBER_OUTPUT_FIELDS)
+        cast_members, not_found = order_by_ids([CastMemberOutput(*row) for row in rows], request.ids)
+
+        return GetManyCastMembersResponse(data=cast_members, not_found=not_found)
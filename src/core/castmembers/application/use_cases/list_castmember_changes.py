@@ -0,0 +1,55 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from src.core._shared.changes import ChangeToken, ChangesMeta, Tombstone, merge_changes
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE
+from src.core.castmembers.domain.castmember import CastMemberType
+from src.core.castmembers.domain.castmember_repository import CastMemberRepository
+
+
+@dataclass
+class ListCastMemberChangesRequest:
+    since: ChangeToken | None = None
+    page_size: int = DEFAULT_PAGE_SIZE
+
+
+@dataclass
+class CastMemberChangeOutput:
+    id: UUID
+    name: str
+    type: CastMemberType
+    created_at: datetime
+    updated_at: datetime
+    version: int
+
+
+@dataclass
+class ListCastMemberChangesResponse:
+    data: list[CastMemberChangeOutput]
+    deleted: list[Tombstone] = field(default_factory=list)
+    meta: ChangesMeta = field(default_factory=ChangesMeta)
+
+
+class ListCastMemberChanges:
+    def __init__(self, repository: CastMemberRepository):
+        self.repository = repository
+
+    def execute(self, request: ListCastMemberChangesRequest) -> ListCastMemberChangesResponse:
+        cast_members, tombstones = self.repository.changes_since(request.since, limit=request.page_size + 1)
+        cast_members, tombstones, meta = merge_changes(cast_members, tombstones, request.since, request.page_size)
+
+        return ListCastMemberChangesResponse(
+            data=[
+                CastMemberChangeOutput(
+                    id=cast_member.id,
+                    name=cast_member.name,
+                    type=cast_member.type,
+                    created_at=cast_member.created_at,
+                    updated_at=cast_member.updated_at,
+                    version=cast_member.version,
+                ) for cast_member in cast_members
+            ],
+            deleted=tombstones,
+            meta=meta,
+        )
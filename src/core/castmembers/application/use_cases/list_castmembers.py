@@ -1,13 +1,19 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from uuid import UUID
 
-from src.core.castmembers.domain.castmember_repository import CastMemberRepository
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE, ListOutputMeta, PageCursor, page_fields, paginate
+from src.core.castmembers.domain.castmember_repository import CastMemberFilter, CastMemberRepository
 from src.core.castmembers.domain.castmember import CastMemberType
 
 
 @dataclass
 class ListCastMemberRequest:
-    pass
+    cursor: PageCursor | None = None
+    page_size: int = DEFAULT_PAGE_SIZE
+    type: CastMemberType | None = None
+    name_prefix: str | None = None
+    search: str | None = None
+    order_by: str = 'id'
 
 
 @dataclass
@@ -17,23 +23,51 @@ class CastMemberOutput:
     type: CastMemberType
 
 
+CAST_MEMBER_OUTPUT_FIELDS = tuple(output_field.name for output_field in fields(CastMemberOutput))
+
+
 @dataclass
 class ListCastMemberResponse:
     data: list[CastMemberOutput]
+    meta: ListOutputMeta = field(default_factory=ListOutputMeta)
 
 class ListCastMember:
     def __init__(self, repository: CastMemberRepository):
         self.repository = repository
 
+    # Reads rows projected straight into CastMemberOutput, without building entities.
     def execute(self, request: ListCastMemberRequest) -> ListCastMemberResponse:
-        cast_members = self.repository.list()
+        fields = page_fields(CAST_MEMBER_OUTPUT_FIELDS, request.order_by)
+        rows = self.repository.list_rows(fields, **self._list_arguments(request))
+        return self._response(rows, fields, request)
+
+    async def aexecute(self, request: ListCastMemberRequest) -> ListCastMemberResponse:
+        fields = page_fields(CAST_MEMBER_OUTPUT_FIELDS, request.order_by)
+        rows = await self.repository.alist_rows(fields, **self._list_arguments(request))
+        return self._response(rows, fields, request)
+
+    @staticmethod
+    def _list_arguments(request: ListCastMemberRequest) -> dict:
+        return {
+            'cursor': request.cursor,
+            'limit': request.page_size + 1,
+            'filters': CastMemberFilter(
+                type=request.type,
+                name_prefix=request.name_prefix,
+                search=request.search,
+            ),
+            'order_by': request.order_by,
+        }
+
+    @staticmethod
+    def _response(rows: list[tuple], fields: tuple[str, ...], request: ListCastMemberRequest) -> ListCastMemberResponse:
+        page, next_cursor = paginate(rows, fields, request.page_size, request.order_by)
+        cast_members = [CastMemberOutput(*row[:len(CAST_MEMBER_OUTPUT_FIELDS)]) for row in page]
 
         return ListCastMemberResponse(
-            data=[
-                CastMemberOutput(
-                    id=cast_member.id,
-                    name=cast_member.name,
-                    type=cast_member.type,
-                ) for cast_member in cast_members
-            ]
+            data=cast_members,
+            meta=ListOutputMeta(
+                next_cursor=next_cursor,
+                page_size=request.page_size,
+            ),
         )
@@ -1,8 +1,8 @@
 from enum import StrEnum
-from uuid import UUID, uuid4
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from src.core._shared.entity import Entity
+from src.core.castmembers.domain.events import CastMemberCreated, CastMemberUpdated
 
 
 class CastMemberType(StrEnum):
@@ -10,7 +10,7 @@ class CastMemberType(StrEnum):
     DIRECTOR = "DIRETOR"
 
 
-@dataclass
+@dataclass(slots=True)
 class CastMember(Entity):
     name: str
     type: CastMemberType
@@ -36,13 +36,21 @@ class CastMember(Entity):
         except ValueError:
             self.notification.add_error('invalid type for CastMember')
         
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self._raise_on_errors()
         
     def update_cast_member(self, name: str = None, type: CastMemberType = None):
+        previous = (self.name, self.type)
         if name:
             self.name = name
         if type:
             self.type = type
 
         self._validate()
+        if (self.name, self.type) != previous:
+            self._record(self._updated_event())
+
+    def _created_event(self) -> CastMemberCreated:
+        return CastMemberCreated(aggregate_id=self.id, name=self.name, type=str(self.type))
+
+    def _updated_event(self) -> CastMemberUpdated:
+        return CastMemberUpdated(aggregate_id=self.id, name=self.name, type=str(self.type))
@@ -1,7 +1,19 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator, Sequence
 from uuid import UUID
 
-from src.core.castmembers.domain.castmember import CastMember
+from src.core._shared.changes import ChangeState, ChangeToken, Tombstone
+from src.core._shared.entity import projector
+from src.core._shared.pagination import PageCursor
+from src.core.castmembers.domain.castmember import CastMember, CastMemberType
+
+
+@dataclass
+class CastMemberFilter:
+    type: CastMemberType | None = None
+    name_prefix: str | None = None
+    search: str | None = None
 
 
 class CastMemberRepository(ABC):
@@ -18,7 +30,98 @@ class CastMemberRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list(self) -> list[CastMember]:
+    def save_many(self, cast_members: list[CastMember]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, cast_members: list[CastMember]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_many(self, ids: set[UUID]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def changes_since(self, since: ChangeToken | None, limit: int) -> tuple[list[CastMember], list[Tombstone]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(self, chunk_size: int = 1000) -> Iterator[CastMember]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def change_state(self) -> ChangeState:
+        raise NotImplementedError
+
+    # Batched reads: the cast members (or their rows, see get_row) with the given ids, in no
+    # particular order, leaving out the ids that do not exist. The defaults read one id
+    # at a time; database-backed repositories read them all with one query.
+    def get_many(self, ids: set[UUID]) -> list[CastMember]:
+        return [cast_member for id in ids if (cast_member := self.get_by_id(id)) is not None]
+
+    def get_rows(self, ids: set[UUID], fields: Sequence[str]) -> list[tuple]:
+        to_row = projector(fields)
+        return [to_row(cast_member) for cast_member in self.get_many(ids)]
+
+    # Async counterparts of the reads. The defaults call the sync methods, which is fine
+    # for repositories that do no I/O; database-backed repositories override them.
+    async def aget_by_id(self, id: UUID) -> CastMember | None:
+        return self.get_by_id(id)
+
+    async def alist(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CastMemberFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[CastMember]:
+        return self.list(cursor=cursor, limit=limit, filters=filters, order_by=order_by)
+
+    # Projections for the read side: one tuple per row with the values of ``fields``,
+    # in that order, without building entities. The defaults project from the entities;
+    # database-backed repositories read the columns directly.
+    def get_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        cast_member = self.get_by_id(id)
+        return projector(fields)(cast_member) if cast_member is not None else None
+
+    def list_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CastMemberFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        to_row = projector(fields)
+        return [
+            to_row(entity) for entity in self.list(cursor=cursor, limit=limit, filters=filters, order_by=order_by)
+        ]
+
+    async def aget_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        return self.get_row(id, fields)
+
+    async def alist_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CastMemberFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        return self.list_rows(fields, cursor=cursor, limit=limit, filters=filters, order_by=order_by)
+
+    @abstractmethod
+    def list(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CastMemberFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[CastMember]:
         raise NotImplementedError
     
     @abstractmethod
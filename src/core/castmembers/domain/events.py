@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from src.core._shared.events import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class CastMemberEvent(DomainEvent):
+    aggregate = 'cast_member'
+
+
+@dataclass(frozen=True, kw_only=True)
+class CastMemberCreated(CastMemberEvent):
+    name: str
+    type: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class CastMemberUpdated(CastMemberEvent):
+    name: str
+    type: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class CastMemberDeleted(CastMemberEvent):
+    pass
@@ -1,32 +1,129 @@
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
 from uuid import UUID
-from src.core.castmembers.domain.castmember_repository import CastMemberRepository
-from src.core.castmembers.domain.castmember import CastMember
+from src.core._shared.changes import ChangeState, ChangeToken, Tombstone, change_state, select_changes, touch
+from src.core._shared.entity import detach
+from src.core._shared.entity_index import EntityIndex
+from src.core._shared.pagination import PageCursor, matches_name, order_and_page
+from src.core.castmembers.domain.castmember_repository import CastMemberFilter, CastMemberRepository
+from src.core.castmembers.domain.castmember import CastMember, CastMemberType
 
 
 class InMemoryCastMemberRepository(CastMemberRepository):
     def __init__(self, cast_members: list[CastMember] = None) -> None:
-        self.cast_members: list[CastMember] = cast_members or []
+        self._cast_members: dict[UUID, CastMember] = {}
+        self._sorted_ids: list[UUID] | None = None
+        self._tombstones: dict[UUID, Tombstone] = {}
+        self._name_index = EntityIndex(lambda cast_member: cast_member.name)
+        self._type_index = EntityIndex(lambda cast_member: cast_member.type)
+
+        for cast_member in cast_members or []:
+            self.save(cast_member)
+
+    @property
+    def cast_members(self) -> list[CastMember]:
+        return list(self._cast_members.values())
 
     def save(self, cast_member: CastMember) -> None:
-        self.cast_members.append(cast_member)
+        previous = self._cast_members.get(cast_member.id)
+        if previous is not None:
+            self._unindex(cast_member.id)
+        else:
+            self._sorted_ids = None
 
+        touch(cast_member, previous)
+        self._tombstones.pop(cast_member.id, None)
+        self._cast_members[cast_member.id] = stored = detach(cast_member)
+        self._index(stored)
 
     def get_by_id(self, id: UUID) -> CastMember | None:
-        for cast_member in self.cast_members:
-            if cast_member.id == id:
-                return cast_member
-        return None
+        cast_member = self._cast_members.get(id)
+        return detach(cast_member) if cast_member is not None else None
+
+    def list_by_name(self, name: str) -> list[CastMember]:
+        return [self._cast_members[id] for id in self._name_index.get(name)]
+
+    def list_by_type(self, type: CastMemberType) -> list[CastMember]:
+        return [self._cast_members[id] for id in self._type_index.get(CastMemberType(type))]
 
     def delete(self, id: UUID) -> None:
-        cast_member = self.get_by_id(id)
-        if cast_member:
-            self.cast_members.remove(cast_member)
+        if self._cast_members.pop(id, None) is not None:
+            self._unindex(id)
+            self._sorted_ids = None
+            self._tombstones[id] = Tombstone(id=id, deleted_at=datetime.now(timezone.utc))
 
     def update(self, cast_member: CastMember) -> None:
-        old_cast_member = self.get_by_id(cast_member.id)
-        if old_cast_member:
-            self.cast_members.remove(old_cast_member)
-            self.cast_members.append(cast_member)
+        previous = self._cast_members.get(cast_member.id)
+        if previous is not None:
+            # Updated cast members move to the end, as they always have in this repository.
+            del self._cast_members[cast_member.id]
+            self._unindex(cast_member.id)
+            touch(cast_member, previous)
+            self._cast_members[cast_member.id] = stored = detach(cast_member)
+            self._index(stored)
+
+    def save_many(self, cast_members: list[CastMember]) -> None:
+        for cast_member in cast_members:
+            self.save(cast_member)
+
+    def update_many(self, cast_members: list[CastMember]) -> None:
+        for cast_member in cast_members:
+            self.update(cast_member)
+
+    def delete_many(self, ids: set[UUID]) -> None:
+        for id in ids:
+            self.delete(id)
+
+    def existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return {id for id in ids if id in self._cast_members}
+
+    def changes_since(self, since: ChangeToken | None, limit: int) -> tuple[list[CastMember], list[Tombstone]]:
+        return select_changes(self._cast_members.values(), self._tombstones.values(), since, limit)
+
+    def change_state(self) -> ChangeState:
+        return change_state(self._cast_members.values(), self._tombstones.values())
+
+    def stream(self, chunk_size: int = 1000) -> Iterator[CastMember]:
+        yield from self.list()
+
+    def list(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CastMemberFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[CastMember]:
+        if (filters is not None and filters != CastMemberFilter()) or order_by not in (None, 'id'):
+            return order_and_page(self._filter(filters or CastMemberFilter()), cursor, limit, order_by or 'id')
+
+        if cursor is None and limit is None and order_by is None:
+            return [cast_member for cast_member in self._cast_members.values()]
+
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(self._cast_members)
+
+        start = bisect_right(self._sorted_ids, cursor.id) if cursor is not None else 0
+        end = start + limit if limit is not None else None
+
+        return [self._cast_members[id] for id in self._sorted_ids[start:end]]
+
+    def _filter(self, filters: CastMemberFilter) -> Iterable[CastMember]:
+        # Start from the narrowest secondary index available, then check the rest.
+        if filters.type is not None:
+            cast_members = [self._cast_members[id] for id in self._type_index.get(CastMemberType(filters.type))]
+        else:
+            cast_members = self._cast_members.values()
+
+        return [
+            cast_member for cast_member in cast_members
+            if matches_name(cast_member.name, name_prefix=filters.name_prefix, search=filters.search)
+        ]
+
+    def _index(self, cast_member: CastMember) -> None:
+        self._name_index.add(cast_member)
+        self._type_index.add(cast_member)
 
-    def list(self) -> list[CastMember]:
-        return [cast_member for cast_member in self.cast_members]
+    def _unindex(self, id: UUID) -> None:
+        self._name_index.remove(id)
+        self._type_index.remove(id)
@@ -0,0 +1,33 @@
+import uuid
+import pytest
+
+from src.core.castmembers.infra.in_memory_castmember_repository import InMemoryCastMemberRepository
+from src.core.castmembers.application.exceptions import CastMemberNotFound
+from src.core.castmembers.application.use_cases.get_castmembers import GetCastMember, GetCastMemberRequest
+from src.core.castmembers.application.use_cases.list_castmembers import CastMemberOutput
+from src.core.castmembers.domain.castmember import CastMember, CastMemberType
+
+
+class TestGetCastMember:
+    def test_get_cast_member_by_id(self):
+        cast_member = CastMember(
+            name="Adriana Esteves",
+            type=CastMemberType.ACTOR,
+        )
+        repository = InMemoryCastMemberRepository()
+        repository.save(cast_member=cast_member)
+
+        use_case = GetCastMember(repository)
+        response = use_case.execute(GetCastMemberRequest(id=cast_member.id))
+
+        assert response == CastMemberOutput(
+            id=cast_member.id,
+            name="Adriana Esteves",
+            type=CastMemberType.ACTOR,
+        )
+
+    def test_when_cast_member_does_not_exist_then_raise_exception(self):
+        use_case = GetCastMember(InMemoryCastMemberRepository())
+
+        with pytest.raises(CastMemberNotFound):
+            use_case.execute(GetCastMemberRequest(id=uuid.uuid4()))
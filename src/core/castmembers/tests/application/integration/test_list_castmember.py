@@ -37,7 +37,7 @@ class TestListCastMembers:
 
         response = use_case.execute(request)
 
-        assert response == ListCastMemberResponse(data=[
+        assert response == ListCastMemberResponse(data=sorted([
             CastMemberOutput(
                 id=cast_member_one.id,
                 name=cast_member_one.name,
@@ -48,4 +48,4 @@ class TestListCastMembers:
                 name=cast_member_two.name,
                 type=cast_member_two.type,
             ),
-        ])
+        ], key=lambda output: output.id))
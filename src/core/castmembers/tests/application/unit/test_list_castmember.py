@@ -1,14 +1,15 @@
 from unittest.mock import create_autospec
 
 from src.core.castmembers.domain.castmember import CastMember, CastMemberType
-from src.core.castmembers.application.use_cases.list_castmembers import CastMemberOutput, ListCastMember, ListCastMemberRequest, ListCastMemberResponse
+from src.core._shared.entity import project
+from src.core.castmembers.application.use_cases.list_castmembers import CAST_MEMBER_OUTPUT_FIELDS, CastMemberOutput, ListCastMember, ListCastMemberRequest, ListCastMemberResponse
 from src.core.castmembers.domain.castmember_repository import CastMemberRepository
 
 
 class TestListCastMembers:
     def test_when_no_cast_members_in_repository_then_return_empty_list(self):
         mock_repository = create_autospec(CastMemberRepository)
-        mock_repository.list.return_value = []
+        mock_repository.list_rows.return_value = []
 
         use_case = ListCastMember(mock_repository)
         request = ListCastMemberRequest()
@@ -29,9 +30,9 @@ class TestListCastMembers:
         )
 
         mock_repository = create_autospec(CastMemberRepository)
-        mock_repository.list.return_value = [
-            cast_member_one,
-            cast_member_two,
+        mock_repository.list_rows.return_value = [
+            project(cast_member_one, CAST_MEMBER_OUTPUT_FIELDS),
+            project(cast_member_two, CAST_MEMBER_OUTPUT_FIELDS),
         ]
 
         use_case = ListCastMember(repository=mock_repository)
@@ -1,5 +1,6 @@
 import pytest
 from src.core.castmembers.domain.castmember import CastMember, CastMemberType
+from src.core.castmembers.domain.events import CastMemberCreated, CastMemberUpdated
 
 
 class TestCastMember:
@@ -53,4 +54,24 @@ class TestUpdateCastMember:
         cast_member = CastMember(name="Adriana Esteves", type=CastMemberType.ACTOR)
 
         with pytest.raises(ValueError, match="invalid type for CastMember"):
-            cast_member.update_cast_member(type="FIGURANTE")
\ No newline at end of file
+            cast_member.update_cast_member(type="FIGURANTE")
+
+
+class TestEvents:
+    def test_create_records_cast_member_created(self):
+        cast_member = CastMember.create(name="Adriana Esteves", type=CastMemberType.ACTOR)
+
+        [event] = cast_member.pull_events()
+        assert isinstance(event, CastMemberCreated)
+        assert event.payload() == {"name": "Adriana Esteves", "type": "ATOR"}
+
+    def test_update_records_cast_member_updated_only_on_change(self):
+        cast_member = CastMember(name="Adriana Esteves", type=CastMemberType.ACTOR)
+
+        cast_member.update_cast_member(name="Adriana Esteves")
+        assert cast_member.pull_events() == []
+
+        cast_member.update_cast_member(type=CastMemberType.DIRECTOR)
+        [event] = cast_member.pull_events()
+        assert isinstance(event, CastMemberUpdated)
+        assert event.type == "DIRETOR"
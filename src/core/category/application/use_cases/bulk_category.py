@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.bulk import BulkItemError, BulkResponse, repeated_ids
+from src.core.category.application.use_cases.create_category import CreateCategoryRequest
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class BulkCreateCategoryRequest:
+    items: list[CreateCategoryRequest]
+
+
+@dataclass
+class BulkUpdateCategoryItem:
+    id: UUID
+    name: str
+    description: str = ''
+    is_active: bool = True
+
+
+@dataclass
+class BulkUpdateCategoryRequest:
+    items: list[BulkUpdateCategoryItem]
+
+
+@dataclass
+class BulkDeleteCategoryRequest:
+    ids: list[UUID]
+
+
+class BulkCreateCategory:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: BulkCreateCategoryRequest) -> BulkResponse:
+        categories = []
+        errors = []
+        for index, item in enumerate(request.items):
+            try:
+                categories.append(Category.create(
+                    name=item.name,
+                    description=item.description,
+                    is_active=item.is_active,
+                ))
+            except ValueError as err:
+                errors.append(BulkItemError(index=index, error=str(err)))
+
+        self.repository.save_many(categories)
+
+        return BulkResponse(ids=[category.id for category in categories], errors=errors)
+
+
+class BulkUpdateCategory:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: BulkUpdateCategoryRequest) -> BulkResponse:
+        existing_ids = self.repository.existing_ids({item.id for item in request.items})
+        duplicate_ids = repeated_ids(item.id for item in request.items)
+
+        categories = []
+        errors = []
+        for index, item in enumerate(request.items):
+            if item.id in duplicate_ids:
+                errors.append(BulkItemError(
+                    index=index,
+                    error=f'Category with id {item.id} is repeated in the request',
+                ))
+                continue
+
+            if item.id not in existing_ids:
+                errors.append(BulkItemError(index=index, error=f'Category with id {item.id} not found'))
+                continue
+
+            try:
+                categories.append(Category.replace(
+                    id=item.id,
+                    name=item.name,
+                    description=item.description,
+                    is_active=item.is_active,
+                ))
+            except ValueError as err:
+                errors.append(BulkItemError(index=index, error=str(err)))
+
+        self.repository.update_many(categories)
+
+        return BulkResponse(ids=[category.id for category in categories], errors=errors)
+
+
+class BulkDeleteCategory:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: BulkDeleteCategoryRequest) -> BulkResponse:
+        existing_ids = self.repository.existing_ids(set(request.ids))
+
+        errors = [
+            BulkItemError(index=index, error=f'Category with id {id} not found')
+            for index, id in enumerate(request.ids) if id not in existing_ids
+        ]
+        deleted_ids = [id for id in dict.fromkeys(request.ids) if id in existing_ids]
+
+        self.repository.delete_many(set(deleted_ids))
+
+        return BulkResponse(ids=deleted_ids, errors=errors)
@@ -23,7 +23,7 @@ class CreateCategory:
 
     def execute(self, request: CreateCategoryRequest) -> CreateCategoryResponse:
         try:
-            category = Category(
+            category = Category.create(
                 name=request.name,
                 description=request.description,
                 is_active=request.is_active
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core.category.application.use_cases.list_category import CategoryOutput
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class ExportCategoryRequest:
+    chunk_size: int = 1000
+
+
+class ExportCategory:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: ExportCategoryRequest) -> Iterator[CategoryOutput]:
+        for category in self.repository.stream(chunk_size=request.chunk_size):
+            yield CategoryOutput(
+                id=category.id,
+                name=category.name,
+                description=category.description,
+                is_active=category.is_active,
+            )
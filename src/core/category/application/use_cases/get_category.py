@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from uuid import UUID
 
 from src.core.category.domain.category_repository import CategoryRepository
@@ -17,20 +17,26 @@ class GetCategoryResponse:
     is_active: bool
 
 
+GET_CATEGORY_FIELDS = tuple(response_field.name for response_field in fields(GetCategoryResponse))
+
+
 class GetCategory:
     def __init__(self, repository: CategoryRepository):
         self.repository = repository
 
+    # Reads a row projected straight into GetCategoryResponse, without building the entity.
     def execute(self, request: GetCategoryRequest) -> GetCategoryResponse:
-        category = self.repository.get_by_id(id=request.id)
+        row = self.repository.get_row(request.id, GET_CATEGORY_FIELDS)
+        return self._response(row, request)
+
+    async def aexecute(self, request: GetCategoryRequest) -> GetCategoryResponse:
+        row = await self.repository.aget_row(request.id, GET_CATEGORY_FIELDS)
+        return self._response(row, request)
 
-        if category is None:
+    @staticmethod
+    def _response(row: tuple | None, request: GetCategoryRequest) -> GetCategoryResponse:
+        if row is None:
             raise CategoryNotFound(f'Category with id {request.id} not found')
 
-        return GetCategoryResponse(
-            id=category.id,
-            name=category.name,
-            description=category.description,
-            is_active=category.is_active,
-        )
+        return GetCategoryResponse(*row)
         
\ No newline at end of file
@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core._shared.bulk import order_by_ids
+from src.core.category.application.use_cases.list_category import CATEGORY_OUTPUT_FIELDS, CategoryOutput
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class GetManyCategoriesRequest:
+    ids: list[UUID]
+
+@dataclass
+class GetManyCategoriesResponse:
+    data: list[CategoryOutput]
+    not_found: list[UUID] = field(default_factory=list)
+
+
+class GetManyCategories:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    # One batched read for every id, projected straight into CategoryOutput and returned
+    # in the order they were asked for.
+    def execute(self, request: GetManyCategoriesRequest) -> GetManyCategoriesResponse:
+        rows = self.repository.get_rows(set(request.ids), CATEGORY_OUTPUT_FIELDS)
+        categories, not_found = order_by_ids([CategoryOutput(*row) for row in rows], request.ids)
+
+        return GetManyCategoriesResponse(data=categories, not_found=not_found)
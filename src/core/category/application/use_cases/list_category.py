@@ -1,13 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from uuid import UUID
 
-from src.core.category.domain.category_repository import CategoryRepository
-from src.core.category.application.exceptions import CategoryNotFound
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE, ListOutputMeta, PageCursor, page_fields, paginate
+from src.core.category.domain.category_repository import CategoryFilter, CategoryRepository
 
 
 @dataclass
 class ListCategoryRequest:
-    pass
+    cursor: PageCursor | None = None
+    page_size: int = DEFAULT_PAGE_SIZE
+    is_active: bool | None = None
+    name_prefix: str | None = None
+    search: str | None = None
+    order_by: str = 'id'
 
 @dataclass
 class CategoryOutput:
@@ -16,27 +21,52 @@ class CategoryOutput:
     description: str
     is_active: bool
 
+CATEGORY_OUTPUT_FIELDS = tuple(output_field.name for output_field in fields(CategoryOutput))
+
 @dataclass
 class ListCategoryResponse:
     data: list[CategoryOutput]
+    meta: ListOutputMeta = field(default_factory=ListOutputMeta)
 
 
 class ListCategory:
     def __init__(self, repository: CategoryRepository):
         self.repository = repository
 
+    # Reads rows projected straight into CategoryOutput, without building entities.
     def execute(self, request: ListCategoryRequest) -> ListCategoryResponse:
-        categories = self.repository.list()
+        fields = page_fields(CATEGORY_OUTPUT_FIELDS, request.order_by)
+        rows = self.repository.list_rows(fields, **self._list_arguments(request))
+        return self._response(rows, fields, request)
+
+    async def aexecute(self, request: ListCategoryRequest) -> ListCategoryResponse:
+        fields = page_fields(CATEGORY_OUTPUT_FIELDS, request.order_by)
+        rows = await self.repository.alist_rows(fields, **self._list_arguments(request))
+        return self._response(rows, fields, request)
+
+    @staticmethod
+    def _list_arguments(request: ListCategoryRequest) -> dict:
+        return {
+            'cursor': request.cursor,
+            'limit': request.page_size + 1,
+            'filters': CategoryFilter(
+                is_active=request.is_active,
+                name_prefix=request.name_prefix,
+                search=request.search,
+            ),
+            'order_by': request.order_by,
+        }
+
+    @staticmethod
+    def _response(rows: list[tuple], fields: tuple[str, ...], request: ListCategoryRequest) -> ListCategoryResponse:
+        page, next_cursor = paginate(rows, fields, request.page_size, request.order_by)
+        categories = [CategoryOutput(*row[:len(CATEGORY_OUTPUT_FIELDS)]) for row in page]
 
         return ListCategoryResponse(
-            data=[
-                CategoryOutput(
-                    id=category.id,
-                    name=category.name,
-                    description=category.description,
-                    is_active=category.is_active,
-                ) for category in categories
-            ]
-            
+            data=categories,
+            meta=ListOutputMeta(
+                next_cursor=next_cursor,
+                page_size=request.page_size,
+            ),
         )
         
\ No newline at end of file
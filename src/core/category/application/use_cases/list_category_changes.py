@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from src.core._shared.changes import ChangeToken, ChangesMeta, Tombstone, merge_changes
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class ListCategoryChangesRequest:
+    since: ChangeToken | None = None
+    page_size: int = DEFAULT_PAGE_SIZE
+
+
+@dataclass
+class CategoryChangeOutput:
+    id: UUID
+    name: str
+    description: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    version: int
+
+
+@dataclass
+class ListCategoryChangesResponse:
+    data: list[CategoryChangeOutput]
+    deleted: list[Tombstone] = field(default_factory=list)
+    meta: ChangesMeta = field(default_factory=ChangesMeta)
+
+
+class ListCategoryChanges:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: ListCategoryChangesRequest) -> ListCategoryChangesResponse:
+        categories, tombstones = self.repository.changes_since(request.since, limit=request.page_size + 1)
+        categories, tombstones, meta = merge_changes(categories, tombstones, request.since, request.page_size)
+
+        return ListCategoryChangesResponse(
+            data=[
+                CategoryChangeOutput(
+                    id=category.id,
+                    name=category.name,
+                    description=category.description,
+                    is_active=category.is_active,
+                    created_at=category.created_at,
+                    updated_at=category.updated_at,
+                    version=category.version,
+                ) for category in categories
+            ],
+            deleted=tombstones,
+            meta=meta,
+        )
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 
 from src.core._shared.entity import Entity
+from src.core.category.domain.events import CategoryCreated, CategoryUpdated
 
 
-@dataclass
+@dataclass(slots=True)
 class Category(Entity):
     name: str
     description: str = ''
@@ -28,19 +29,36 @@ class Category(Entity):
         if len(self.description) > 1024:
             self.notification.add_error('description cannot be longer than 1024')
 
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self._raise_on_errors()
 
     def update_category(self, name, description):
+        changed = (name, description) != (self.name, self.description)
         self.name = name
         self.description = description
 
         self._validate()
+        if changed:
+            self._record(self._updated_event())
     
     def activate(self):
-        self.is_active = True
-        self._validate()
+        self._set_active(True)
     
     def deactivate(self):
-        self.is_active = False
+        self._set_active(False)
+
+    def _set_active(self, is_active: bool):
+        changed = is_active != self.is_active
+        self.is_active = is_active
         self._validate()
+        if changed:
+            self._record(self._updated_event())
+
+    def _created_event(self) -> CategoryCreated:
+        return CategoryCreated(
+            aggregate_id=self.id, name=self.name, description=self.description, is_active=self.is_active,
+        )
+
+    def _updated_event(self) -> CategoryUpdated:
+        return CategoryUpdated(
+            aggregate_id=self.id, name=self.name, description=self.description, is_active=self.is_active,
+        )
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from src.core._shared.events import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class CategoryEvent(DomainEvent):
+    aggregate = 'category'
+
+
+@dataclass(frozen=True, kw_only=True)
+class CategoryCreated(CategoryEvent):
+    name: str
+    description: str
+    is_active: bool
+
+
+@dataclass(frozen=True, kw_only=True)
+class CategoryUpdated(CategoryEvent):
+    name: str
+    description: str
+    is_active: bool
+
+
+@dataclass(frozen=True, kw_only=True)
+class CategoryDeleted(CategoryEvent):
+    pass
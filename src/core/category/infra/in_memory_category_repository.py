@@ -1,31 +1,129 @@
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
 from uuid import UUID
-from src.core.category.domain.category_repository import CategoryRepository
+from src.core._shared.changes import ChangeState, ChangeToken, Tombstone, change_state, select_changes, touch
+from src.core._shared.entity import detach
+from src.core._shared.entity_index import EntityIndex
+from src.core._shared.pagination import PageCursor, matches_name, order_and_page
+from src.core.category.domain.category_repository import CategoryFilter, CategoryRepository
 from src.core.category.domain.category import Category
 
 
 class InMemoryCategoryRepository(CategoryRepository):
     def __init__(self, categories: list[Category] = None) -> None:
-        self.categories:list[Category] = categories or []
+        self._categories: dict[UUID, Category] = {}
+        self._sorted_ids: list[UUID] | None = None
+        self._tombstones: dict[UUID, Tombstone] = {}
+        self._name_index = EntityIndex(lambda category: category.name)
+        self._is_active_index = EntityIndex(lambda category: category.is_active)
+
+        for category in categories or []:
+            self.save(category)
+
+    @property
+    def categories(self) -> list[Category]:
+        return list(self._categories.values())
 
     def save(self, category: Category) -> None:
-        self.categories.append(category)
+        previous = self._categories.get(category.id)
+        if previous is not None:
+            self._unindex(category.id)
+        else:
+            self._sorted_ids = None
+
+        touch(category, previous)
+        self._tombstones.pop(category.id, None)
+        self._categories[category.id] = stored = detach(category)
+        self._index(stored)
 
     def get_by_id(self, id: UUID) -> Category | None:
-        for category in self.categories:
-            if category.id == id:
-                return category
-        return None
+        category = self._categories.get(id)
+        return detach(category) if category is not None else None
+
+    def existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return {id for id in ids if id in self._categories}
+
+    def list_by_name(self, name: str) -> list[Category]:
+        return [self._categories[id] for id in self._name_index.get(name)]
+
+    def list_by_is_active(self, is_active: bool) -> list[Category]:
+        return [self._categories[id] for id in self._is_active_index.get(is_active)]
 
     def delete(self, id: UUID) -> None:
-        category = self.get_by_id(id)
-        if category:
-            self.categories.remove(category)
+        if self._categories.pop(id, None) is not None:
+            self._unindex(id)
+            self._sorted_ids = None
+            self._tombstones[id] = Tombstone(id=id, deleted_at=datetime.now(timezone.utc))
 
     def update(self, category: Category) -> None:
-        old_category = self.get_by_id(category.id)
-        if old_category:
-            self.categories.remove(old_category)
-            self.categories.append(category)
+        previous = self._categories.get(category.id)
+        if previous is not None:
+            # Updated categories move to the end, as they always have in this repository.
+            del self._categories[category.id]
+            self._unindex(category.id)
+            touch(category, previous)
+            self._categories[category.id] = stored = detach(category)
+            self._index(stored)
+
+    def save_many(self, categories: list[Category]) -> None:
+        for category in categories:
+            self.save(category)
+
+    def update_many(self, categories: list[Category]) -> None:
+        for category in categories:
+            self.update(category)
+
+    def delete_many(self, ids: set[UUID]) -> None:
+        for id in ids:
+            self.delete(id)
+
+    def changes_since(self, since: ChangeToken | None, limit: int) -> tuple[list[Category], list[Tombstone]]:
+        return select_changes(self._categories.values(), self._tombstones.values(), since, limit)
+
+    def change_state(self) -> ChangeState:
+        return change_state(self._categories.values(), self._tombstones.values())
+
+    def stream(self, chunk_size: int = 1000) -> Iterator[Category]:
+        yield from self.list()
+
+    def list(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CategoryFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[Category]:
+        if (filters is not None and filters != CategoryFilter()) or order_by not in (None, 'id'):
+            return order_and_page(self._filter(filters or CategoryFilter()), cursor, limit, order_by or 'id')
+
+        if cursor is None and limit is None and order_by is None:
+            return [category for category in self._categories.values()]
+
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(self._categories)
+
+        start = bisect_right(self._sorted_ids, cursor.id) if cursor is not None else 0
+        end = start + limit if limit is not None else None
+
+        return [self._categories[id] for id in self._sorted_ids[start:end]]
+
+    def _filter(self, filters: CategoryFilter) -> Iterable[Category]:
+        # Start from the narrowest secondary index available, then check the rest.
+        if filters.is_active is not None:
+            categories = [self._categories[id] for id in self._is_active_index.get(filters.is_active)]
+        else:
+            categories = self._categories.values()
+
+        return [
+            category for category in categories
+            if matches_name(category.name, name_prefix=filters.name_prefix, search=filters.search)
+        ]
+
+    def _index(self, category: Category) -> None:
+        self._name_index.add(category)
+        self._is_active_index.add(category)
 
-    def list(self) -> list[Category]:
-        return [category for category in self.categories]
+    def _unindex(self, id: UUID) -> None:
+        self._name_index.remove(id)
+        self._is_active_index.remove(id)
@@ -0,0 +1,85 @@
+import uuid
+
+from src.core._shared.bulk import BulkItemError
+from src.core.category.application.use_cases.bulk_category import (
+    BulkCreateCategory,
+    BulkCreateCategoryRequest,
+    BulkDeleteCategory,
+    BulkDeleteCategoryRequest,
+    BulkUpdateCategory,
+    BulkUpdateCategoryItem,
+    BulkUpdateCategoryRequest,
+)
+from src.core.category.application.use_cases.create_category import CreateCategoryRequest
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
+
+
+class TestBulkCreateCategory:
+    def test_save_valid_categories_and_report_invalid_ones(self):
+        repository = InMemoryCategoryRepository()
+        use_case = BulkCreateCategory(repository=repository)
+
+        response = use_case.execute(BulkCreateCategoryRequest(items=[
+            CreateCategoryRequest(name='Filme'),
+            CreateCategoryRequest(name=''),
+            CreateCategoryRequest(name='Serie', is_active=False),
+        ]))
+
+        assert [category.id for category in repository.list()] == response.ids
+        assert [category.name for category in repository.list()] == ['Filme', 'Serie']
+        assert response.errors == [BulkItemError(index=1, error='name cannot be empty')]
+
+
+class TestBulkUpdateCategory:
+    def test_update_existing_categories_and_report_missing_ones(self):
+        category_filme = Category(name='Filme')
+        repository = InMemoryCategoryRepository(categories=[category_filme])
+        use_case = BulkUpdateCategory(repository=repository)
+        missing_id = uuid.uuid4()
+
+        response = use_case.execute(BulkUpdateCategoryRequest(items=[
+            BulkUpdateCategoryItem(id=missing_id, name='Serie'),
+            BulkUpdateCategoryItem(id=category_filme.id, name='Filmes', description='Longas', is_active=False),
+        ]))
+
+        assert response.ids == [category_filme.id]
+        assert response.errors == [BulkItemError(index=0, error=f'Category with id {missing_id} not found')]
+        updated_category = repository.get_by_id(category_filme.id)
+        assert updated_category.name == 'Filmes'
+        assert updated_category.description == 'Longas'
+        assert updated_category.is_active is False
+
+    def test_reject_every_item_of_a_repeated_id(self):
+        category_filme = Category(name='Filme')
+        category_serie = Category(name='Serie')
+        repository = InMemoryCategoryRepository(categories=[category_filme, category_serie])
+        use_case = BulkUpdateCategory(repository=repository)
+
+        response = use_case.execute(BulkUpdateCategoryRequest(items=[
+            BulkUpdateCategoryItem(id=category_filme.id, name='Filmes'),
+            BulkUpdateCategoryItem(id=category_serie.id, name='Series'),
+            BulkUpdateCategoryItem(id=category_filme.id, name='Longas'),
+        ]))
+
+        assert response.ids == [category_serie.id]
+        assert response.errors == [
+            BulkItemError(index=0, error=f'Category with id {category_filme.id} is repeated in the request'),
+            BulkItemError(index=2, error=f'Category with id {category_filme.id} is repeated in the request'),
+        ]
+        assert repository.get_by_id(category_filme.id).name == 'Filme'
+
+
+class TestBulkDeleteCategory:
+    def test_delete_existing_categories_and_report_missing_ones(self):
+        category_filme = Category(name='Filme')
+        category_serie = Category(name='Serie')
+        repository = InMemoryCategoryRepository(categories=[category_filme, category_serie])
+        use_case = BulkDeleteCategory(repository=repository)
+        missing_id = uuid.uuid4()
+
+        response = use_case.execute(BulkDeleteCategoryRequest(ids=[category_filme.id, missing_id]))
+
+        assert response.ids == [category_filme.id]
+        assert response.errors == [BulkItemError(index=1, error=f'Category with id {missing_id} not found')]
+        assert repository.list() == [category_serie]
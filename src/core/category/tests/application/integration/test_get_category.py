@@ -1,3 +1,4 @@
+import asyncio
 from uuid import UUID
 import uuid
 
@@ -59,4 +60,24 @@ class TestCreateCategory:
         )
 
         with pytest.raises(CategoryNotFound) as exc:
-            use_case.execute(request)
\ No newline at end of file
+            use_case.execute(request)
+
+    def test_aexecute_returns_same_category(self):
+        category_filme = Category(
+            name='Filme',
+            description='Categoria para filmes',
+            is_active=True
+        )
+        repository = InMemoryCategoryRepository(categories=[category_filme])
+        use_case = GetCategory(repository=repository)
+        request = GetCategoryRequest(id=category_filme.id)
+
+        response = asyncio.run(use_case.aexecute(request))
+
+        assert response == use_case.execute(request)
+
+    def test_aexecute_raises_when_category_does_not_exist(self):
+        use_case = GetCategory(repository=InMemoryCategoryRepository())
+
+        with pytest.raises(CategoryNotFound):
+            asyncio.run(use_case.aexecute(GetCategoryRequest(id=uuid.uuid4())))
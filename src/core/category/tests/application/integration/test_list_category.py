@@ -1,4 +1,5 @@
 from unittest.mock import create_autospec
+from src.core._shared.pagination import ListOutputMeta, PageCursor
 from src.core.category.domain.category_repository import CategoryRepository
 from src.core.category.application.use_cases.list_category import CategoryOutput, ListCategory, ListCategoryRequest, ListCategoryResponse
 from src.core.category.domain.category import Category
@@ -34,7 +35,7 @@ class TestListCategories:
         request = ListCategoryRequest()
         response = use_case.execute(request)
 
-        assert response == ListCategoryResponse(data=[
+        assert response == ListCategoryResponse(data=sorted([
             CategoryOutput(
                 id=category_filme.id,
                 name=category_filme.name,
@@ -47,4 +48,25 @@ class TestListCategories:
                 description=category_series.description,
                 is_active=category_series.is_active
             )
-        ])
+        ], key=lambda output: output.id))
+
+    def test_return_page_and_next_cursor_when_there_are_more_categories(self):
+        category_filme = Category(name='Filme')
+        category_series = Category(name='Serie')
+        category_documentario = Category(name='Documentario')
+        repository = InMemoryCategoryRepository()
+        repository.save(category_filme)
+        repository.save(category_series)
+        repository.save(category_documentario)
+        first, second, third = sorted(repository.list(), key=lambda category: category.id)
+
+        use_case = ListCategory(repository=repository)
+        first_page = use_case.execute(ListCategoryRequest(page_size=2))
+
+        assert [output.id for output in first_page.data] == [first.id, second.id]
+        assert first_page.meta == ListOutputMeta(next_cursor=PageCursor(id=second.id).encode(), page_size=2)
+
+        second_page = use_case.execute(ListCategoryRequest(cursor=PageCursor.decode(first_page.meta.next_cursor), page_size=2))
+
+        assert [output.id for output in second_page.data] == [third.id]
+        assert second_page.meta == ListOutputMeta(next_cursor=None, page_size=2)
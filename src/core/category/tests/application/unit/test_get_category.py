@@ -7,7 +7,8 @@ import pytest
 from src.core.category.domain.category_repository import CategoryRepository
 from src.core.category.application.use_cases.create_category import CreateCategory, CreateCategoryRequest, CreateCategoryResponse
 from src.core.category.application.exceptions import InvalidCategoryData
-from src.core.category.application.use_cases.get_category import GetCategory, GetCategoryRequest, GetCategoryResponse
+from src.core._shared.entity import project
+from src.core.category.application.use_cases.get_category import GET_CATEGORY_FIELDS, GetCategory, GetCategoryRequest, GetCategoryResponse
 from src.core.category.domain.category import Category
 
 
@@ -20,7 +21,7 @@ class TestGetCategory:
             is_active=True
         )
         mock_repository = create_autospec(CategoryRepository)
-        mock_repository.get_by_id.return_value = category
+        mock_repository.get_row.return_value = project(category, GET_CATEGORY_FIELDS)
         use_case = GetCategory(repository=mock_repository)
         request = GetCategoryRequest(
             id=category.id
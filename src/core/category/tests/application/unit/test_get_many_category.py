@@ -0,0 +1,28 @@
+import uuid
+
+from src.core.category.application.use_cases.get_many_category import (
+    GetManyCategories,
+    GetManyCategoriesRequest,
+    GetManyCategoriesResponse,
+)
+from src.core.category.application.use_cases.list_category import CategoryOutput
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
+
+
+class TestGetManyCategories:
+    def test_return_categories_in_requested_order_and_report_missing_ids(self):
+        movie = Category(name='Filme', description='Categoria para filmes')
+        series = Category(name='Série', is_active=False)
+        missing_id = uuid.uuid4()
+        use_case = GetManyCategories(repository=InMemoryCategoryRepository([movie, series]))
+
+        response = use_case.execute(GetManyCategoriesRequest(ids=[series.id, missing_id, movie.id, series.id]))
+
+        assert response == GetManyCategoriesResponse(
+            data=[
+                CategoryOutput(id=series.id, name='Série', description='', is_active=False),
+                CategoryOutput(id=movie.id, name='Filme', description='Categoria para filmes', is_active=True),
+            ],
+            not_found=[missing_id],
+        )
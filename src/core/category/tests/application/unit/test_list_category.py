@@ -1,13 +1,14 @@
 from unittest.mock import create_autospec
 from src.core.category.domain.category_repository import CategoryRepository
-from src.core.category.application.use_cases.list_category import CategoryOutput, ListCategory, ListCategoryRequest, ListCategoryResponse
+from src.core._shared.entity import project
+from src.core.category.application.use_cases.list_category import CATEGORY_OUTPUT_FIELDS, CategoryOutput, ListCategory, ListCategoryRequest, ListCategoryResponse
 from src.core.category.domain.category import Category
 
 
 class TestListCategories:
     def test_when_no_categories_in_repository_then_return_empty_list(self):
         mock_repository = create_autospec(CategoryRepository)
-        mock_repository.list.return_value = []
+        mock_repository.list_rows.return_value = []
 
         use_case = ListCategory(repository=mock_repository)
         request = ListCategoryRequest()
@@ -27,9 +28,9 @@ class TestListCategories:
             is_active=True
         )
         mock_repository = create_autospec(CategoryRepository)
-        mock_repository.list.return_value = [
-            category_filme,
-            category_series
+        mock_repository.list_rows.return_value = [
+            project(category_filme, CATEGORY_OUTPUT_FIELDS),
+            project(category_series, CATEGORY_OUTPUT_FIELDS),
         ]
         use_case = ListCategory(repository=mock_repository)
         request = ListCategoryRequest()
@@ -2,6 +2,7 @@ import pytest
 
 from uuid import UUID, uuid4
 from src.core.category.domain.category import Category
+from src.core.category.domain.events import CategoryCreated, CategoryUpdated
 
 
 class TestCategory:
@@ -140,3 +141,80 @@ class TestEquality:
         dummy.id = commom_id
 
         assert category_1 != dummy
+
+
+class TestRehydrate:
+    def test_rehydrate_skips_validation(self):
+        category = Category.rehydrate(id=uuid4(), name='', description='a' * 2000, version=3)
+
+        assert category.name == ''
+        assert category.version == 3
+        assert category.is_active is True
+
+    def test_rehydrated_category_equals_constructed_one(self):
+        category = Category(name='Filme', description='Filmes em geral')
+
+        assert Category.rehydrate(
+            id=category.id,
+            name='Filme',
+            description='Filmes em geral',
+        ) == category
+
+    def test_rehydrate_requires_fields_without_default(self):
+        with pytest.raises(TypeError, match='name'):
+            Category.rehydrate(id=uuid4())
+
+
+class TestNotification:
+    def test_valid_category_does_not_allocate_notification(self):
+        category = Category(name='Filme')
+
+        assert category._notification is None
+        assert not hasattr(category, '__dict__')
+
+    def test_errors_are_collected_on_first_failure(self):
+        category = Category(name='Filme')
+
+        with pytest.raises(ValueError, match='name cannot be empty'):
+            category.update_category(name='', description='')
+
+        assert category.notification.has_errors
+
+
+class TestEvents:
+    def test_create_records_category_created(self):
+        category = Category.create(name='Filme', description='Filmes em geral')
+
+        [event] = category.pull_events()
+        assert isinstance(event, CategoryCreated)
+        assert event.aggregate_id == category.id
+        assert event.payload() == {'name': 'Filme', 'description': 'Filmes em geral', 'is_active': True}
+
+    def test_constructed_and_rehydrated_categories_record_nothing(self):
+        assert Category(name='Filme').pull_events() == []
+        assert Category.rehydrate(id=uuid4(), name='Filme').pull_events() == []
+
+    def test_changes_before_a_save_coalesce_into_one_update(self):
+        category = Category(name='Filme')
+
+        category.update_category(name='Série', description='Séries')
+        category.deactivate()
+
+        [event] = category.pull_events()
+        assert isinstance(event, CategoryUpdated)
+        assert event.payload() == {'name': 'Série', 'description': 'Séries', 'is_active': False}
+
+    def test_no_event_when_nothing_changes(self):
+        category = Category(name='Filme')
+
+        category.update_category(name='Filme', description='')
+        category.activate()
+
+        assert category.pull_events() == []
+
+    def test_pull_events_clears_them(self):
+        category = Category.create(name='Filme')
+
+        category.pull_events()
+
+        assert category.pull_events() == []
@@ -1,6 +1,7 @@
 import uuid
 
 import pytest
+from src.core._shared.changes import ChangeState, ChangeToken
 from src.core.category.application.exceptions import CategoryNotFound
 from src.core.category.domain.category import Category
 from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
@@ -96,4 +97,98 @@ class TestGetById:
 
         assert len(repository.categories) == 1
         assert repository.categories[0].id == category_filme.id
-        assert response == None
\ No newline at end of file
+        assert response == None
+
+class TestUpdate:
+    def test_update_category_moves_it_to_the_end_of_the_list(self):
+        category_filme = Category(name='Filme')
+        category_series = Category(name='Serie')
+        repository = InMemoryCategoryRepository(
+            categories=[category_filme, category_series]
+        )
+
+        category_filme.update_category(name='Filmes', description='')
+        repository.update(category_filme)
+
+        assert repository.list() == [category_series, category_filme]
+        assert repository.get_by_id(category_filme.id).name == 'Filmes'
+
+    def test_update_category_refreshes_secondary_indexes(self):
+        category_filme = Category(name='Filme')
+        repository = InMemoryCategoryRepository(categories=[category_filme])
+
+        category_filme.update_category(name='Filmes', description='')
+        category_filme.deactivate()
+        repository.update(category_filme)
+
+        assert repository.list_by_name('Filme') == []
+        assert repository.list_by_name('Filmes') == [category_filme]
+        assert repository.list_by_is_active(True) == []
+        assert repository.list_by_is_active(False) == [category_filme]
+
+
+class TestListByIndex:
+    def test_list_by_name_and_is_active(self):
+        category_filme = Category(name='Filme')
+        category_series = Category(name='Serie', is_active=False)
+        category_documentario = Category(name='Documentario')
+        repository = InMemoryCategoryRepository(
+            categories=[category_filme, category_series, category_documentario]
+        )
+
+        assert repository.list_by_name('Serie') == [category_series]
+        assert repository.list_by_is_active(True) == [category_filme, category_documentario]
+        assert repository.list_by_is_active(False) == [category_series]
+
+    def test_deleted_category_is_removed_from_indexes(self):
+        category_filme = Category(name='Filme')
+        repository = InMemoryCategoryRepository(categories=[category_filme])
+
+        repository.delete(category_filme.id)
+
+        assert repository.list_by_name('Filme') == []
+        assert repository.list_by_is_active(True) == []
+
+
+class TestChangesSince:
+    def test_stamp_created_at_updated_at_and_version(self):
+        category_filme = Category(name='Filme')
+        repository = InMemoryCategoryRepository(categories=[category_filme])
+        created_at = category_filme.created_at
+
+        category_filme.update_category(name='Filmes', description='')
+        repository.update(category_filme)
+
+        assert category_filme.created_at == created_at
+        assert category_filme.updated_at >= created_at
+        assert category_filme.version == 2
+
+    def test_return_changes_and_tombstones_after_token(self):
+        category_filme = Category(name='Filme')
+        category_serie = Category(name='Serie')
+        repository = InMemoryCategoryRepository(categories=[category_filme, category_serie])
+        changed, deleted = repository.changes_since(None, limit=10)
+        assert {category.id for category in changed} == {category_filme.id, category_serie.id}
+        assert deleted == []
+        since = ChangeToken(timestamp=changed[-1].updated_at, id=changed[-1].id)
+
+        repository.update(category_filme)
+        repository.delete(category_serie.id)
+        changed, deleted = repository.changes_since(since, limit=10)
+
+        assert changed == [category_filme]
+        assert [tombstone.id for tombstone in deleted] == [category_serie.id]
+
+    def test_change_state_moves_on_every_write(self):
+        repository = InMemoryCategoryRepository()
+        assert repository.change_state() == ChangeState(count=0)
+
+        category_filme = Category(name='Filme')
+        repository.save(category_filme)
+        saved = repository.change_state()
+        repository.delete(category_filme.id)
+        deleted = repository.change_state()
+
+        assert (saved.count, saved.last_changed_at) == (1, category_filme.updated_at)
+        assert deleted.count == 0
+        assert deleted.last_changed_at >= saved.last_changed_at
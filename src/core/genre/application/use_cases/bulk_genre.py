@@ -0,0 +1,127 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core._shared.bulk import BulkItemError, BulkResponse, repeated_ids
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.application.use_cases.create_genre import CreateGenre
+from src.core.genre.domain.genre import Genre
+from src.core.genre.domain.genre_repository import GenreRepository
+
+
+class BulkCreateGenre:
+    def __init__(self, repository: GenreRepository, category_repository: CategoryRepository):
+        self.repository = repository
+        self.category_repository = category_repository
+
+    @dataclass
+    class Input:
+        items: list[CreateGenre.Input]
+
+    def execute(self, input: Input) -> BulkResponse:
+        # One existence query for the categories of the whole batch.
+        category_ids = self.category_repository.existing_ids(
+            {category_id for item in input.items for category_id in item.category_ids}
+        )
+
+        genres = []
+        errors = []
+        for index, item in enumerate(input.items):
+            missing_category_ids = item.category_ids - category_ids
+            if missing_category_ids:
+                errors.append(BulkItemError(index=index, error=f'Categories not found: {missing_category_ids}'))
+                continue
+
+            try:
+                genres.append(Genre.create(
+                    name=item.name,
+                    is_active=item.is_active,
+                    categories=item.category_ids,
+                ))
+            except ValueError as err:
+                errors.append(BulkItemError(index=index, error=str(err)))
+
+        self.repository.save_many(genres)
+
+        return BulkResponse(ids=[genre.id for genre in genres], errors=errors)
+
+
+class BulkUpdateGenre:
+    def __init__(self, repository: GenreRepository, category_repository: CategoryRepository):
+        self.repository = repository
+        self.category_repository = category_repository
+
+    @dataclass
+    class Item:
+        id: UUID
+        name: str
+        is_active: bool = True
+        categories: set[UUID] = field(default_factory=set)
+
+    @dataclass
+    class Input:
+        items: list['BulkUpdateGenre.Item']
+
+    def execute(self, input: Input) -> BulkResponse:
+        existing_ids = self.repository.existing_ids({item.id for item in input.items})
+        duplicate_ids = repeated_ids(item.id for item in input.items)
+        category_ids = self.category_repository.existing_ids(
+            {category_id for item in input.items for category_id in item.categories}
+        )
+
+        genres = []
+        errors = []
+        for index, item in enumerate(input.items):
+            if item.id in duplicate_ids:
+                errors.append(BulkItemError(
+                    index=index,
+                    error=f'Genre with id {item.id} is repeated in the request',
+                ))
+                continue
+
+            if item.id not in existing_ids:
+                errors.append(BulkItemError(index=index, error=f'Genre with id {item.id} not found'))
+                continue
+
+            missing_category_ids = item.categories - category_ids
+            if missing_category_ids:
+                errors.append(BulkItemError(
+                    index=index,
+                    error=f'Categories with provided IDs not found: {missing_category_ids}',
+                ))
+                continue
+
+            try:
+                genres.append(Genre.replace(
+                    id=item.id,
+                    name=item.name,
+                    is_active=item.is_active,
+                    categories=item.categories,
+                ))
+            except ValueError as err:
+                errors.append(BulkItemError(index=index, error=str(err)))
+
+        self.repository.update_many(genres)
+
+        return BulkResponse(ids=[genre.id for genre in genres], errors=errors)
+
+
+class BulkDeleteGenre:
+    def __init__(self, repository: GenreRepository):
+        self.repository = repository
+
+    @dataclass
+    class Input:
+        ids: list[UUID]
+
+    def execute(self, input: Input) -> BulkResponse:
+        existing_ids = self.repository.existing_ids(set(input.ids))
+
+        errors = [
+            BulkItemError(index=index, error=f'Genre with id {id} not found')
+            for index, id in enumerate(input.ids) if id not in existing_ids
+        ]
+        deleted_ids = [id for id in dict.fromkeys(input.ids) if id in existing_ids]
+
+        self.repository.delete_many(set(deleted_ids))
+
+        return BulkResponse(ids=deleted_ids, errors=errors)
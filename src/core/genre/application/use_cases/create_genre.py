@@ -3,12 +3,14 @@
 from dataclasses import dataclass, field
 from uuid import UUID
 
+from src.core.category.domain.category_repository import CategoryRepository
 from src.core.genre.domain.genre import Genre
+from src.core.genre.domain.genre_repository import GenreRepository
 from src.core.genre.application.exceptions import InvalidGenre, RelatedCategoriesNotFound
 
 
 class CreateGenre:
-    def __init__(self, repository, category_repository):
+    def __init__(self, repository: GenreRepository, category_repository: CategoryRepository):
         self.repository = repository
         self.category_repository = category_repository
 
@@ -23,13 +25,13 @@ class CreateGenre:
         id: UUID
 
     def execute(self, input: Input):
-        category_ids = {category.id for category in self.category_repository.list()}
-        if not input.category_ids.issubset(category_ids):
+        missing_category_ids = input.category_ids - self.category_repository.existing_ids(input.category_ids)
+        if missing_category_ids:
             raise RelatedCategoriesNotFound(
-                f'Categories not found: {input.category_ids - category_ids}')
+                f'Categories not found: {missing_category_ids}')
 
         try:
-            genre = Genre(
+            genre = Genre.create(
                 name=input.name,
                 is_active=input.is_active,
                 categories=input.category_ids
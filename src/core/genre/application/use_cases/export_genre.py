@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core.genre.application.use_cases.list_genre import GenreOutput
+from src.core.genre.domain.genre_repository import GenreRepository
+
+
+class ExportGenre:
+    def __init__(self, repository: GenreRepository):
+        self.repository = repository
+
+    @dataclass
+    class Input:
+        chunk_size: int = 1000
+
+    def execute(self, input: Input) -> Iterator[GenreOutput]:
+        for genre in self.repository.stream(chunk_size=input.chunk_size):
+            yield GenreOutput(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories=genre.categories,
+            )
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.application.exceptions import GenreNotFound
+from src.core.genre.application.use_cases.list_genre import (
+    CATEGORY_SUMMARY_FIELDS,
+    GENRE_OUTPUT_FIELDS,
+    ExpandedGenreOutput,
+    GenreOutput,
+    expand_categories,
+)
+from src.core.genre.domain.genre_repository import GenreRepository
+
+
+class GetGenre:
+    def __init__(self, repository: GenreRepository, category_repository: CategoryRepository):
+        self.repository = repository
+        self.category_repository = category_repository
+
+    @dataclass
+    class Input:
+        id: UUID
+        # 'categories' embeds {id, name, is_active} of each category instead of its id.
+        expand: str | None = None
+
+    # Reads a row projected straight into GenreOutput; with expand='categories', its
+    # categories come from one more batched read.
+    def execute(self, input: Input) -> GenreOutput | ExpandedGenreOutput:
+        genre = self._output(self.repository.get_row(input.id, GENRE_OUTPUT_FIELDS), input)
+        if input.expand != 'categories':
+            return genre
+
+        category_rows = self.category_repository.get_rows(genre.categories, CATEGORY_SUMMARY_FIELDS)
+        return expand_categories([genre], category_rows)[0]
+
+    @staticmethod
+    def _output(row: tuple | None, input: Input) -> GenreOutput:
+        if row is None:
+            raise GenreNotFound(f'Genre with id {input.id} not found')
+
+        return GenreOutput(*row)
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core._shared.bulk import order_by_ids
+from src.core.genre.application.use_cases.list_genre import GENRE_OUTPUT_FIELDS, GenreOutput
+from src.core.genre.domain.genre_repository import GenreRepository
+
+
+class GetManyGenres:
+    def __init__(self, repository: GenreRepository):
+        self.repository = repository
+
+    @dataclass
+    class Input:
+        ids: list[UUID]
+
+    @dataclass
+    class Output:
+        data: list[GenreOutput]
+        not_found: list[UUID] = field(default_factory=list)
+
+    # One batched read for every id, projected straight into GenreOutput and returned in
+    # the order they were asked for.
+    def execute(self, input: Input) -> Output:
+        rows = self.repository.get_rows(set(input.ids), GENRE_OUTPUT_FIELDS)
+        genres, not_found = order_by_ids([GenreOutput(*row) for row in rows], input.ids)
+
+        return self.Output(data=genres, not_found=not_found)
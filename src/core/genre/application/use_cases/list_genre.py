@@ -1,8 +1,11 @@
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from uuid import UUID
-from src.core.genre.domain.genre_repository import GenreRepository
+
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE, ListOutputMeta, PageCursor, page_fields, paginate
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.domain.genre_repository import GenreFilter, GenreRepository
 
 
 @dataclass
@@ -13,28 +16,118 @@ class GenreOutput:
     categories: set[UUID]
 
 
+GENRE_OUTPUT_FIELDS = tuple(output_field.name for output_field in fields(GenreOutput))
+
+
+@dataclass
+class CategorySummary:
+    id: UUID
+    name: str
+    is_active: bool
+
+
+CATEGORY_SUMMARY_FIELDS = tuple(summary_field.name for summary_field in fields(CategorySummary))
+
+
+@dataclass
+class ExpandedGenreOutput:
+    id: UUID
+    name: str
+    is_active: bool
+    categories: list[CategorySummary]
+
+
+def expand_categories(
+    genres: list[GenreOutput],
+    category_rows: list[tuple],
+) -> list[ExpandedGenreOutput]:
+    """Replace the category ids of ``genres`` with the summaries in ``category_rows``
+    (CATEGORY_SUMMARY_FIELDS, read in one batch for every genre), ordered by name."""
+    summaries = {row[0]: CategorySummary(*row) for row in category_rows}
+    return [
+        ExpandedGenreOutput(
+            id=genre.id,
+            name=genre.name,
+            is_active=genre.is_active,
+            categories=sorted(
+                (summaries[id] for id in genre.categories if id in summaries),
+                key=lambda summary: (summary.name, summary.id),
+            ),
+        )
+        for genre in genres
+    ]
+
+
 class ListGenre:
-    def __init__(self, repository: GenreRepository):
+    def __init__(self, repository: GenreRepository, category_repository: CategoryRepository):
         self.repository = repository
+        self.category_repository = category_repository
 
     @dataclass
     class Input:
-        pass
+        cursor: PageCursor | None = None
+        page_size: int = DEFAULT_PAGE_SIZE
+        is_active: bool | None = None
+        category_id: UUID | None = None
+        name_prefix: str | None = None
+        search: str | None = None
+        order_by: str = 'id'
+        # 'categories' embeds {id, name, is_active} of each category instead of its id.
+        expand: str | None = None
 
     @dataclass
     class Output:
-        data: list[GenreOutput]
+        data: list[GenreOutput] | list[ExpandedGenreOutput]
+        meta: ListOutputMeta = field(default_factory=ListOutputMeta)
 
+    # Reads rows projected straight into GenreOutput, without building entities; with
+    # expand='categories', the categories of the whole page come from one more batched read.
     def execute(self, input: Input):
-        genres = self.repository.list()
-        
-        mapped_genres = [
-            GenreOutput(
-                id=genre.id,
-                name=genre.name,
-                is_active=genre.is_active,
-                categories=genre.categories,
-            ) for genre in genres
-        ]
-
-        return self.Output(data=mapped_genres)
+        fields = page_fields(GENRE_OUTPUT_FIELDS, input.order_by)
+        rows = self.repository.list_rows(fields, **self._list_arguments(input))
+        output = self._output(rows, fields, input)
+        if input.expand == 'categories':
+            category_rows = self.category_repository.get_rows(self._category_ids(output), CATEGORY_SUMMARY_FIELDS)
+            output.data = expand_categories(output.data, category_rows)
+        return output
+
+    async def aexecute(self, input: Input):
+        fields = page_fields(GENRE_OUTPUT_FIELDS, input.order_by)
+        rows = await self.repository.alist_rows(fields, **self._list_arguments(input))
+        output = self._output(rows, fields, input)
+        if input.expand == 'categories':
+            category_rows = await self.category_repository.aget_rows(
+                self._category_ids(output), CATEGORY_SUMMARY_FIELDS,
+            )
+            output.data = expand_categories(output.data, category_rows)
+        return output
+
+    @staticmethod
+    def _category_ids(output: Output) -> set[UUID]:
+        return {category_id for genre in output.data for category_id in genre.categories}
+
+    @staticmethod
+    def _list_arguments(input: Input) -> dict:
+        return {
+            'cursor': input.cursor,
+            'limit': input.page_size + 1,
+            'filters': GenreFilter(
+                is_active=input.is_active,
+                category_id=input.category_id,
+                name_prefix=input.name_prefix,
+                search=input.search,
+            ),
+            'order_by': input.order_by,
+        }
+
+    def _output(self, rows: list[tuple], fields: tuple[str, ...], input: Input):
+        page, next_cursor = paginate(rows, fields, input.page_size, input.order_by)
+        genres = [GenreOutput(*row[:len(GENRE_OUTPUT_FIELDS)]) for row in page]
+
+        return self.Output(
+            data=genres,
+            meta=ListOutputMeta(
+                next_cursor=next_cursor,
+                page_size=input.page_size,
+            ),
+        )
@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from src.core._shared.changes import ChangeToken, ChangesMeta, Tombstone, merge_changes
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE
+from src.core.genre.domain.genre_repository import GenreRepository
+
+
+@dataclass
+class GenreChangeOutput:
+    id: UUID
+    name: str
+    is_active: bool
+    categories: set[UUID]
+    created_at: datetime
+    updated_at: datetime
+    version: int
+
+
+class ListGenreChanges:
+    def __init__(self, repository: GenreRepository):
+        self.repository = repository
+
+    @dataclass
+    class Input:
+        since: ChangeToken | None = None
+        page_size: int = DEFAULT_PAGE_SIZE
+
+    @dataclass
+    class Output:
+        data: list[GenreChangeOutput]
+        deleted: list[Tombstone] = field(default_factory=list)
+        meta: ChangesMeta = field(default_factory=ChangesMeta)
+
+    def execute(self, input: Input):
+        genres, tombstones = self.repository.changes_since(input.since, limit=input.page_size + 1)
+        genres, tombstones, meta = merge_changes(genres, tombstones, input.since, input.page_size)
+
+        mapped_genres = [
+            GenreChangeOutput(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories=genre.categories,
+                created_at=genre.created_at,
+                updated_at=genre.updated_at,
+                version=genre.version,
+            ) for genre in genres
+        ]
+
+        return self.Output(
+            data=mapped_genres,
+            deleted=tombstones,
+            meta=meta,
+        )
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.category.application.exceptions import CategoryNotFound
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.domain.genre_repository import GenreRepository
+
+
+class ListGenresByCategory:
+    def __init__(self, repository: GenreRepository, category_repository: CategoryRepository):
+        self.repository = repository
+        self.category_repository = category_repository
+
+    @dataclass
+    class Input:
+        category_id: UUID
+
+    @dataclass
+    class Output:
+        data: list[UUID]
+
+    def execute(self, input: Input) -> Output:
+        if not self.category_repository.existing_ids({input.category_id}):
+            raise CategoryNotFound(f'Category with id {input.category_id} not found')
+
+        return self.Output(data=sorted(self.repository.genre_ids_for_categories({input.category_id})))
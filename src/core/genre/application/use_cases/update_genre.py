@@ -48,21 +48,16 @@ class UpdateGenre:
         
         # Handling categories ids
         if input.categories:
-            category_ids = {category.id for category in self.category_repository.list()}
-            if not input.categories.issubset(category_ids):
+            missing_category_ids = input.categories - self.category_repository.existing_ids(input.categories)
+            if missing_category_ids:
                 raise RelatedCategoriesNotFound(
-                    f"Categories with provided IDs not found: {input.categories - category_ids}")
+                    f"Categories with provided IDs not found: {missing_category_ids}")
 
-        current_categories = genre.categories
         if input.categories is not None:
-            current_categories = input.categories
-
-        try:
-            genre.clean_categories()
-            for category_id in current_categories:
-                genre.add_category(category_id)
-        except ValueError as err:
-            raise InvalidGenre(err)
+            try:
+                genre.change_categories(input.categories)
+            except ValueError as err:
+                raise InvalidGenre(err)
 
         self.repository.update(genre)
         
\ No newline at end of file
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.events import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class GenreEvent(DomainEvent):
+    aggregate = 'genre'
+
+
+@dataclass(frozen=True, kw_only=True)
+class GenreCreated(GenreEvent):
+    name: str
+    is_active: bool
+    categories: frozenset[UUID]
+
+
+@dataclass(frozen=True, kw_only=True)
+class GenreUpdated(GenreEvent):
+    name: str
+    is_active: bool
+    categories: frozenset[UUID]
+
+
+@dataclass(frozen=True, kw_only=True)
+class GenreCategoriesChanged(GenreEvent):
+    added: frozenset[UUID]
+    removed: frozenset[UUID]
+
+    def merge(self, later: 'GenreCategoriesChanged') -> 'GenreCategoriesChanged | None':
+        # A category added and then removed again (or the reverse) is no change at all.
+        added = (self.added - later.removed) | (later.added - self.removed)
+        removed = (self.removed - later.added) | (later.removed - self.added)
+        if not added and not removed:
+            return None
+        return GenreCategoriesChanged(aggregate_id=self.aggregate_id, added=added, removed=removed)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GenreDeleted(GenreEvent):
+    pass
@@ -1,10 +1,11 @@
-from uuid import UUID, uuid4
+from uuid import UUID
 from dataclasses import dataclass, field
 
 from src.core._shared.entity import Entity
+from src.core.genre.domain.events import GenreCategoriesChanged, GenreCreated, GenreUpdated
 
 
-@dataclass
+@dataclass(slots=True)
 class Genre(Entity):
     name: str
     is_active: bool = True
@@ -26,30 +27,64 @@ class Genre(Entity):
         if not self.name:
             self.notification.add_error('name cannot be empty')
 
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self._raise_on_errors()
 
     def change_name(self, name):
+        changed = name != self.name
         self.name = name
 
         self._validate()
+        if changed:
+            self._record(self._updated_event())
     
     def activate(self):
-        self.is_active = True
-        self._validate()
+        self._set_active(True)
     
     def deactivate(self):
-        self.is_active = False
+        self._set_active(False)
+
+    def _set_active(self, is_active: bool):
+        changed = is_active != self.is_active
+        self.is_active = is_active
         self._validate()
+        if changed:
+            self._record(self._updated_event())
 
     def add_category(self, category_id: UUID):
-        self.categories.add(category_id)
-        self._validate
+        if category_id not in self.categories:
+            self.categories.add(category_id)
+            self._record_categories_changed(added={category_id})
+        self._validate()
         
     def remove_category(self, category_id: UUID):
         self.categories.remove(category_id)
-        self._validate
+        self._record_categories_changed(removed={category_id})
+        self._validate()
 
     def clean_categories(self):
-        self.categories = set()
-        self._validate
+        removed, self.categories = self.categories, set()
+        self._record_categories_changed(removed=removed)
+        self._validate()
+
+    def change_categories(self, categories: set[UUID]):
+        """Replace the categories, recording only the ones actually added and removed."""
+        added, removed = categories - self.categories, self.categories - categories
+        self.categories = set(categories)
+        self._record_categories_changed(added=added, removed=removed)
+        self._validate()
+
+    def _record_categories_changed(self, added=frozenset(), removed=frozenset()):
+        if added or removed:
+            self._record(GenreCategoriesChanged(
+                aggregate_id=self.id, added=frozenset(added), removed=frozenset(removed),
+            ))
+
+    def _created_event(self) -> GenreCreated:
+        return GenreCreated(
+            aggregate_id=self.id, name=self.name, is_active=self.is_active, categories=frozenset(self.categories),
+        )
+
+    def _updated_event(self) -> GenreUpdated:
+        return GenreUpdated(
+            aggregate_id=self.id, name=self.name, is_active=self.is_active, categories=frozenset(self.categories),
+        )
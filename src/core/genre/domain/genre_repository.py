@@ -1,9 +1,22 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator, Sequence
 from uuid import UUID
 
+from src.core._shared.changes import ChangeState, ChangeToken, Tombstone
+from src.core._shared.entity import projector
+from src.core._shared.pagination import PageCursor
 from src.core.genre.domain.genre import Genre
 
 
+@dataclass
+class GenreFilter:
+    is_active: bool | None = None
+    category_id: UUID | None = None
+    name_prefix: str | None = None
+    search: str | None = None
+
+
 class GenreRepository(ABC):
     @abstractmethod
     def save(self, genre: Genre):
@@ -22,5 +35,102 @@ class GenreRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list(self) -> list[Genre]:
+    def save_many(self, genres: list[Genre]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, genres: list[Genre]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_many(self, ids: set[UUID]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def changes_since(self, since: ChangeToken | None, limit: int) -> tuple[list[Genre], list[Tombstone]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(self, chunk_size: int = 1000) -> Iterator[Genre]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def change_state(self) -> ChangeState:
+        raise NotImplementedError
+
+    @abstractmethod
+    def genre_ids_for_categories(self, category_ids: set[UUID]) -> set[UUID]:
+        """Ids of the genres that use any of ``category_ids``, looked up by category
+        rather than by scanning the genres."""
+        raise NotImplementedError
+
+    # Batched reads: the genres (or their rows, see get_row) with the given ids, in no
+    # particular order, leaving out the ids that do not exist. The defaults read one id
+    # at a time; database-backed repositories read them all with one query.
+    def get_many(self, ids: set[UUID]) -> list[Genre]:
+        return [genre for id in ids if (genre := self.get_by_id(id)) is not None]
+
+    def get_rows(self, ids: set[UUID], fields: Sequence[str]) -> list[tuple]:
+        to_row = projector(fields)
+        return [to_row(genre) for genre in self.get_many(ids)]
+
+    # Async counterparts of the reads. The defaults call the sync methods, which is fine
+    # for repositories that do no I/O; database-backed repositories override them.
+    async def aget_by_id(self, id: UUID) -> Genre | None:
+        return self.get_by_id(id)
+
+    async def alist(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: GenreFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[Genre]:
+        return self.list(cursor=cursor, limit=limit, filters=filters, order_by=order_by)
+
+    # Projections for the read side: one tuple per row with the values of ``fields``,
+    # in that order, without building entities. The defaults project from the entities;
+    # database-backed repositories read the columns directly.
+    def get_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        genre = self.get_by_id(id)
+        return projector(fields)(genre) if genre is not None else None
+
+    def list_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: GenreFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        to_row = projector(fields)
+        return [
+            to_row(entity) for entity in self.list(cursor=cursor, limit=limit, filters=filters, order_by=order_by)
+        ]
+
+    async def aget_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        return self.get_row(id, fields)
+
+    async def alist_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: GenreFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        return self.list_rows(fields, cursor=cursor, limit=limit, filters=filters, order_by=order_by)
+
+    @abstractmethod
+    def list(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: GenreFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[Genre]:
         raise NotImplementedError
\ No newline at end of file
@@ -1,31 +1,141 @@
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
 from uuid import UUID
-from src.core.genre.domain.genre_repository import GenreRepository
+from src.core._shared.changes import ChangeState, ChangeToken, Tombstone, change_state, select_changes, touch
+from src.core._shared.entity import detach
+from src.core._shared.entity_index import EntityIndex
+from src.core._shared.pagination import PageCursor, matches_name, order_and_page
+from src.core.genre.domain.genre_repository import GenreFilter, GenreRepository
 from src.core.genre.domain.genre import Genre
 
 
 class InMemoryGenreRepository(GenreRepository):
     def __init__(self, genres: list[Genre] = None) -> None:
-        self.genres:list[Genre] = genres or []
+        self._genres: dict[UUID, Genre] = {}
+        self._sorted_ids: list[UUID] | None = None
+        self._tombstones: dict[UUID, Tombstone] = {}
+        self._name_index = EntityIndex(lambda genre: genre.name)
+        self._is_active_index = EntityIndex(lambda genre: genre.is_active)
+        self._category_index = EntityIndex(lambda genre: genre.categories, many=True)
+
+        for genre in genres or []:
+            self.save(genre)
+
+    @property
+    def genres(self) -> list[Genre]:
+        return list(self._genres.values())
 
     def save(self, genre: Genre) -> None:
-        self.genres.append(genre)
+        previous = self._genres.get(genre.id)
+        if previous is not None:
+            self._unindex(genre.id)
+        else:
+            self._sorted_ids = None
+
+        touch(genre, previous)
+        self._tombstones.pop(genre.id, None)
+        self._genres[genre.id] = stored = detach(genre)
+        self._index(stored)
 
     def get_by_id(self, id: UUID) -> Genre | None:
-        for genre in self.genres:
-            if genre.id == id:
-                return genre
-        return None
+        genre = self._genres.get(id)
+        return detach(genre) if genre is not None else None
+
+    def list_by_name(self, name: str) -> list[Genre]:
+        return [self._genres[id] for id in self._name_index.get(name)]
+
+    def list_by_is_active(self, is_active: bool) -> list[Genre]:
+        return [self._genres[id] for id in self._is_active_index.get(is_active)]
+
+    def list_by_category(self, category_id: UUID) -> list[Genre]:
+        return [self._genres[id] for id in self._category_index.get(category_id)]
+
+    def genre_ids_for_categories(self, category_ids: set[UUID]) -> set[UUID]:
+        return {id for category_id in category_ids for id in self._category_index.get(category_id)}
 
     def delete(self, id: UUID) -> None:
-        genre = self.get_by_id(id)
-        if genre:
-            self.genres.remove(genre)
+        if self._genres.pop(id, None) is not None:
+            self._unindex(id)
+            self._sorted_ids = None
+            self._tombstones[id] = Tombstone(id=id, deleted_at=datetime.now(timezone.utc))
 
     def update(self, genre: Genre) -> None:
-        old_genre = self.get_by_id(genre.id)
-        if old_genre:
-            self.genres.remove(old_genre)
-            self.genres.append(genre)
+        previous = self._genres.get(genre.id)
+        if previous is not None:
+            # Updated genres move to the end, as they always have in this repository.
+            del self._genres[genre.id]
+            self._unindex(genre.id)
+            touch(genre, previous)
+            self._genres[genre.id] = stored = detach(genre)
+            self._index(stored)
+
+    def save_many(self, genres: list[Genre]) -> None:
+        for genre in genres:
+            self.save(genre)
+
+    def update_many(self, genres: list[Genre]) -> None:
+        for genre in genres:
+            self.update(genre)
+
+    def delete_many(self, ids: set[UUID]) -> None:
+        for id in ids:
+            self.delete(id)
+
+    def existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return {id for id in ids if id in self._genres}
+
+    def changes_since(self, since: ChangeToken | None, limit: int) -> tuple[list[Genre], list[Tombstone]]:
+        return select_changes(self._genres.values(), self._tombstones.values(), since, limit)
+
+    def change_state(self) -> ChangeState:
+        return change_state(self._genres.values(), self._tombstones.values())
+
+    def stream(self, chunk_size: int = 1000) -> Iterator[Genre]:
+        yield from self.list()
+
+    def list(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: GenreFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[Genre]:
+        if (filters is not None and filters != GenreFilter()) or order_by not in (None, 'id'):
+            return order_and_page(self._filter(filters or GenreFilter()), cursor, limit, order_by or 'id')
+
+        if cursor is None and limit is None and order_by is None:
+            return [genre for genre in self._genres.values()]
+
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(self._genres)
+
+        start = bisect_right(self._sorted_ids, cursor.id) if cursor is not None else 0
+        end = start + limit if limit is not None else None
+
+        return [self._genres[id] for id in self._sorted_ids[start:end]]
+
+    def _filter(self, filters: GenreFilter) -> Iterable[Genre]:
+        # Start from the narrowest secondary index available, then check the rest.
+        if filters.category_id is not None:
+            genres = [self._genres[id] for id in self._category_index.get(filters.category_id)]
+        elif filters.is_active is not None:
+            genres = [self._genres[id] for id in self._is_active_index.get(filters.is_active)]
+        else:
+            genres = self._genres.values()
+
+        return [
+            genre for genre in genres
+            if (filters.is_active is None or genre.is_active == filters.is_active)
+            and matches_name(genre.name, name_prefix=filters.name_prefix, search=filters.search)
+        ]
+
+    def _index(self, genre: Genre) -> None:
+        self._name_index.add(genre)
+        self._is_active_index.add(genre)
+        self._category_index.add(genre)
 
-    def list(self) -> list[Genre]:
-        return [genre for genre in self.genres]
+    def _unindex(self, id: UUID) -> None:
+        self._name_index.remove(id)
+        self._is_active_index.remove(id)
+        self._category_index.remove(id)
@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
+from src.core.genre.application.exceptions import GenreNotFound
+from src.core.genre.application.use_cases.get_genre import GetGenre
+from src.core.genre.application.use_cases.list_genre import CategorySummary, ExpandedGenreOutput, GenreOutput
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_category_repository import InMemoryGenreRepository
+
+
+class TestGetGenre:
+    def test_get_genre_by_id(self):
+        movie = Category(name="Movie")
+        category_repository = InMemoryCategoryRepository(categories=[movie])
+        drama = Genre(name="Drama", categories={movie.id})
+        genre_repository = InMemoryGenreRepository(genres=[drama, Genre(name="Romance")])
+        use_case = GetGenre(repository=genre_repository, category_repository=category_repository)
+
+        output = use_case.execute(GetGenre.Input(id=drama.id))
+
+        assert output == GenreOutput(id=drama.id, name="Drama", is_active=True, categories={movie.id})
+
+    def test_get_genre_with_expanded_categories(self):
+        movie = Category(name="Movie")
+        category_repository = InMemoryCategoryRepository(categories=[movie])
+        drama = Genre(name="Drama", categories={movie.id})
+        genre_repository = InMemoryGenreRepository(genres=[drama])
+        use_case = GetGenre(repository=genre_repository, category_repository=category_repository)
+
+        output = use_case.execute(GetGenre.Input(id=drama.id, expand="categories"))
+
+        assert output == ExpandedGenreOutput(
+            id=drama.id,
+            name="Drama",
+            is_active=True,
+            categories=[CategorySummary(id=movie.id, name="Movie", is_active=True)],
+        )
+
+    def test_when_genre_does_not_exist_then_raise_exception(self):
+        use_case = GetGenre(
+            repository=InMemoryGenreRepository(),
+            category_repository=InMemoryCategoryRepository(),
+        )
+
+        with pytest.raises(GenreNotFound):
+            use_case.execute(GetGenre.Input(id=uuid.uuid4()))
@@ -1,6 +1,11 @@
+import asyncio
 
-
-from src.core.genre.application.use_cases.list_genre import GenreOutput, ListGenre
+from src.core.genre.application.use_cases.list_genre import (
+    CategorySummary,
+    ExpandedGenreOutput,
+    GenreOutput,
+    ListGenre,
+)
 from src.core.genre.domain.genre import Genre
 from src.core.category.domain.category import Category
 from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
@@ -23,7 +28,7 @@ class TestListGenre:
         )
         genre_repository.save(genre)
 
-        use_case = ListGenre(repository=genre_repository)
+        use_case = ListGenre(repository=genre_repository, category_repository=category_repository)
 
         output = use_case.execute(input=ListGenre.Input())
 
@@ -41,12 +46,56 @@ class TestListGenre:
 
     def test_empty_list_when_there_is_no_genre_saved(self):
         genre_repository = InMemoryGenreRepository()
+        category_repository = InMemoryCategoryRepository()
 
-        use_case = ListGenre(repository=genre_repository)
+        use_case = ListGenre(repository=genre_repository, category_repository=category_repository)
 
         output = use_case.execute(input=ListGenre.Input())
 
         assert len(output.data) == 0
         assert output == ListGenre.Output(
             data=[]
-        )
\ No newline at end of file
+        )
+
+    def test_aexecute_lists_same_genres(self):
+        genre_repository = InMemoryGenreRepository()
+        category_repository = InMemoryCategoryRepository()
+        genre_repository.save(Genre(name="Drama"))
+        genre_repository.save(Genre(name="Romance"))
+        use_case = ListGenre(repository=genre_repository, category_repository=category_repository)
+        input = ListGenre.Input(page_size=1, order_by="name")
+
+        output = asyncio.run(use_case.aexecute(input=input))
+
+        assert [genre.name for genre in output.data] == ["Drama"]
+        assert output == use_case.execute(input=input)
+
+    def test_expand_categories_embeds_their_summaries_ordered_by_name(self):
+        category_repository = InMemoryCategoryRepository()
+        movie = Category(name="Movie")
+        documentary = Category(name="Documentary", is_active=False)
+        category_repository.save(movie)
+        category_repository.save(documentary)
+        genre_repository = InMemoryGenreRepository()
+        drama = Genre(name="Drama", categories={movie.id, documentary.id})
+        romance = Genre(name="Romance")
+        genre_repository.save(drama)
+        genre_repository.save(romance)
+        use_case = ListGenre(repository=genre_repository, category_repository=category_repository)
+        input = ListGenre.Input(order_by="name", expand="categories")
+
+        output = use_case.execute(input=input)
+
+        assert output.data == [
+            ExpandedGenreOutput(
+                id=drama.id,
+                name="Drama",
+                is_active=True,
+                categories=[
+                    CategorySummary(id=documentary.id, name="Documentary", is_active=False),
+                    CategorySummary(id=movie.id, name="Movie", is_active=True),
+                ],
+            ),
+            ExpandedGenreOutput(id=romance.id, name="Romance", is_active=True, categories=[]),
+        ]
+        assert asyncio.run(use_case.aexecute(input=input)) == output
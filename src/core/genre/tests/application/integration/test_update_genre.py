@@ -253,3 +253,35 @@ class TestUpdateGenre:
 
         with pytest.raises(RelatedCategoriesNotFound):
             use_case.execute(input)
+
+    def test_failed_update_does_not_change_stored_genre(
+            self,
+            movie_category,
+            category_repository
+        ):
+        genre = Genre(
+            name='Action',
+            categories={movie_category.id}
+        )
+        genre_repository = InMemoryGenreRepository()
+        genre_repository.save(genre)
+
+        use_case = UpdateGenre(
+            repository=genre_repository,
+            category_repository=category_repository
+        )
+
+        input = UpdateGenre.Input(
+            name='Drama',
+            id=genre.id,
+            categories={uuid.uuid4()}
+        )
+
+        with pytest.raises(RelatedCategoriesNotFound):
+            use_case.execute(input)
+
+        stored_genre = genre_repository.get_by_id(genre.id)
+        assert stored_genre.name == 'Action'
+        assert stored_genre.categories == {movie_category.id}
+        assert genre_repository.list_by_name('Action') == [stored_genre]
+        assert genre_repository.list_by_name('Drama') == []
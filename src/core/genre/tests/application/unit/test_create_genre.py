@@ -29,14 +29,14 @@ def documentary_category() -> Category:
 @pytest.fixture
 def mock_category_repository_with_categories(movie_category, documentary_category) -> CategoryRepository:
     repository = create_autospec(CategoryRepository)
-    repository.list.return_value = [movie_category, documentary_category]
+    repository.existing_ids.side_effect = lambda ids: ids & {movie_category.id, documentary_category.id}
     return repository
 
 
 @pytest.fixture
 def mock_empty_category_repository() -> CategoryRepository:
     repository = create_autospec(CategoryRepository)
-    repository.list.return_value = []
+    repository.existing_ids.return_value = set()
     return repository
 
 
@@ -107,6 +107,10 @@ class TestCreateGenre:
                 categories={movie_category.id, documentary_category.id}
             )
         )
+        mock_category_repository_with_categories.existing_ids.assert_called_once_with(
+            {movie_category.id, documentary_category.id}
+        )
+        mock_category_repository_with_categories.list.assert_not_called()
 
     def test_create_genre_without_categories(
         self,
@@ -4,7 +4,8 @@ from unittest.mock import create_autospec
 import pytest
 from src.core.genre.domain.genre_repository import GenreRepository
 from src.core.category.domain.category_repository import CategoryRepository
-from src.core.genre.application.use_cases.list_genre import GenreOutput, ListGenre
+from src.core._shared.entity import project
+from src.core.genre.application.use_cases.list_genre import GENRE_OUTPUT_FIELDS, GenreOutput, ListGenre
 from src.core.genre.domain.genre import Genre
 from src.core.category.domain.category import Category
 from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
@@ -22,13 +23,16 @@ def action_genre():
 @pytest.fixture
 def mock_genre_repository_with_categories(drama_genre, action_genre) -> GenreRepository:
     repository = create_autospec(GenreRepository)
-    repository.list.return_value = [drama_genre, action_genre]
+    repository.list_rows.return_value = [
+        project(drama_genre, GENRE_OUTPUT_FIELDS),
+        project(action_genre, GENRE_OUTPUT_FIELDS),
+    ]
     return repository
 
 @pytest.fixture
 def mock_empty_genre_repository() -> GenreRepository:
     repository = create_autospec(GenreRepository)
-    repository.list.return_value = []
+    repository.list_rows.return_value = []
     return repository
 
 @pytest.fixture
@@ -59,9 +63,13 @@ class TestListGenre:
             drama_genre,
             action_genre,
             mock_genre_repository_with_categories,
+            mock_empty_category_repository,
         ):
-        use_case = ListGenre(repository=mock_genre_repository_with_categories)
-        output = use_case.execute(input=None)
+        use_case = ListGenre(
+            repository=mock_genre_repository_with_categories,
+            category_repository=mock_empty_category_repository,
+        )
+        output = use_case.execute(input=ListGenre.Input())
 
         assert len(output.data) == 2
 
@@ -78,10 +86,14 @@ class TestListGenre:
     def test_empty_list_when_there_is_no_genre_saved(
             self,
             mock_empty_genre_repository,
+            mock_empty_category_repository,
         ):
-        use_case = ListGenre(repository=mock_empty_genre_repository)
+        use_case = ListGenre(
+            repository=mock_empty_genre_repository,
+            category_repository=mock_empty_category_repository,
+        )
 
-        output = use_case.execute(input=None)
+        output = use_case.execute(input=ListGenre.Input())
 
         assert len(output.data) == 0
         
\ No newline at end of file
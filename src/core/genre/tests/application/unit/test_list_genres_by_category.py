@@ -0,0 +1,41 @@
+from unittest.mock import create_autospec
+import uuid
+
+import pytest
+from src.core.category.application.exceptions import CategoryNotFound
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.application.use_cases.list_genres_by_category import ListGenresByCategory
+from src.core.genre.domain.genre_repository import GenreRepository
+
+
+@pytest.fixture
+def mock_genre_repository():
+    return create_autospec(GenreRepository)
+
+@pytest.fixture
+def mock_category_repository():
+    return create_autospec(CategoryRepository)
+
+
+class TestListGenresByCategory:
+    def test_return_sorted_ids_of_genres_using_the_category(self, mock_genre_repository, mock_category_repository):
+        category_id = uuid.uuid4()
+        genre_ids = {uuid.uuid4(), uuid.uuid4()}
+        mock_category_repository.existing_ids.return_value = {category_id}
+        mock_genre_repository.genre_ids_for_categories.return_value = genre_ids
+
+        use_case = ListGenresByCategory(repository=mock_genre_repository, category_repository=mock_category_repository)
+        output = use_case.execute(ListGenresByCategory.Input(category_id=category_id))
+
+        assert output == ListGenresByCategory.Output(data=sorted(genre_ids))
+        mock_genre_repository.genre_ids_for_categories.assert_called_once_with({category_id})
+
+    def test_when_category_does_not_exist_then_raise_not_found(self, mock_genre_repository, mock_category_repository):
+        mock_category_repository.existing_ids.return_value = set()
+
+        use_case = ListGenresByCategory(repository=mock_genre_repository, category_repository=mock_category_repository)
+
+        with pytest.raises(CategoryNotFound, match="Category with .* not found"):
+            use_case.execute(ListGenresByCategory.Input(category_id=uuid.uuid4()))
+
+        mock_genre_repository.genre_ids_for_categories.assert_not_called()
@@ -2,6 +2,7 @@ import pytest
 
 from uuid import UUID, uuid4
 from src.core.genre.domain.genre import Genre
+from src.core.genre.domain.events import GenreCategoriesChanged, GenreCreated, GenreUpdated
 
 
 class TestGenre:
@@ -157,4 +158,55 @@ class TestCleanCategories:
         genre = Genre(name='Romance', categories={category_id})
 
         genre.clean_categories()
-        assert genre.categories == set()
\ No newline at end of file
+        assert genre.categories == set()
+
+
+class TestEvents:
+    def test_create_records_genre_created(self):
+        category_id = uuid4()
+        genre = Genre.create(name='Romance', categories={category_id})
+
+        [event] = genre.pull_events()
+        assert isinstance(event, GenreCreated)
+        assert event.categories == {category_id}
+
+    def test_category_changes_are_netted(self):
+        kept, removed, added = uuid4(), uuid4(), uuid4()
+        genre = Genre(name='Romance', categories={kept, removed})
+
+        genre.add_category(added)
+        genre.remove_category(removed)
+        genre.add_category(removed)
+        genre.remove_category(removed)
+
+        [event] = genre.pull_events()
+        assert isinstance(event, GenreCategoriesChanged)
+        assert (event.added, event.removed) == ({added}, {removed})
+
+    def test_categories_added_and_removed_again_record_nothing(self):
+        category_id = uuid4()
+        genre = Genre(name='Romance')
+
+        genre.add_category(category_id)
+        genre.remove_category(category_id)
+
+        assert genre.pull_events() == []
+
+    def test_change_categories_records_the_difference(self):
+        kept, removed, added = uuid4(), uuid4(), uuid4()
+        genre = Genre(name='Romance', categories={kept, removed})
+
+        genre.change_categories({kept, added})
+
+        assert genre.categories == {kept, added}
+        [event] = genre.pull_events()
+        assert (event.added, event.removed) == ({added}, {removed})
+
+    def test_rename_then_category_change_records_both_in_order(self):
+        category_id = uuid4()
+        genre = Genre(name='Romance')
+
+        genre.change_name('Drama')
+        genre.add_category(category_id)
+
+        assert [type(event) for event in genre.pull_events()] == [GenreUpdated, GenreCategoriesChanged]
@@ -0,0 +1,42 @@
+import uuid
+
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_category_repository import InMemoryGenreRepository
+
+
+class TestListByCategory:
+    def test_list_genres_using_category(self):
+        movie_id = uuid.uuid4()
+        documentary_id = uuid.uuid4()
+        romance = Genre(name='Romance', categories={movie_id})
+        drama = Genre(name='Drama', categories={movie_id, documentary_id})
+        repository = InMemoryGenreRepository(genres=[romance, drama])
+
+        assert repository.list_by_category(movie_id) == [romance, drama]
+        assert repository.list_by_category(documentary_id) == [drama]
+        assert repository.list_by_category(uuid.uuid4()) == []
+
+    def test_update_genre_categories_refreshes_category_index(self):
+        movie_id = uuid.uuid4()
+        documentary_id = uuid.uuid4()
+        romance = Genre(name='Romance', categories={movie_id})
+        repository = InMemoryGenreRepository(genres=[romance])
+
+        romance.clean_categories()
+        romance.add_category(documentary_id)
+        repository.update(romance)
+
+        assert repository.list_by_category(movie_id) == []
+        assert repository.list_by_category(documentary_id) == [romance]
+
+    def test_genre_ids_for_categories(self):
+        movie_id = uuid.uuid4()
+        documentary_id = uuid.uuid4()
+        romance = Genre(name='Romance', categories={movie_id})
+        drama = Genre(name='Drama', categories={movie_id, documentary_id})
+        comedy = Genre(name='Comedy')
+        repository = InMemoryGenreRepository(genres=[romance, drama, comedy])
+
+        assert repository.genre_ids_for_categories({documentary_id}) == {drama.id}
+        assert repository.genre_ids_for_categories({movie_id, documentary_id}) == {romance.id, drama.id}
+        assert repository.genre_ids_for_categories(set()) == set()
@@ -0,0 +1,72 @@
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+from rest_framework import serializers
+
+from src.core._shared.bulk import BulkItemError
+from src.django_project._shared.metrics import serializer_timer
+
+
+BULK_BATCH_SIZE = 1000
+MAX_BULK_ITEMS = 10000
+
+T = TypeVar('T')
+
+
+def chunked(items: Iterable[T], size: int = BULK_BATCH_SIZE) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class BulkRequestSerializer(serializers.Serializer):
+    # Items are validated one by one (see validate_bulk_items) so that a single bad
+    # row is reported back instead of rejecting the whole batch.
+    create = serializers.ListField(required=False, default=list, max_length=MAX_BULK_ITEMS)
+    update = serializers.ListField(required=False, default=list, max_length=MAX_BULK_ITEMS)
+    delete = serializers.ListField(required=False, default=list, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemErrorSerializer(serializers.Serializer):
+    operation = serializers.ChoiceField(choices=['create', 'update', 'delete'])
+    index = serializers.IntegerField()
+    errors = serializers.DictField()
+
+
+class BulkResponseSerializer(serializers.Serializer):
+    created = serializers.ListField(child=serializers.UUIDField())
+    updated = serializers.ListField(child=serializers.UUIDField())
+    deleted = serializers.ListField(child=serializers.UUIDField())
+    errors = BulkItemErrorSerializer(many=True)
+
+
+def validate_bulk_items(
+    serializer_class: type[serializers.Serializer],
+    items: list,
+    operation: str,
+) -> tuple[list[int], list[dict], list[dict]]:
+    """Validate each item on its own, returning the original positions and validated
+    data of the valid items plus one error entry per invalid item."""
+    positions, validated_items, errors = [], [], []
+    for index, item in enumerate(items):
+        serializer = serializer_class(data=item)
+        with serializer_timer():
+            is_valid = serializer.is_valid()
+        if is_valid:
+            positions.append(index)
+            validated_items.append(serializer.validated_data)
+        else:
+            errors.append({'operation': operation, 'index': index, 'errors': serializer.errors})
+
+    return positions, validated_items, errors
+
+
+def bulk_item_errors(errors: list[BulkItemError], positions: list[int], operation: str) -> list[dict]:
+    # Use case errors point into the list of valid items; map them back to the request payload.
+    return [
+        {
+            'operation': operation,
+            'index': positions[error.index],
+            'errors': {'non_field_errors': [error.error]},
+        } for error in errors
+    ]
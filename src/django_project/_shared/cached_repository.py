@@ -0,0 +1,350 @@
+import hashlib
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping, Sequence
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+from src.core._shared.changes import ChangeState, ChangeToken, Tombstone
+from src.core._shared.entity import Entity
+from src.core._shared.pagination import PageCursor
+from src.django_project._shared.lru import LRUCache
+
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+_cache_stats: defaultdict[str, CacheStats] = defaultdict(CacheStats)
+
+
+def cache_stats(namespace: str) -> CacheStats:
+    return _cache_stats[namespace]
+
+
+def reset_cache_stats() -> None:
+    _cache_stats.clear()
+
+
+# Per-process LRU of the rows read by id (get_row), per namespace.
+_hot_rows: dict[str, LRUCache] = {}
+# Namespace -> the namespaces that declared it in their depends_on.
+_dependents: defaultdict[str, set[str]] = defaultdict(set)
+
+
+def hot_rows(namespace: str) -> LRUCache:
+    rows = _hot_rows.get(namespace)
+    if rows is None:
+        rows = _hot_rows.setdefault(
+            namespace,
+            LRUCache(maxsize=settings.REPOSITORY_LRU_SIZE, timeout=settings.REPOSITORY_LRU_TIMEOUT),
+        )
+    return rows
+
+
+def reset_hot_rows() -> None:
+    for rows in _hot_rows.values():
+        rows.clear()
+
+
+# The change states a conditional view built its ETag from, by namespace (see
+# src/django_project/_shared/conditional.py).
+_read_states: ContextVar[Mapping[str, ChangeState] | None] = ContextVar('read_states', default=None)
+
+
+@contextmanager
+def reading_at(states: Mapping[str, ChangeState]):
+    """Key the cached reads made inside the block by ``states`` as well, so that what
+    they return was loaded at those states (or later) and never before them."""
+    token = _read_states.set(states)
+    try:
+        yield
+    finally:
+        _read_states.reset(token)
+
+
+class CachedRepository:
+    """Read-through cache around a repository, backed by Django's cache framework.
+
+    The row projections read by the query use cases (get_rows, list_rows and their
+    async counterparts) are cached under keys that embed a version number per
+    namespace. Every write through the decorator bumps the version,
+    which orphans all cached reads of that namespace at once; orphaned entries expire
+    with the TTL.
+    ``depends_on`` lists other namespaces whose writes must also invalidate this one
+    (e.g. deleting a category changes the categories of the genres that used it).
+
+    Writes made outside the decorator are only picked up once the TTL expires, except
+    inside ``reading_at`` (the conditional views), where the keys also carry the change
+    state read from the database, so a body can never be older than its ETag. Entity
+    reads (get_by_id, get_many, list) pass straight through: the write use cases load
+    the entity they modify with them, and a stale copy would overwrite a newer row. The
+    change feed (changes_since), change_state (which the conditional reads derive their
+    ETag from) and stream pass straight through too. The async reads
+    share the cached entries with the sync ones.
+
+    Reads by id (get_row) are kept in a small per-process LRU instead (see hot_rows), and
+    a miss reads the repository itself, so the LRU's short TTL is all the staleness
+    they can have. A write through the decorator evicts the ids it touched (and every id
+    of the namespaces depending on this one); writes from other processes are seen once
+    the entry expires (REPOSITORY_LRU_TIMEOUT).
+    """
+    namespace: str = ''
+    depends_on: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for namespace in cls.depends_on:
+            _dependents[namespace].add(cls.namespace)
+
+    def __init__(self, repository, cache: BaseCache | None = None, timeout: int | None = None) -> None:
+        self.repository = repository
+        self._cache = cache
+        self.timeout = timeout if timeout is not None else settings.REPOSITORY_CACHE_TIMEOUT
+
+    @property
+    def cache(self) -> BaseCache:
+        # Django's cache handles are per thread, and one repository serves every thread
+        # (see src/django_project/container.py), so the handle is looked up on use.
+        return self._cache if self._cache is not None else caches[settings.REPOSITORY_CACHE_ALIAS]
+
+    @property
+    def stats(self) -> CacheStats:
+        return cache_stats(self.namespace)
+
+    @property
+    def hot_rows(self) -> LRUCache:
+        return hot_rows(self.namespace)
+
+    def save(self, entity: Entity) -> None:
+        self.repository.save(entity)
+        self.invalidate([entity.id])
+
+    def get_by_id(self, id: UUID) -> Entity | None:
+        return self.repository.get_by_id(id)
+
+    def delete(self, id: UUID) -> None:
+        self.repository.delete(id)
+        self.invalidate([id])
+
+    def update(self, entity: Entity) -> None:
+        self.repository.update(entity)
+        self.invalidate([entity.id])
+
+    def save_many(self, entities: list[Entity]) -> None:
+        self.repository.save_many(entities)
+        self.invalidate([entity.id for entity in entities])
+
+    def update_many(self, entities: list[Entity]) -> None:
+        self.repository.update_many(entities)
+        self.invalidate([entity.id for entity in entities])
+
+    def delete_many(self, ids: set[UUID]) -> None:
+        self.repository.delete_many(ids)
+        self.invalidate(ids)
+
+    def existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return self.repository.existing_ids(ids)
+
+    def changes_since(self, since: ChangeToken | None, limit: int) -> tuple[list[Entity], list[Tombstone]]:
+        return self.repository.changes_since(since, limit)
+
+    def stream(self, chunk_size: int = 1000) -> Iterator[Entity]:
+        return self.repository.stream(chunk_size=chunk_size)
+
+    def change_state(self) -> ChangeState:
+        return self.repository.change_state()
+
+    async def aget_by_id(self, id: UUID) -> Entity | None:
+        return await self.repository.aget_by_id(id)
+
+    async def alist(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters=None,
+        order_by: str | None = None,
+    ) -> list[Entity]:
+        return await self.repository.alist(cursor=cursor, limit=limit, filters=filters, order_by=order_by)
+
+    def get_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        rows, generation, key = self.hot_rows, self.hot_rows.generation, (tuple(fields), self._read_states())
+        row = rows.get(id, key, _MISSING)
+        if row is not _MISSING:
+            self.stats.hits += 1
+            return row
+
+        self.stats.misses += 1
+        row = self.repository.get_row(id, fields)
+        if row is not None:
+            rows.set(id, key, row, generation)
+        return row
+
+    def get_many(self, ids: set[UUID]) -> list[Entity]:
+        return self.repository.get_many(ids)
+
+    def get_rows(self, ids: set[UUID], fields: Sequence[str]) -> list[tuple]:
+        arguments = hashlib.md5(repr((sorted(ids), tuple(fields))).encode()).hexdigest()
+        return self._cached(f'get_rows:{arguments}', lambda: self.repository.get_rows(ids, fields))
+
+    def list_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters=None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        # Filters carry user input (search text), so the key embeds a digest of them.
+        arguments = hashlib.md5(repr((tuple(fields), cursor, limit, filters, order_by)).encode()).hexdigest()
+        return self._cached(
+            f'list_rows:{arguments}',
+            lambda: self.repository.list_rows(fields, cursor=cursor, limit=limit, filters=filters, order_by=order_by),
+        )
+
+    async def aget_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        rows, generation, key = self.hot_rows, self.hot_rows.generation, (tuple(fields), self._read_states())
+        row = rows.get(id, key, _MISSING)
+        if row is not _MISSING:
+            self.stats.hits += 1
+            return row
+
+        self.stats.misses += 1
+        row = await self.repository.aget_row(id, fields)
+        if row is not None:
+            rows.set(id, key, row, generation)
+        return row
+
+    async def aget_rows(self, ids: set[UUID], fields: Sequence[str]) -> list[tuple]:
+        arguments = hashlib.md5(repr((sorted(ids), tuple(fields))).encode()).hexdigest()
+        return await self._acached(f'get_rows:{arguments}', lambda: self.repository.aget_rows(ids, fields))
+
+    async def alist_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters=None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        arguments = hashlib.md5(repr((tuple(fields), cursor, limit, filters, order_by)).encode()).hexdigest()
+        return await self._acached(
+            f'list_rows:{arguments}',
+            lambda: self.repository.alist_rows(fields, cursor=cursor, limit=limit, filters=filters, order_by=order_by),
+        )
+
+    def list(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters=None,
+        order_by: str | None = None,
+    ) -> list[Entity]:
+        return self.repository.list(cursor=cursor, limit=limit, filters=filters, order_by=order_by)
+
+    def invalidate(self, ids: Iterable[UUID] | None = None) -> None:
+        """Orphan every cached read of this namespace; ``ids`` narrows what is evicted
+        from the per-process LRU (all of it when None)."""
+        key = self._version_key(self.namespace)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self._init_version(key)
+
+        if ids is None:
+            self.hot_rows.clear()
+        else:
+            self.hot_rows.evict(ids)
+        for namespace in _dependents[self.namespace]:
+            hot_rows(namespace).clear()
+
+    def _cached(self, key: str, load):
+        key = f'{self._prefix()}:{key}'
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self.stats.hits += 1
+            return value
+
+        self.stats.misses += 1
+        value = load()
+        if value is not None:
+            self.cache.set(key, value, timeout=self.timeout)
+        return value
+
+    async def _acached(self, key: str, load):
+        key = f'{await self._aprefix()}:{key}'
+        value = await self.cache.aget(key, _MISSING)
+        if value is not _MISSING:
+            self.stats.hits += 1
+            return value
+
+        self.stats.misses += 1
+        value = await load()
+        if value is not None:
+            await self.cache.aset(key, value, timeout=self.timeout)
+        return value
+
+    def _prefix(self) -> str:
+        versions = ':'.join(str(version) for version in self._versions())
+        return f'repository:{self.namespace}:{versions}{self._read_states()}'
+
+    async def _aprefix(self) -> str:
+        versions = ':'.join(str(version) for version in await self._aversions())
+        return f'repository:{self.namespace}:{versions}{self._read_states()}'
+
+    def _read_states(self) -> str:
+        # '' outside reading_at, or for namespaces whose state it was not given.
+        states = _read_states.get() or {}
+        return ''.join(
+            f':{namespace}@{state.count}@{state.last_changed_at.isoformat() if state.last_changed_at else ""}'
+            for namespace in (self.namespace, *self.depends_on)
+            if (state := states.get(namespace)) is not None
+        )
+
+    def _versions(self) -> tuple[int, ...]:
+        keys = self._version_keys()
+        versions = self.cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                versions[key] = self._init_version(key)
+
+        return tuple(versions[key] for key in keys)
+
+    async def _aversions(self) -> tuple[int, ...]:
+        keys = self._version_keys()
+        versions = await self.cache.aget_many(keys)
+        for key in keys:
+            if key not in versions:
+                versions[key] = await self._ainit_version(key)
+
+        return tuple(versions[key] for key in keys)
+
+    def _version_keys(self) -> tuple[str, ...]:
+        return tuple(self._version_key(namespace) for namespace in (self.namespace, *self.depends_on))
+
+    def _init_version(self, key: str) -> int:
+        # A missing version (never set, or evicted) starts from the current time rather
+        # than 1, so entries cached under an older version can never be served again.
+        version = time.time_ns()
+        self.cache.add(key, version, timeout=None)
+        return self.cache.get(key, version)
+
+    async def _ainit_version(self, key: str) -> int:
+        version = time.time_ns()
+        await self.cache.aadd(key, version, timeout=None)
+        return await self.cache.aget(key, version)
+
+    @staticmethod
+    def _version_key(namespace: str) -> str:
+        return f'repository:{namespace}:version'
+
@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Count, Max, Q, QuerySet
+from django.utils import timezone
+
+from src.core._shared.changes import ChangeState, ChangeToken
+
+
+def changed_after(since: ChangeToken | None, timestamp_field: str) -> Q:
+    """Keyset filter for rows after ``since`` in (timestamp_field, id) order.
+
+    The timestamps are stamped before commit, so a transaction still in flight can
+    commit a row older than one already handed out; a token past it would skip that row
+    for good. Only rows older than ``CHANGE_FEED_LAG`` seconds are listed, which holds
+    the token back behind every transaction shorter than that.
+    """
+    settled = Q(**{f'{timestamp_field}__lte': timezone.now() - timedelta(seconds=settings.CHANGE_FEED_LAG)})
+    if since is None:
+        return settled
+
+    return settled & (
+        Q(**{f'{timestamp_field}__gt': since.timestamp})
+        | Q(**{timestamp_field: since.timestamp, 'id__gt': since.id})
+    )
+
+
+def change_state(queryset: QuerySet, tombstones: QuerySet) -> ChangeState:
+    """Row count and latest updated_at or deleted_at, read from the tables themselves so
+    that writes from the admin or other processes move it too."""
+    live = queryset.aggregate(count=Count('pk'), updated_at=Max('updated_at'))
+    deleted_at = tombstones.aggregate(deleted_at=Max('deleted_at'))['deleted_at']
+    timestamps = [timestamp for timestamp in (live['updated_at'], deleted_at) if timestamp is not None]
+
+    return ChangeState(count=live['count'], last_changed_at=max(timestamps, default=None))
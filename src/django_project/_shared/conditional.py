@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from src.core._shared.changes import ChangeState
+from src.django_project._shared.cached_repository import reading_at
+from src.django_project.container import container
+
+
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+def conditional_view(*repository_types):
+    """Same as ``conditional_on`` for plain (sync or async) view functions.
+
+    Django calls the ETag and Last-Modified lookups synchronously, even in front of an
+    async view, so for those the change state is read in a worker thread first.
+
+    The view runs inside ``reading_at`` those same states, so a cached body read before
+    a write made elsewhere (the admin, another process) is not served under the ETag
+    of that write.
+    """
+    def states(request) -> list[tuple[type, ChangeState]]:
+        # condition() asks for the ETag and the Last-Modified separately; read them once.
+        if not hasattr(request, '_change_states'):
+            request._change_states = [
+                (repository_type, container.repository(repository_type).change_state())
+                for repository_type in repository_types
+            ]
+        return request._change_states
+
+    def etag(request, *args, **kwargs) -> str:
+        return '-'.join(
+            f'{_name(repository_type)}-{state.count}-{_microseconds(state.last_changed_at)}'
+            for repository_type, state in states(request)
+        )
+
+    def last_modified(request, *args, **kwargs) -> datetime | None:
+        # None (no header) while nothing was ever written.
+        return max(
+            (state.last_changed_at for _, state in states(request) if state.last_changed_at is not None),
+            default=None,
+        )
+
+    def namespaces(request) -> dict[str, ChangeState]:
+        return {
+            container.repository(repository_type).namespace: state
+            for repository_type, state in states(request)
+            if hasattr(container.repository(repository_type), 'namespace')
+        }
+
+    def decorator(view):
+        if not iscoroutinefunction(view):
+            @wraps(view)
+            def read(request, *args, **kwargs):
+                with reading_at(namespaces(request)):
+                    return view(request, *args, **kwargs)
+
+            return condition(etag_func=etag, last_modified_func=last_modified)(read)
+
+        @wraps(view)
+        async def aread(request, *args, **kwargs):
+            with reading_at(namespaces(request)):
+                return await view(request, *args, **kwargs)
+
+        conditional = condition(etag_func=etag, last_modified_func=last_modified)(aread)
+
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            await sync_to_async(states)(request)
+            return await conditional(request, *args, **kwargs)
+
+        return inner
+
+    return decorator
+
+
+def conditional_on(*repository_types):
+    """Decorate a viewset action with a strong ETag and Last-Modified header taken from the
+    change state of the repositories its response is read from (e.g. CategoryRepository,
+    resolved through the container), answering ``If-None-Match`` and
+    ``If-Modified-Since`` with 304 before the action renders anything.
+
+    The state (row count and latest updated_at or deleted_at) is read from the database on
+    every request, so writes from the admin or another process move it too; it costs
+    two aggregate queries per repository instead of rendering the body.
+    """
+    return method_decorator(conditional_view(*repository_types))
+
+
+def _name(repository_type: type) -> str:
+    return repository_type.__name__.removesuffix('Repository').lower()
+
+
+def _microseconds(timestamp: datetime | None) -> int:
+    return (timestamp - _EPOCH) // timedelta(microseconds=1) if timestamp is not None else 0
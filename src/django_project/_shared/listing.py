@@ -0,0 +1,40 @@
+from django.db.models import Q, QuerySet
+
+from src.core._shared.pagination import PageCursor, parse_order_by
+
+
+def filter_by_name(queryset: QuerySet, name_prefix: str | None = None, search: str | None = None) -> QuerySet:
+    # A prefix match can use the (name, id) index; a contains search has to scan.
+    if name_prefix is not None:
+        queryset = queryset.filter(name__startswith=name_prefix)
+    if search is not None:
+        queryset = queryset.filter(name__icontains=search)
+
+    return queryset
+
+
+def keyset_page(queryset: QuerySet, cursor: PageCursor | None, limit: int | None, order_by: str) -> QuerySet:
+    """Order by (field, id) and keep up to ``limit`` rows after the (value, id) key in ``cursor``.
+
+    The key comes from the cursor itself, so the next page is found even if the row it
+    was taken from was deleted in the meantime.
+    """
+    field, descending = parse_order_by(order_by)
+    direction, lookup = ('-', 'lt') if descending else ('', 'gt')
+
+    if field == 'id':
+        queryset = queryset.order_by(f'{direction}id')
+        if cursor is not None:
+            queryset = queryset.filter(**{f'id__{lookup}': cursor.id})
+    else:
+        queryset = queryset.order_by(f'{direction}{field}', f'{direction}id')
+        if cursor is not None:
+            queryset = queryset.filter(
+                Q(**{f'{field}__{lookup}': cursor.value})
+                | Q(**{field: cursor.value, f'id__{lookup}': cursor.id})
+            )
+
+    if limit is not None:
+        queryset = queryset[:limit]
+
+    return queryset
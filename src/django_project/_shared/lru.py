@@ -0,0 +1,73 @@
+"""Bounded in-process LRU with a time-to-live, for the hottest single-id reads.
+
+Entries are grouped by id (one id may be read with several field projections), so a
+write can evict everything cached for the ids it touched::
+
+    rows = LRUCache(maxsize=1024, timeout=5)
+    generation = rows.generation
+    row = rows.get(id, fields) or load()   # until evicted, expired or pushed out
+    rows.set(id, fields, row, generation)
+    rows.evict({id})
+
+Passing the ``generation`` read before loading makes ``set`` drop a value that an
+eviction overtook while it was loading, so a write is never undone by a slower read.
+
+The cache lives in one process: a write made by another process is only seen once the
+entry expires, so ``timeout`` bounds how stale a hit can be.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+
+
+class LRUCache:
+    def __init__(self, maxsize: int, timeout: float) -> None:
+        self.maxsize = maxsize
+        self.timeout = timeout
+        # id -> (expires_at, {key: value}), least recently used first.
+        self._entries: OrderedDict[Hashable, tuple[float, dict[Hashable, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def get(self, id: Hashable, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(id)
+            if entry is None:
+                return default
+            expires_at, values = entry
+            if expires_at <= time.monotonic():
+                del self._entries[id]
+                return default
+
+            self._entries.move_to_end(id)
+            return values.get(key, default)
+
+    def set(self, id: Hashable, key: Hashable, value: Any, generation: int | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            entry = self._entries.get(id)
+            if entry is None or entry[0] <= time.monotonic():
+                entry = self._entries[id] = (time.monotonic() + self.timeout, {})
+            entry[1][key] = value
+            self._entries.move_to_end(id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, ids: Iterable[Hashable]) -> None:
+        with self._lock:
+            self.generation += 1
+            for id in ids:
+                self._entries.pop(id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
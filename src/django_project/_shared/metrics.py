@@ -0,0 +1,261 @@
+"""Per-request instrumentation: request counts, latency, SQL and serializer time.
+
+Metrics live in a process-local registry and are exposed in the Prometheus text format
+on /metrics, to the addresses in ``METRICS_ALLOWED_IPS`` only; with several worker
+processes each one reports its own numbers, so scrape them per process (or aggregate on
+the Prometheus side).
+
+Serializer time is whatever runs inside ``serializer_timer``: the views wrap request
+validation and response serialization in it, and the converters and the JSON renderer
+time themselves.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...]) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, labels: tuple[str, ...], amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} counter']
+        for labels, value in sorted(self.values.items()):
+            lines.append(f'{self.name}{{{_format_labels(self.labels, labels)}}} {_format_value(value)}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], buckets: tuple[float, ...]) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        # Per label set: one (non-cumulative) count per bucket plus +Inf, and the sum.
+        self.counts: dict[tuple[str, ...], list[int]] = {}
+        self.sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        counts = self.counts.setdefault(labels, [0] * (len(self.buckets) + 1))
+        position = next(
+            (index for index, bound in enumerate(self.buckets) if value <= bound),
+            len(self.buckets),
+        )
+        counts[position] += 1
+        self.sums[labels] = self.sums.get(labels, 0) + value
+
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        for labels, counts in sorted(self.counts.items()):
+            label_text = _format_labels(self.labels, labels)
+            cumulative = 0
+            for bound, count in zip([*self.buckets, '+Inf'], counts):
+                cumulative += count
+                le = bound if bound == '+Inf' else _format_value(bound)
+                lines.append(f'{self.name}_bucket{{{label_text},le="{le}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {_format_value(self.sums[labels])}')
+            lines.append(f'{self.name}_count{{{label_text}}} {cumulative}')
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = Counter(
+            'http_requests_total', 'HTTP requests by route, method and status.',
+            ('route', 'method', 'status'),
+        )
+        self.latency = Histogram(
+            'http_request_duration_seconds', 'Time spent handling the request.',
+            ('route', 'method'), LATENCY_BUCKETS,
+        )
+        self.queries = Histogram(
+            'http_request_db_queries', 'SQL queries issued per request.',
+            ('route', 'method'), QUERY_COUNT_BUCKETS,
+        )
+        self.db_time = Counter(
+            'http_request_db_seconds_total', 'Time spent executing SQL.',
+            ('route', 'method'),
+        )
+        self.serializer_time = Counter(
+            'http_request_serializer_seconds_total', 'Time spent validating and serializing data.',
+            ('route', 'method'),
+        )
+
+    def record(self, route: str, method: str, status: int, timings: 'RequestTimings') -> None:
+        with self._lock:
+            self.requests.inc((route, method, str(status)))
+            self.latency.observe((route, method), timings.total)
+            self.queries.observe((route, method), timings.queries)
+            self.db_time.inc((route, method), timings.db)
+            self.serializer_time.inc((route, method), timings.serializer)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self.requests, self.latency, self.queries, self.db_time, self.serializer_time]
+            return '\n'.join(line for metric in metrics for line in metric.render()) + '\n'
+
+    def reset(self) -> None:
+        with self._lock:
+            for metric in (self.requests, self.db_time, self.serializer_time):
+                metric.values.clear()
+            for metric in (self.latency, self.queries):
+                metric.counts.clear()
+                metric.sums.clear()
+
+
+registry = MetricsRegistry()
+
+
+@dataclass
+class RequestTimings:
+    total: float = 0.0
+    db: float = 0.0
+    queries: int = 0
+    serializer: float = 0.0
+    serializer_depth: int = 0
+
+    def server_timing(self) -> str:
+        return ', '.join([
+            f'db;dur={self.db * 1000:.2f};desc="{self.queries} queries"',
+            f'serializer;dur={self.serializer * 1000:.2f}',
+            f'total;dur={self.total * 1000:.2f}',
+        ])
+
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar('request_timings', default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper that adds the query to the timings of the current request, if any."""
+    timings = _current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db += time.perf_counter() - start
+        timings.queries += 1
+
+
+def install_query_recorder(**kwargs) -> None:
+    # Connections are per thread, and under ASGI the ORM runs in a sync thread rather
+    # than the one serving the request, so the wrapper is installed for good on every
+    # connection, from request_started (which Django sends from that sync thread).
+    for connection in connections.all():
+        if record_query not in connection.execute_wrappers:
+            connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def serializer_timer():
+    timings = _current_timings.get()
+    # Timers nested in another one (e.g. a converter called while rendering) are
+    # already covered by the outer timer.
+    if timings is None or timings.serializer_depth:
+        yield
+        return
+
+    timings.serializer_depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.serializer += time.perf_counter() - start
+        timings.serializer_depth -= 1
+
+
+class MetricsMiddleware:
+    """Record every request in the registry and, with ``METRICS_SERVER_TIMING`` on, add a
+    ``Server-Timing`` header so the breakdown shows up in the browser's network panel.
+
+    Works in both sync and async chains. Streaming responses (the NDJSON exports) are
+    measured until their headers are ready; the time spent streaming the body is not
+    included.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        request_started.connect(install_query_recorder, dispatch_uid='metrics.install_query_recorder')
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.is_async:
+            return self.__acall__(request)
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+        timings.total = time.perf_counter() - start
+
+        return self._record(request, response, timings)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+        timings.total = time.perf_counter() - start
+
+        return self._record(request, response, timings)
+
+    @staticmethod
+    def _record(request: HttpRequest, response: HttpResponse, timings: RequestTimings) -> HttpResponse:
+        match = request.resolver_match
+        route = match.view_name if match is not None else 'unmatched'
+        registry.record(route, request.method, response.status_code, timings)
+
+        if settings.METRICS_SERVER_TIMING:
+            response['Server-Timing'] = timings.server_timing()
+
+        return response
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    # Only the direct peer counts: a forwarded-for header is up to the client.
+    if request.META.get('REMOTE_ADDR') not in settings.METRICS_ALLOWED_IPS:
+        return HttpResponseForbidden()
+
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
@@ -0,0 +1,73 @@
+"""On-demand cProfile of a single request.
+
+With ``PROFILING_ENABLED`` on, a staff user can add ``X-Profile: 1`` (or ``?profile=1``)
+to any request to run it under cProfile. The report is written as a ``.prof`` file to
+``PROFILING_OUTPUT_DIR`` (open it with ``python -m pstats`` or snakeviz) or, when no
+directory is configured, returned as plain text instead of the response body.
+
+With the setting off the middleware removes itself from the chain at startup, so it
+costs nothing per request.
+"""
+import cProfile
+import io
+import pstats
+import re
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_QUERY_PARAM = 'profile'
+
+
+class ProfilingMiddleware:
+    """Must come after AuthenticationMiddleware, which sets ``request.user``.
+
+    Streaming responses (the NDJSON exports) are profiled until their headers are ready;
+    producing the body happens later and is not included.
+    """
+    def __init__(self, get_response) -> None:
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not self._wants_profile(request):
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        response = profiler.runcall(self.get_response, request)
+        stats = pstats.Stats(profiler).sort_stats(settings.PROFILING_SORT)
+
+        if settings.PROFILING_OUTPUT_DIR:
+            path = self._report_path(request)
+            stats.dump_stats(path)
+            response['X-Profile-Report'] = path.name
+            return response
+
+        report = io.StringIO()
+        stats.stream = report
+        stats.print_stats(settings.PROFILING_LIMIT)
+        profile_response = HttpResponse(report.getvalue(), content_type='text/plain; charset=utf-8')
+        profile_response['X-Profile-Status'] = response.status_code
+        return profile_response
+
+    @staticmethod
+    def _wants_profile(request: HttpRequest) -> bool:
+        flag = request.headers.get(PROFILE_HEADER) or request.GET.get(PROFILE_QUERY_PARAM)
+        if flag not in ('1', 'true'):
+            return False
+
+        user = getattr(request, 'user', None)
+        return user is not None and user.is_staff
+
+    @staticmethod
+    def _report_path(request: HttpRequest) -> Path:
+        directory = Path(settings.PROFILING_OUTPUT_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        route = re.sub(r'[^A-Za-z0-9]+', '-', request.path).strip('-') or 'root'
+        return directory / f'{time.time_ns()}-{request.method}-{route}.prof'
@@ -0,0 +1,43 @@
+"""JSON rendering with orjson.
+
+``ORJSONRenderer`` writes the same bytes as DRF's JSONRenderer with the default settings
+(compact separators, UTF-8 output, U+2028/U+2029 escaped) for everything this API
+returns: strings, integers, booleans, nulls, lists and objects. Anything orjson cannot
+render the same way goes through JSONRenderer: indented output (e.g. the browsable
+API), non-default settings, non-string keys and integers beyond 64 bits.
+
+Floats are the exception: orjson writes the same shortest round-trip value with a
+different exponent notation (``1e16`` rather than ``1e+16``) and NaN/Infinity as null.
+None of the response serializers has a float field; add a check here before one does.
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+from src.django_project._shared.metrics import serializer_timer
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        with serializer_timer():
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            # Datetimes and dataclasses go to the encoder, which formats them as
+            # JSONRenderer does (or rejects them).
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
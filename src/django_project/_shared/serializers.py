@@ -0,0 +1,92 @@
+from rest_framework import serializers
+from rest_framework.fields import empty
+
+from src.core._shared.changes import ChangeToken
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ORDER_BY_CHOICES, PageCursor, parse_order_by
+
+
+class PageCursorField(serializers.Field):
+    default_error_messages = {'invalid': 'Invalid cursor.'}
+
+    def to_internal_value(self, data) -> PageCursor:
+        try:
+            return PageCursor.decode(str(data))
+        except ValueError:
+            self.fail('invalid')
+
+    def to_representation(self, value: PageCursor) -> str:
+        return value.encode()
+
+
+class ListRequestSerializer(serializers.Serializer):
+    cursor = PageCursorField(required=False, default=None)
+    page_size = serializers.IntegerField(
+        required=False,
+        default=DEFAULT_PAGE_SIZE,
+        min_value=1,
+        max_value=MAX_PAGE_SIZE,
+    )
+    name_prefix = serializers.CharField(required=False, default=None, max_length=255)
+    search = serializers.CharField(required=False, default=None, max_length=255)
+    order_by = serializers.ChoiceField(choices=ORDER_BY_CHOICES, required=False, default='id')
+
+    def validate(self, attrs):
+        # A cursor holds the value of the field its page was ordered by.
+        cursor = attrs.get('cursor')
+        if cursor is not None and cursor.field != parse_order_by(attrs.get('order_by', 'id'))[0]:
+            raise serializers.ValidationError({'cursor': 'The cursor was issued for another order_by.'})
+        return attrs
+
+
+class IdsField(serializers.ListField):
+    """A list of ids given in the query string as ``?ids=a,b,c`` (or ``?ids=a&ids=b``)."""
+    def __init__(self, **kwargs):
+        super().__init__(child=serializers.UUIDField(), **kwargs)
+
+    def get_value(self, dictionary):
+        if self.field_name not in dictionary:
+            return empty
+        values = dictionary.getlist(self.field_name) if hasattr(dictionary, 'getlist') else [dictionary[self.field_name]]
+        return [id for value in values for id in str(value).split(',') if id]
+
+
+class GetManyRequestSerializer(serializers.Serializer):
+    ids = IdsField(min_length=1, max_length=MAX_PAGE_SIZE)
+
+
+class ListOutputMetaSerializer(serializers.Serializer):
+    next_cursor = serializers.CharField(allow_null=True)
+    page_size = serializers.IntegerField()
+
+
+class ChangeTokenField(serializers.Field):
+    default_error_messages = {'invalid': 'Invalid change token.'}
+
+    def to_internal_value(self, data) -> ChangeToken:
+        try:
+            return ChangeToken.decode(str(data))
+        except ValueError:
+            self.fail('invalid')
+
+    def to_representation(self, value: ChangeToken) -> str:
+        return value.encode()
+
+
+class ChangesRequestSerializer(serializers.Serializer):
+    since = ChangeTokenField(required=False, default=None)
+    page_size = serializers.IntegerField(
+        required=False,
+        default=DEFAULT_PAGE_SIZE,
+        min_value=1,
+        max_value=MAX_PAGE_SIZE,
+    )
+
+
+class TombstoneSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    deleted_at = serializers.DateTimeField()
+
+
+class ChangesMetaSerializer(serializers.Serializer):
+    next_token = serializers.CharField(allow_null=True)
+    has_more = serializers.BooleanField()
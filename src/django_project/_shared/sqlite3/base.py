@@ -0,0 +1,42 @@
+"""Django's SQLite backend plus two OPTIONS for running it under concurrent writes.
+
+``pragmas`` are executed on every new connection, e.g. ``{'journal_mode': 'WAL',
+'synchronous': 'NORMAL', 'busy_timeout': 5000}``: with WAL readers and the writer no
+longer block each other, and a commit does not wait for an fsync of the database file.
+
+``transaction_mode`` ('DEFERRED', 'IMMEDIATE' or 'EXCLUSIVE') is how ``atomic`` blocks
+begin. SQLite's default, DEFERRED, takes the write lock on the first write; if another
+connection holds it by then, the transaction fails with "database is locked" without
+waiting for busy_timeout. IMMEDIATE takes it up front, where waiting is possible.
+
+Django 5.1 has ``init_command`` and ``transaction_mode`` for this; 5.0 does not.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+
+TRANSACTION_MODES = ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE')
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        self.pragmas = kwargs.pop('pragmas', {})
+        self.transaction_mode = kwargs.pop('transaction_mode', None)
+        if self.transaction_mode is not None and self.transaction_mode.upper() not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(
+                f'settings.DATABASES: transaction_mode must be one of {", ".join(TRANSACTION_MODES)}'
+            )
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.pragmas.items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        if self.transaction_mode is None:
+            super()._start_transaction_under_autocommit()
+        else:
+            self.cursor().execute(f'BEGIN {self.transaction_mode.upper()}')
@@ -0,0 +1,44 @@
+import json
+from typing import AsyncIterator, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, StreamingHttpResponse
+
+from src.django_project._shared.bulk import chunked
+
+
+EXPORT_CHUNK_SIZE = 1000
+
+
+def ndjson_response(
+    request: HttpRequest,
+    rows: Iterable[dict],
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> StreamingHttpResponse:
+    """Stream rows as newline-delimited JSON, one object per line.
+
+    Rows are consumed lazily and written in blocks of ``chunk_size`` lines, so memory
+    stays bounded by a single block no matter how many rows there are.
+
+    Under ASGI, Django 5.0 reads a sync iterator into a list before sending anything, so
+    there the blocks come from an async iterator that builds each one in the thread the
+    view ran in (where the rows' database cursor lives) when the server asks for it.
+    """
+    blocks = _blocks(rows, chunk_size)
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        blocks = _ablocks(blocks)
+
+    return StreamingHttpResponse(blocks, content_type='application/x-ndjson')
+
+
+def _blocks(rows: Iterable[dict], chunk_size: int) -> Iterator[str]:
+    for chunk in chunked(rows, size=chunk_size):
+        yield ''.join(json.dumps(row, cls=DjangoJSONEncoder) + '\n' for row in chunk)
+
+
+async def _ablocks(blocks: Iterator[str]) -> AsyncIterator[str]:
+    next_block = sync_to_async(next, thread_sensitive=True)
+    while (block := await next_block(blocks, None)) is not None:
+        yield block
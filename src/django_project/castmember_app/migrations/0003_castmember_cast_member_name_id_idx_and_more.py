@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('castmember_app', '0002_castmembertombstone_castmember_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='castmember',
+            index=models.Index(fields=['name', 'id'], name='cast_member_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='castmember',
+            index=models.Index(fields=['type', 'id'], name='cast_member_type_id_idx'),
+        ),
+    ]
@@ -5,9 +5,30 @@ class CastMember(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4)
     name = models.CharField(max_length=255)
     type = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    version = models.PositiveIntegerField(default=1)
 
     class Meta:
         db_table = "cast_member"
+        indexes = [
+            # Keyset index for the change feed, ordered by (updated_at, id).
+            models.Index(fields=["updated_at", "id"], name="cast_member_updated_at_id_idx"),
+            # Filtered and name-ordered listings, paged by id.
+            models.Index(fields=["name", "id"], name="cast_member_name_id_idx"),
+            models.Index(fields=["type", "id"], name="cast_member_type_id_idx"),
+        ]
 
         def __str__(self):
-            return f"{self.name} - {self.type}"
\ No newline at end of file
+            return f"{self.name} - {self.type}"
+
+
+class CastMemberTombstone(models.Model):
+    id = models.UUIDField(primary_key=True)
+    deleted_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "cast_member_tombstone"
+        indexes = [
+            models.Index(fields=["deleted_at", "id"], name="cast_member_tomb_deleted_idx"),
+        ]
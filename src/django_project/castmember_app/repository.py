@@ -1,8 +1,20 @@
+from typing import Iterable, Iterator, Sequence
 from uuid import UUID
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 
+from src.core._shared.changes import ChangeState, ChangeToken, Tombstone
+from src.core._shared.pagination import PageCursor
 from src.core.castmembers.domain.castmember import CastMember
-from src.core.castmembers.domain.castmember_repository import CastMemberRepository
-from src.django_project.castmember_app.models import CastMember as CastMemberModel
+from src.core.castmembers.domain.castmember_repository import CastMemberFilter, CastMemberRepository
+from src.core.castmembers.domain.events import CastMemberDeleted
+from src.django_project._shared.bulk import chunked
+from src.django_project._shared.cached_repository import CachedRepository
+from src.django_project._shared.changes import change_state, changed_after
+from src.django_project._shared.listing import filter_by_name, keyset_page
+from src.django_project.castmember_app.models import CastMember as CastMemberModel, CastMemberTombstone
+from src.django_project.outbox_app import outbox
 
 
 class DjangoORMCastMemberRepository(CastMemberRepository):
@@ -11,21 +23,171 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
 
     def save(self, cast_member: CastMember) -> None:
         cast_member_model = CastMemberModelMapper.to_model(cast_member)
-        cast_member_model.save()
+        with transaction.atomic():
+            cast_member_model.save()
+            outbox.add(cast_member.pull_events())
     
-    def list(self) -> list[CastMember]:
+    def save_many(self, cast_members: list[CastMember]) -> None:
+        for chunk in chunked(cast_members):
+            with transaction.atomic():
+                self.cast_member_model.objects.bulk_create(
+                    [CastMemberModelMapper.to_model(cast_member) for cast_member in chunk]
+                )
+                outbox.add(event for cast_member in chunk for event in cast_member.pull_events())
+
+    def update_many(self, cast_members: list[CastMember]) -> None:
+        for chunk in chunked(cast_members):
+            cast_member_models = [CastMemberModelMapper.to_model(cast_member) for cast_member in chunk]
+            updated_at = timezone.now()
+            for cast_member_model in cast_member_models:
+                cast_member_model.updated_at = updated_at
+                cast_member_model.version = F('version') + 1
+
+            with transaction.atomic():
+                self.cast_member_model.objects.bulk_update(
+                    cast_member_models,
+                    fields=['name', 'type', 'updated_at', 'version'],
+                )
+                outbox.add(event for cast_member in chunk for event in cast_member.pull_events())
+
+    def delete_many(self, ids: set[UUID]) -> None:
+        for chunk in chunked(list(ids)):
+            with transaction.atomic():
+                self._delete(chunk)
+
+    def changes_since(self, since: ChangeToken | None, limit: int) -> tuple[list[CastMember], list[Tombstone]]:
+        cast_member_models = self.cast_member_model.objects.filter(
+            changed_after(since, 'updated_at')
+        ).order_by('updated_at', 'id')[:limit]
+        tombstones = CastMemberTombstone.objects.filter(
+            changed_after(since, 'deleted_at')
+        ).order_by('deleted_at', 'id')[:limit]
+
+        return (
+            [CastMemberModelMapper.to_entity(cast_member_model) for cast_member_model in cast_member_models],
+            [Tombstone(id=tombstone.id, deleted_at=tombstone.deleted_at) for tombstone in tombstones],
+        )
+
+    def existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        existing_ids = set()
+        for chunk in chunked(list(ids)):
+            existing_ids.update(self.cast_member_model.objects.filter(id__in=chunk).values_list('id', flat=True))
+
+        return existing_ids
+
+    def stream(self, chunk_size: int = 1000) -> Iterator[CastMember]:
+        for cast_member_model in self.cast_member_model.objects.order_by('id').iterator(chunk_size=chunk_size):
+            yield CastMemberModelMapper.to_entity(cast_member_model)
+
+    def change_state(self) -> ChangeState:
+        return change_state(self.cast_member_model.objects.all(), CastMemberTombstone.objects.all())
+
+    async def aget_by_id(self, id: UUID) -> CastMember | None:
+        try:
+            cast_member = await self.cast_member_model.objects.aget(id=id)
+            return CastMemberModelMapper.to_entity(cast_member)
+        except self.cast_member_model.DoesNotExist:
+            return None
+
+    async def alist(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CastMemberFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[CastMember]:
+        queryset = self._list_queryset(cursor, limit, filters, order_by)
+
+        return [
+            CastMemberModelMapper.to_entity(cast_member_model) async for cast_member_model in queryset
+        ]
+
+    def get_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        return self.cast_member_model.objects.filter(id=id).values_list(*fields).first()
+
+    def get_many(self, ids: set[UUID]) -> list[CastMember]:
         return [
-            CastMemberModelMapper.to_entity(cast_member_model) for cast_member_model in self.cast_member_model.objects.all()
+            CastMemberModelMapper.to_entity(cast_member_model)
+            for chunk in chunked(list(ids))
+            for cast_member_model in self.cast_member_model.objects.filter(id__in=chunk)
         ]
+
+    def get_rows(self, ids: set[UUID], fields: Sequence[str]) -> list[tuple]:
+        return [
+            row for chunk in chunked(list(ids))
+            for row in self.cast_member_model.objects.filter(id__in=chunk).values_list(*fields)
+        ]
+
+    def list_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CastMemberFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        return list(self._list_queryset(cursor, limit, filters, order_by).values_list(*fields))
+
+    async def aget_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        return await self.cast_member_model.objects.filter(id=id).values_list(*fields).afirst()
+
+    async def alist_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CastMemberFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        return [row async for row in self._list_queryset(cursor, limit, filters, order_by).values_list(*fields)]
+
+    def list(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CastMemberFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[CastMember]:
+        queryset = self._list_queryset(cursor, limit, filters, order_by)
+
+        return [
+            CastMemberModelMapper.to_entity(cast_member_model) for cast_member_model in queryset
+        ]
+
+    def _list_queryset(self, cursor: PageCursor | None, limit: int | None, filters: CastMemberFilter | None, order_by: str | None):
+        queryset = self.cast_member_model.objects.all()
+        if filters is not None:
+            if filters.type is not None:
+                queryset = queryset.filter(type=filters.type)
+            queryset = filter_by_name(queryset, name_prefix=filters.name_prefix, search=filters.search)
+        if cursor is not None or limit is not None or order_by is not None:
+            queryset = keyset_page(queryset, cursor, limit, order_by or 'id')
+
+        return queryset
     
     def delete(self, id: UUID) -> None:
-        self.cast_member_model.objects.filter(id=id).delete()
+        with transaction.atomic():
+            self._delete([id])
 
-    def update(self, cast_member: CastMember) -> None:
-        self.cast_member_model.objects.filter(id=cast_member.id).update(
-            name=cast_member.name,
-            type=cast_member.type,
+    def _delete(self, ids: Iterable[UUID]) -> None:
+        self.cast_member_model.objects.filter(id__in=ids).delete()
+        CastMemberTombstone.objects.bulk_create(
+            [CastMemberTombstone(id=id, deleted_at=timezone.now()) for id in ids],
+            ignore_conflicts=True,
         )
+        outbox.add(CastMemberDeleted(aggregate_id=id) for id in ids)
+
+    def update(self, cast_member: CastMember) -> None:
+        with transaction.atomic():
+            updated = self.cast_member_model.objects.filter(id=cast_member.id).update(
+                name=cast_member.name,
+                type=cast_member.type,
+                updated_at=timezone.now(),
+                version=F('version') + 1,
+            )
+            events = cast_member.pull_events()
+            if updated:
+                outbox.add(events)
 
     def get_by_id(self, id: UUID) -> CastMember:
         try:
@@ -35,6 +197,13 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
             return None
         
 
+class CachedCastMemberRepository(CachedRepository, CastMemberRepository):
+    namespace = 'cast_member'
+
+    def __init__(self, repository: CastMemberRepository | None = None, **kwargs) -> None:
+        super().__init__(repository or DjangoORMCastMemberRepository(), **kwargs)
+
+
 class CastMemberModelMapper:
 
     @staticmethod
@@ -47,8 +216,11 @@ class CastMemberModelMapper:
 
     @staticmethod
     def to_entity(cast_member_model: CastMemberModel) -> CastMember:
-        return CastMember(
+        return CastMember.rehydrate(
             id=cast_member_model.id,
             name=cast_member_model.name,
             type=cast_member_model.type,
+            created_at=cast_member_model.created_at,
+            updated_at=cast_member_model.updated_at,
+            version=cast_member_model.version,
         )
\ No newline at end of file
@@ -1,6 +1,15 @@
 from rest_framework import serializers
 
 from src.core.castmembers.domain.castmember import CastMemberType
+from src.django_project._shared.converters import compile_converter
+from src.django_project._shared.serializers import (
+    ChangesMetaSerializer,
+    ChangesRequestSerializer,
+    GetManyRequestSerializer,
+    ListOutputMetaSerializer,
+    ListRequestSerializer,
+    TombstoneSerializer,
+)
 
 
 class CastMemberTypeField(serializers.ChoiceField):
@@ -11,7 +20,10 @@ class CastMemberTypeField(serializers.ChoiceField):
 
     def to_internal_value(self, data):
         # Valor vindo da API como "str" é convertido para o StrEnum
-        return CastMemberType(data)
+        try:
+            return CastMemberType(data)
+        except ValueError:
+            self.fail('invalid_choice', input=data)
 
     def to_representation(self, value):
         # O valor vindo do nosso domínio é convertido para uma string na API
@@ -24,8 +36,46 @@ class CastMemberResponseSerializer(serializers.Serializer):
     type = CastMemberTypeField()
 
 
+class ListCastMemberRequestSerializer(ListRequestSerializer):
+    type = CastMemberTypeField(required=False, default=None)
+
+
 class ListCastMemberResponseSerializer(serializers.Serializer):
     data = CastMemberResponseSerializer(many=True)
+    meta = ListOutputMetaSerializer()
+
+
+class GetManyCastMembersRequestSerializer(GetManyRequestSerializer):
+    pass
+
+
+class GetManyCastMembersResponseSerializer(serializers.Serializer):
+    data = CastMemberResponseSerializer(many=True)
+    not_found = serializers.ListField(child=serializers.UUIDField())
+
+
+class RetrieveCastMemberRequestSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+
+
+class RetrieveCastMemberResponseSerializer(serializers.Serializer):
+    data = CastMemberResponseSerializer(source='*')
+
+
+class CastMemberChangeSerializer(CastMemberResponseSerializer):
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+    version = serializers.IntegerField()
+
+
+class ListCastMemberChangesRequestSerializer(ChangesRequestSerializer):
+    pass
+
+
+class ListCastMemberChangesResponseSerializer(serializers.Serializer):
+    data = CastMemberChangeSerializer(many=True)
+    deleted = TombstoneSerializer(many=True)
+    meta = ChangesMetaSerializer()
 
 
 class CreateCastMemberRequestSerializer(serializers.Serializer):
@@ -43,5 +93,18 @@ class UpdateCastMemberRequestSerializer(serializers.Serializer):
     type = CastMemberTypeField(required=False)
 
 
+class BulkUpdateCastMemberRequestSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255, allow_blank=False)
+    type = CastMemberTypeField()
+
+
 class DeleteCastMemberSerializer(serializers.Serializer):
-    id = serializers.UUIDField()
\ No newline at end of file
+    id = serializers.UUIDField()
+
+
+# Read responses are built with precompiled converters, see _shared/converters.py.
+cast_member_response = compile_converter(CastMemberResponseSerializer)
+list_cast_member_response = compile_converter(ListCastMemberResponseSerializer)
+get_many_cast_member_response = compile_converter(GetManyCastMembersResponseSerializer)
+retrieve_cast_member_response = compile_converter(RetrieveCastMemberResponseSerializer)
@@ -1,5 +1,6 @@
 import pytest
 
+from src.core._shared.pagination import PageCursor
 from src.core.castmembers.domain.castmember import CastMember, CastMemberType
 from src.django_project.castmember_app.repository import DjangoORMCastMemberRepository
 from src.django_project.castmember_app.models import CastMember as CastMemberModel
@@ -58,6 +59,21 @@ class TestListCastMemberRepository:
         assert cast_members_db[1].name == cast_member_director.name
         assert cast_members_db[1].type == cast_member_director.type
 
+    def test_list_cast_members_page_after_cursor(
+            self,
+            cast_member_actor,
+            cast_member_director
+        ):
+
+        repository = DjangoORMCastMemberRepository()
+        repository.save(cast_member_actor)
+        repository.save(cast_member_director)
+        first, second = sorted([cast_member_actor, cast_member_director], key=lambda cast_member: cast_member.id)
+
+        assert repository.list(limit=1) == [first]
+        assert repository.list(cursor=PageCursor(id=first.id), limit=1) == [second]
+        assert repository.list(cursor=PageCursor(id=second.id), limit=1) == []
+
 
 @pytest.mark.django_db
 class TestDeleteCastMemberRepository:
@@ -1,10 +1,16 @@
+import json
 import uuid
 import pytest
 
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
 
+from src.core.castmembers.application.use_cases.list_castmembers import ListCastMember, ListCastMemberRequest
 from src.django_project.castmember_app.repository import DjangoORMCastMemberRepository
+from src.django_project.castmember_app.serializers import ListCastMemberResponseSerializer
 from src.core.castmembers.domain.castmember import CastMember, CastMemberType
 
 
@@ -41,7 +47,7 @@ class TestListCastMemberAPI:
         response = APIClient().get(url)
 
         expected_data = {
-            'data': [
+            'data': sorted([
                 {
                     "id": str(cast_member_actor.id),
                     "name": cast_member_actor.name,
@@ -52,12 +58,110 @@ class TestListCastMemberAPI:
                     "name": cast_member_director.name,
                     "type": cast_member_director.type
                 }
-            ]
+            ], key=lambda cast_member: cast_member["id"]),
+            'meta': {
+                "next_cursor": None,
+                "page_size": 50,
+            }
         }
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == expected_data
 
+    def test_response_bytes_match_serializer_rendering(
+        self,
+        repository,
+        cast_member_actor,
+        cast_member_director,
+    ):
+        repository.save(cast_member_actor)
+        repository.save(cast_member_director)
+
+        response = APIClient().get("/api/castmembers/")
+
+        output = ListCastMember(repository=DjangoORMCastMemberRepository()).execute(ListCastMemberRequest())
+        assert response.content == JSONRenderer().render(ListCastMemberResponseSerializer(instance=output).data)
+
+    def test_filter_cast_members_by_type(
+        self,
+        repository,
+        cast_member_actor,
+        cast_member_director,
+    ):
+        repository.save(cast_member_actor)
+        repository.save(cast_member_director)
+
+        response = APIClient().get("/api/castmembers/", {"type": "DIRETOR"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [cast_member["id"] for cast_member in response.data["data"]] == [str(cast_member_director.id)]
+
+
+@pytest.mark.django_db
+class TestGetManyCastMemberAPI:
+    def test_return_requested_cast_members(
+        self,
+        repository,
+        cast_member_actor,
+        cast_member_director,
+    ):
+        repository.save_many([cast_member_actor, cast_member_director])
+        missing_id = uuid.uuid4()
+
+        response = APIClient().get(
+            '/api/castmembers/', {'ids': f'{cast_member_director.id},{missing_id}'},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            'data': [{'id': str(cast_member_director.id), 'name': 'Walter Salles', 'type': 'DIRETOR'}],
+            'not_found': [str(missing_id)],
+        }
+
+
+@pytest.mark.django_db
+class TestRetrieveCastMemberAPI:
+    def test_return_cast_member(self, repository, cast_member_actor):
+        repository.save(cast_member_actor)
+
+        response = APIClient().get(f'/api/castmembers/{cast_member_actor.id}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            'data': {'id': str(cast_member_actor.id), 'name': 'Adriana Esteves', 'type': 'ATOR'},
+        }
+
+    def test_when_cast_member_does_not_exist_then_return_404(self):
+        response = APIClient().get(f'/api/castmembers/{uuid.uuid4()}/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_when_id_is_invalid_then_return_400(self):
+        response = APIClient().get('/api/castmembers/123123123/')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_serve_hot_id_from_memory_until_updated_or_deleted(
+        self,
+        repository,
+        cast_member_actor,
+        django_assert_num_queries,
+    ):
+        repository.save(cast_member_actor)
+        url = f'/api/castmembers/{cast_member_actor.id}/'
+        APIClient().get(url)
+
+        # Only the change state queries of the ETag; the row comes from memory.
+        with django_assert_num_queries(2):
+            response = APIClient().get(url)
+        assert response.json()['data']['name'] == 'Adriana Esteves'
+
+        APIClient().put(url, {'name': 'Fernanda Montenegro'}, format='json')
+        assert APIClient().get(url).json()['data']['name'] == 'Fernanda Montenegro'
+
+        APIClient().delete(url)
+        assert APIClient().get(url).status_code == status.HTTP_404_NOT_FOUND
+
 
 @pytest.mark.django_db
 class TestCreateCastMemberAPI:
@@ -224,3 +328,81 @@ class TestDeleteAPI:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert repository.list() == []
+
+
+@pytest.mark.django_db
+class TestBulkCastMemberAPI:
+    def test_create_update_and_delete_cast_members_in_one_request(
+        self,
+        repository,
+        cast_member_actor,
+        cast_member_director,
+    ):
+        repository.save(cast_member_actor)
+        repository.save(cast_member_director)
+
+        url = "/api/castmembers/bulk/"
+        response = APIClient().post(
+            url,
+            {
+                "create": [
+                    {"name": "Fernanda Montenegro", "type": "ATOR"},
+                    {"name": "Invalid Type", "type": "PRODUTOR"},
+                ],
+                "update": [
+                    {"id": str(cast_member_actor.id), "name": "Adriana Esteves", "type": "DIRETOR"},
+                ],
+                "delete": [str(cast_member_director.id)],
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["created"]) == 1
+        assert response.data["updated"] == [str(cast_member_actor.id)]
+        assert response.data["deleted"] == [str(cast_member_director.id)]
+        assert [(error["operation"], error["index"]) for error in response.data["errors"]] == [("create", 1)]
+
+        cast_members = {cast_member.name: cast_member for cast_member in repository.list()}
+        assert set(cast_members) == {"Fernanda Montenegro", "Adriana Esteves"}
+        assert cast_members["Adriana Esteves"].type == CastMemberType.DIRECTOR
+
+
+@pytest.mark.django_db
+class TestExportCastMemberAPI:
+    def test_stream_all_cast_members_as_ndjson(
+        self,
+        repository,
+        cast_member_actor,
+        cast_member_director,
+    ):
+        repository.save(cast_member_actor)
+        repository.save(cast_member_director)
+
+        url = "/api/castmembers/export/"
+        response = APIClient().get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert rows == sorted([
+            {"id": str(cast_member_actor.id), "name": cast_member_actor.name, "type": "ATOR"},
+            {"id": str(cast_member_director.id), "name": cast_member_director.name, "type": "DIRETOR"},
+        ], key=lambda cast_member: cast_member["id"])
+
+
+@pytest.mark.django_db
+class TestAsyncListCastMemberAPI:
+    def test_list_filtered_by_type(self, repository, cast_member_actor, cast_member_director):
+        repository.save(cast_member_actor)
+        repository.save(cast_member_director)
+
+        response = async_to_sync(AsyncClient().get)("/api/async/castmembers/", {"type": "DIRETOR"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"] == [
+            {
+                "id": str(cast_member_director.id),
+                "name": cast_member_director.name,
+                "type": cast_member_director.type,
+            }
+        ]
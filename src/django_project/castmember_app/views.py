@@ -1,5 +1,6 @@
-from uuid import UUID
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.status import (
@@ -10,37 +11,109 @@ from rest_framework.status import (
     HTTP_404_NOT_FOUND,
 )
 
+from src.core.castmembers.application.use_cases.bulk_castmembers import (
+    BulkCreateCastMember,
+    BulkCreateCastMemberRequest,
+    BulkDeleteCastMember,
+    BulkDeleteCastMemberRequest,
+    BulkUpdateCastMember,
+    BulkUpdateCastMemberItem,
+    BulkUpdateCastMemberRequest,
+)
+from src.core.castmembers.application.use_cases.export_castmembers import ExportCastMember, ExportCastMemberRequest
 from src.core.castmembers.application.use_cases.delete_castmembers import DeleteCastMember, DeleteCastMemberRequest
 from src.core.castmembers.application.exceptions import CastMemberNotFound
 from src.core.castmembers.application.use_cases.update_castmembers import UpdateCastMember, UpdateCastMemberRequest
 from src.core.castmembers.application.use_cases.create_castmembers import CreateCastMember, CreateCastMemberRequest
 from src.core.castmembers.application.use_cases.list_castmembers import ListCastMember, ListCastMemberRequest
-from src.django_project.castmember_app.repository import DjangoORMCastMemberRepository
+from src.core.castmembers.application.use_cases.get_castmembers import GetCastMember, GetCastMemberRequest
+from src.core.castmembers.application.use_cases.get_many_castmembers import GetManyCastMembers, GetManyCastMembersRequest
+from src.core.castmembers.application.use_cases.list_castmember_changes import ListCastMemberChanges, ListCastMemberChangesRequest
+from src.core.castmembers.domain.castmember_repository import CastMemberRepository
+from src.django_project._shared.bulk import (
+    BulkRequestSerializer,
+    BulkResponseSerializer,
+    bulk_item_errors,
+    validate_bulk_items,
+)
+from src.django_project._shared.conditional import conditional_on, conditional_view
+from src.django_project._shared.metrics import serializer_timer
+from src.django_project._shared.streaming import EXPORT_CHUNK_SIZE, ndjson_response
+from src.django_project.container import container
 from src.django_project.castmember_app.serializers import (
+    BulkUpdateCastMemberRequestSerializer,
     CreateCastMemberResponseSerializer,
     CreateCastMemberRequestSerializer,
     DeleteCastMemberSerializer,
-    ListCastMemberResponseSerializer,
-    UpdateCastMemberRequestSerializer
+    GetManyCastMembersRequestSerializer,
+    ListCastMemberChangesRequestSerializer,
+    ListCastMemberChangesResponseSerializer,
+    ListCastMemberRequestSerializer,
+    RetrieveCastMemberRequestSerializer,
+    UpdateCastMemberRequestSerializer,
+    cast_member_response,
+    get_many_cast_member_response,
+    list_cast_member_response,
+    retrieve_cast_member_response,
 )
 
 class CastMemberViewSet(viewsets.ViewSet):
+    @conditional_on(CastMemberRepository)
     def list(self, request: Request) -> Response:
-        input = ListCastMemberRequest()
-        use_case = ListCastMember(repository=DjangoORMCastMemberRepository())
+        # ?ids=a,b,c reads those ids in one round trip instead of listing.
+        if 'ids' in request.query_params:
+            return self._get_many(request)
+
+        request_serializer = ListCastMemberRequestSerializer(data=request.query_params)
+        with serializer_timer():
+            request_serializer.is_valid(raise_exception=True)
+
+        input = ListCastMemberRequest(**request_serializer.validated_data)
+        use_case = container.use_case(ListCastMember)
         output = use_case.execute(input)
 
-        serializer = ListCastMemberResponseSerializer(instance=output)
+        return Response(
+            status=HTTP_200_OK,
+            data=list_cast_member_response(output),
+        )
+
+    @conditional_on(CastMemberRepository)
+    def retrieve(self, request: Request, pk=None) -> Response:
+        serializer = RetrieveCastMemberRequestSerializer(data={"id": pk})
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
+
+        input = GetCastMemberRequest(**serializer.validated_data)
+        use_case = container.use_case(GetCastMember)
+        try:
+            output = use_case.execute(request=input)
+        except CastMemberNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
 
         return Response(
             status=HTTP_200_OK,
-            data=serializer.data,
+            data=retrieve_cast_member_response(output),
         )
     
+    def _get_many(self, request: Request) -> Response:
+        request_serializer = GetManyCastMembersRequestSerializer(data=request.query_params)
+        with serializer_timer():
+            request_serializer.is_valid(raise_exception=True)
+
+        input = GetManyCastMembersRequest(**request_serializer.validated_data)
+        use_case = container.use_case(GetManyCastMembers)
+        output = use_case.execute(input)
+
+        return Response(
+            status=HTTP_200_OK,
+            data=get_many_cast_member_response(output),
+        )
+
     def create(self, request: Request) -> Response:
         serializer = CreateCastMemberRequestSerializer(data=request.data)
         try:
-            serializer.is_valid(raise_exception=True)
+            with serializer_timer():
+                serializer.is_valid(raise_exception=True)
         except:
             return Response(
                 status=HTTP_400_BAD_REQUEST,
@@ -48,12 +121,15 @@ class CastMemberViewSet(viewsets.ViewSet):
             )
 
         input = CreateCastMemberRequest(**serializer.validated_data)
-        use_case = CreateCastMember(repository=DjangoORMCastMemberRepository())
+        use_case = container.use_case(CreateCastMember)
         output = use_case.execute(request=input)
 
+        with serializer_timer():
+            data = CreateCastMemberResponseSerializer(output).data
+
         return Response(
             status=HTTP_201_CREATED,
-            data=CreateCastMemberResponseSerializer(output).data,
+            data=data,
         )
     
     def update(self, request: Request, pk=None) -> Response:
@@ -64,7 +140,8 @@ class CastMemberViewSet(viewsets.ViewSet):
             }
         )
         try:
-            serializer.is_valid(raise_exception=True)
+            with serializer_timer():
+                serializer.is_valid(raise_exception=True)
         except:
             return Response(
                 status=HTTP_400_BAD_REQUEST,
@@ -72,7 +149,7 @@ class CastMemberViewSet(viewsets.ViewSet):
             )
         
         input = UpdateCastMemberRequest(**serializer.validated_data)
-        use_case = UpdateCastMember(repository=DjangoORMCastMemberRepository())
+        use_case = container.use_case(UpdateCastMember)
         try:
             use_case.execute(request=input)
         except CastMemberNotFound:
@@ -84,16 +161,110 @@ class CastMemberViewSet(viewsets.ViewSet):
         serializer = DeleteCastMemberSerializer(data={"id":pk})
 
         try:
-            serializer.is_valid(raise_exception=True)
+            with serializer_timer():
+                serializer.is_valid(raise_exception=True)
         except:
             return Response(status=HTTP_400_BAD_REQUEST, data="Invalid data")
         
         input = DeleteCastMemberRequest(**serializer.validated_data)
-        use_case = DeleteCastMember(repository=DjangoORMCastMemberRepository())
+        use_case = container.use_case(DeleteCastMember)
 
         try:
             use_case.execute(request=input)
         except CastMemberNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
 
-        return Response(status=HTTP_204_NO_CONTENT)
\ No newline at end of file
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request: Request) -> Response:
+        serializer = BulkRequestSerializer(data=request.data)
+        try:
+            with serializer_timer():
+                serializer.is_valid(raise_exception=True)
+        except:
+            return Response(status=HTTP_400_BAD_REQUEST, data="Invalid data")
+
+        create_positions, create_items, create_errors = validate_bulk_items(
+            CreateCastMemberRequestSerializer, serializer.validated_data['create'], operation='create')
+        created = container.use_case(BulkCreateCastMember).execute(
+            BulkCreateCastMemberRequest(items=[CreateCastMemberRequest(**item) for item in create_items])
+        )
+
+        update_positions, update_items, update_errors = validate_bulk_items(
+            BulkUpdateCastMemberRequestSerializer, serializer.validated_data['update'], operation='update')
+        updated = container.use_case(BulkUpdateCastMember).execute(
+            BulkUpdateCastMemberRequest(items=[BulkUpdateCastMemberItem(**item) for item in update_items])
+        )
+
+        delete_positions, delete_items, delete_errors = validate_bulk_items(
+            DeleteCastMemberSerializer,
+            [{"id": id} for id in serializer.validated_data['delete']],
+            operation='delete',
+        )
+        deleted = container.use_case(BulkDeleteCastMember).execute(
+            BulkDeleteCastMemberRequest(ids=[item["id"] for item in delete_items])
+        )
+
+        response_serializer = BulkResponseSerializer(instance={
+            "created": created.ids,
+            "updated": updated.ids,
+            "deleted": deleted.ids,
+            "errors": [
+                *create_errors, *bulk_item_errors(created.errors, create_positions, operation='create'),
+                *update_errors, *bulk_item_errors(updated.errors, update_positions, operation='update'),
+                *delete_errors, *bulk_item_errors(deleted.errors, delete_positions, operation='delete'),
+            ],
+        })
+
+        with serializer_timer():
+            data = response_serializer.data
+
+        return Response(
+            status=HTTP_200_OK,
+            data=data,
+        )
+
+    @action(detail=False, methods=['get'])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        use_case = container.use_case(ExportCastMember)
+        output = use_case.execute(request=ExportCastMemberRequest(chunk_size=EXPORT_CHUNK_SIZE))
+
+        return ndjson_response(request, map(cast_member_response, output))
+
+    @action(detail=False, methods=['get'])
+    def changes(self, request: Request) -> Response:
+        request_serializer = ListCastMemberChangesRequestSerializer(data=request.query_params)
+        with serializer_timer():
+            request_serializer.is_valid(raise_exception=True)
+
+        input = ListCastMemberChangesRequest(**request_serializer.validated_data)
+        use_case = container.use_case(ListCastMemberChanges)
+        output = use_case.execute(input)
+        serializer = ListCastMemberChangesResponseSerializer(instance=output)
+
+        with serializer_timer():
+            data = serializer.data
+
+        return Response(
+            status=HTTP_200_OK,
+            data=data,
+        )
+
+
+# Async read endpoints for ASGI deployments: the same use cases and converters as the
+# viewset, awaiting the repository instead of blocking a worker thread on it.
+
+@conditional_view(CastMemberRepository)
+async def async_list(request: HttpRequest) -> HttpResponse:
+    request_serializer = ListCastMemberRequestSerializer(data=request.GET)
+    with serializer_timer():
+        is_valid = request_serializer.is_valid()
+    if not is_valid:
+        return JsonResponse(request_serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+    input = ListCastMemberRequest(**request_serializer.validated_data)
+    use_case = container.use_case(ListCastMember)
+    output = await use_case.aexecute(input)
+
+    return JsonResponse(list_cast_member_response(output), status=HTTP_200_OK)
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:49
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryTombstone',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('deleted_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'category_tombstone',
+            },
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['updated_at', 'id'], name='category_updated_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='categorytombstone',
+            index=models.Index(fields=['deleted_at', 'id'], name='category_tomb_deleted_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0002_categorytombstone_category_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['name', 'id'], name='category_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['is_active', 'id'], name='category_is_active_id_idx'),
+        ),
+    ]
@@ -7,9 +7,30 @@ class Category(models.Model):
     name = models.CharField(max_length=255)
     description = models.TextField()
     is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    version = models.PositiveIntegerField(default=1)
 
     class Meta:
         db_table = 'category'
+        indexes = [
+            # Keyset index for the change feed, ordered by (updated_at, id).
+            models.Index(fields=['updated_at', 'id'], name='category_updated_at_id_idx'),
+            # Filtered and name-ordered listings, paged by id.
+            models.Index(fields=['name', 'id'], name='category_name_id_idx'),
+            models.Index(fields=['is_active', 'id'], name='category_is_active_id_idx'),
+        ]
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+
+class CategoryTombstone(models.Model):
+    id = models.UUIDField(primary_key=True)
+    deleted_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'category_tombstone'
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='category_tomb_deleted_idx'),
+        ]
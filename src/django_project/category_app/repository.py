@@ -1,7 +1,23 @@
+from collections import defaultdict
+from typing import Iterable, Iterator, Sequence
 from uuid import UUID
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from src.core._shared.changes import ChangeState, ChangeToken, Tombstone
+from src.core._shared.pagination import PageCursor
 from src.core.category.domain.category import Category
-from src.core.category.domain.category_repository import CategoryRepository
-from src.django_project.category_app.models import Category as CategoryModel
+from src.core.category.domain.category_repository import CategoryFilter, CategoryRepository
+from src.core.category.domain.events import CategoryDeleted
+from src.core.genre.domain.events import GenreCategoriesChanged
+from src.django_project._shared.bulk import chunked
+from src.django_project._shared.cached_repository import CachedRepository
+from src.django_project._shared.changes import change_state, changed_after
+from src.django_project._shared.listing import filter_by_name, keyset_page
+from src.django_project.category_app.models import Category as CategoryModel, CategoryTombstone
+from src.django_project.genre_app.models import Genre as GenreModel
+from src.django_project.outbox_app import outbox
 
 
 class DjangoORMCategoryRepository(CategoryRepository):
@@ -10,7 +26,9 @@ class DjangoORMCategoryRepository(CategoryRepository):
 
     def save(self, category: Category) -> None:
         category_orm = CategoryModelMapper.to_model(category)
-        category_orm.save()
+        with transaction.atomic():
+            category_orm.save()
+            outbox.add(category.pull_events())
 
     def get_by_id(self, id: UUID) -> Category | None:
         try:
@@ -19,20 +37,199 @@ class DjangoORMCategoryRepository(CategoryRepository):
         except self.category_model.DoesNotExist:
             return None
         
+    async def aget_by_id(self, id: UUID) -> Category | None:
+        try:
+            category = await self.category_model.objects.aget(id=id)
+            return CategoryModelMapper.to_entity(category)
+        except self.category_model.DoesNotExist:
+            return None
+
+    async def alist(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CategoryFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[Category]:
+        queryset = self._list_queryset(cursor, limit, filters, order_by)
+
+        return [
+            CategoryModelMapper.to_entity(category_model) async for category_model in queryset
+        ]
+
+    def existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        existing_ids = set()
+        for chunk in chunked(list(ids)):
+            existing_ids.update(self.category_model.objects.filter(id__in=chunk).values_list('id', flat=True))
+
+        return existing_ids
+
+    def save_many(self, categories: list[Category]) -> None:
+        for chunk in chunked(categories):
+            with transaction.atomic():
+                self.category_model.objects.bulk_create(
+                    [CategoryModelMapper.to_model(category) for category in chunk]
+                )
+                outbox.add(event for category in chunk for event in category.pull_events())
+
+    def update_many(self, categories: list[Category]) -> None:
+        for chunk in chunked(categories):
+            category_models = [CategoryModelMapper.to_model(category) for category in chunk]
+            updated_at = timezone.now()
+            for category_model in category_models:
+                category_model.updated_at = updated_at
+                category_model.version = F('version') + 1
+
+            with transaction.atomic():
+                self.category_model.objects.bulk_update(
+                    category_models,
+                    fields=['name', 'description', 'is_active', 'updated_at', 'version'],
+                )
+                outbox.add(event for category in chunk for event in category.pull_events())
+
+    def delete_many(self, ids: set[UUID]) -> None:
+        for chunk in chunked(list(ids)):
+            with transaction.atomic():
+                self._delete(chunk)
+
+    def changes_since(self, since: ChangeToken | None, limit: int) -> tuple[list[Category], list[Tombstone]]:
+        category_models = self.category_model.objects.filter(
+            changed_after(since, 'updated_at')
+        ).order_by('updated_at', 'id')[:limit]
+        tombstones = CategoryTombstone.objects.filter(
+            changed_after(since, 'deleted_at')
+        ).order_by('deleted_at', 'id')[:limit]
+
+        return (
+            [CategoryModelMapper.to_entity(category_model) for category_model in category_models],
+            [Tombstone(id=tombstone.id, deleted_at=tombstone.deleted_at) for tombstone in tombstones],
+        )
+
+    def stream(self, chunk_size: int = 1000) -> Iterator[Category]:
+        for category_model in self.category_model.objects.order_by('id').iterator(chunk_size=chunk_size):
+            yield CategoryModelMapper.to_entity(category_model)
+
+    def change_state(self) -> ChangeState:
+        return change_state(self.category_model.objects.all(), CategoryTombstone.objects.all())
+
     def delete(self, id: UUID) -> None:
-        self.category_model.objects.filter(id=id).delete()
+        with transaction.atomic():
+            self._delete([id])
+
+    def _delete(self, ids: Iterable[UUID]) -> None:
+        deleted_at = timezone.now()
+        # Deleting a category drops it from its genres, which is a change to those genres.
+        removed_by_genre = defaultdict(set)
+        for genre_id, category_id in GenreModel.categories.through.objects.filter(
+            category_id__in=ids,
+        ).values_list('genre_id', 'category_id'):
+            removed_by_genre[genre_id].add(category_id)
+        if removed_by_genre:
+            GenreModel.objects.filter(id__in=removed_by_genre).update(
+                updated_at=deleted_at,
+                version=F('version') + 1,
+            )
+        self.category_model.objects.filter(id__in=ids).delete()
+        outbox.add([
+            *(CategoryDeleted(aggregate_id=id) for id in ids),
+            *(
+                GenreCategoriesChanged(aggregate_id=genre_id, added=frozenset(), removed=frozenset(removed))
+                for genre_id, removed in removed_by_genre.items()
+            ),
+        ])
+        CategoryTombstone.objects.bulk_create(
+            [CategoryTombstone(id=id, deleted_at=deleted_at) for id in ids],
+            ignore_conflicts=True,
+        )
 
-    def list(self) -> list[Category]:
+    def get_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        return self.category_model.objects.filter(id=id).values_list(*fields).first()
+
+    def get_many(self, ids: set[UUID]) -> list[Category]:
+        return [
+            CategoryModelMapper.to_entity(category_model)
+            for chunk in chunked(list(ids))
+            for category_model in self.category_model.objects.filter(id__in=chunk)
+        ]
+
+    def get_rows(self, ids: set[UUID], fields: Sequence[str]) -> list[tuple]:
+        return [
+            row for chunk in chunked(list(ids))
+            for row in self.category_model.objects.filter(id__in=chunk).values_list(*fields)
+        ]
+
+    def list_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CategoryFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        return list(self._list_queryset(cursor, limit, filters, order_by).values_list(*fields))
+
+    async def aget_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        return await self.category_model.objects.filter(id=id).values_list(*fields).afirst()
+
+    async def aget_rows(self, ids: set[UUID], fields: Sequence[str]) -> list[tuple]:
         return [
-            CategoryModelMapper.to_entity(category_model) for category_model in self.category_model.objects.all()
+            row for chunk in chunked(list(ids))
+            async for row in self.category_model.objects.filter(id__in=chunk).values_list(*fields)
         ]
+
+    async def alist_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CategoryFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        return [row async for row in self._list_queryset(cursor, limit, filters, order_by).values_list(*fields)]
+
+    def list(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: CategoryFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[Category]:
+        queryset = self._list_queryset(cursor, limit, filters, order_by)
+
+        return [
+            CategoryModelMapper.to_entity(category_model) for category_model in queryset
+        ]
+
+    def _list_queryset(self, cursor: PageCursor | None, limit: int | None, filters: CategoryFilter | None, order_by: str | None):
+        queryset = self.category_model.objects.all()
+        if filters is not None:
+            if filters.is_active is not None:
+                queryset = queryset.filter(is_active=filters.is_active)
+            queryset = filter_by_name(queryset, name_prefix=filters.name_prefix, search=filters.search)
+        if cursor is not None or limit is not None or order_by is not None:
+            queryset = keyset_page(queryset, cursor, limit, order_by or 'id')
+
+        return queryset
     
     def update(self, category:Category) -> None:
-        self.category_model.objects.filter(id=category.id).update(
-            name=category.name,
-            description=category.description,
-            is_active=category.is_active,
-        )
+        with transaction.atomic():
+            updated = self.category_model.objects.filter(id=category.id).update(
+                name=category.name,
+                description=category.description,
+                is_active=category.is_active,
+                updated_at=timezone.now(),
+                version=F('version') + 1,
+            )
+            events = category.pull_events()
+            if updated:
+                outbox.add(events)
+
+
+class CachedCategoryRepository(CachedRepository, CategoryRepository):
+    namespace = 'category'
+
+    def __init__(self, repository: CategoryRepository | None = None, **kwargs) -> None:
+        super().__init__(repository or DjangoORMCategoryRepository(), **kwargs)
 
 
 class CategoryModelMapper:
@@ -47,9 +244,12 @@ class CategoryModelMapper:
     
     @staticmethod
     def to_entity(category_orm: CategoryModel) -> Category:
-        return Category(
+        return Category.rehydrate(
             id=category_orm.id,
             name=category_orm.name,
             description=category_orm.description,
             is_active=category_orm.is_active,
+            created_at=category_orm.created_at,
+            updated_at=category_orm.updated_at,
+            version=category_orm.version,
         )
\ No newline at end of file
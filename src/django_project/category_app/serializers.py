@@ -1,5 +1,15 @@
 from rest_framework import serializers
 
+from src.django_project._shared.converters import compile_converter
+from src.django_project._shared.serializers import (
+    ChangesMetaSerializer,
+    ChangesRequestSerializer,
+    GetManyRequestSerializer,
+    ListOutputMetaSerializer,
+    ListRequestSerializer,
+    TombstoneSerializer,
+)
+
 
 class CategoryResponseSerializer(serializers.Serializer):
     id = serializers.UUIDField()
@@ -8,8 +18,38 @@ class CategoryResponseSerializer(serializers.Serializer):
     is_active = serializers.BooleanField()
 
 
+class ListCategoryRequestSerializer(ListRequestSerializer):
+    is_active = serializers.BooleanField(required=False, default=None, allow_null=True)
+
+
 class ListCategoryResponseSerializer(serializers.Serializer):
     data = CategoryResponseSerializer(many=True)
+    meta = ListOutputMetaSerializer()
+
+
+class GetManyCategoriesRequestSerializer(GetManyRequestSerializer):
+    pass
+
+
+class GetManyCategoriesResponseSerializer(serializers.Serializer):
+    data = CategoryResponseSerializer(many=True)
+    not_found = serializers.ListField(child=serializers.UUIDField())
+
+
+class CategoryChangeSerializer(CategoryResponseSerializer):
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+    version = serializers.IntegerField()
+
+
+class ListCategoryChangesRequestSerializer(ChangesRequestSerializer):
+    pass
+
+
+class ListCategoryChangesResponseSerializer(serializers.Serializer):
+    data = CategoryChangeSerializer(many=True)
+    deleted = TombstoneSerializer(many=True)
+    meta = ChangesMetaSerializer()
 
 
 class RetrieveCategoryRequestSerializer(serializers.Serializer):
@@ -20,6 +60,10 @@ class RetrieveCategoryResponseSerializer(serializers.Serializer):
     data = CategoryResponseSerializer(source='*')
 
 
+class CategoryGenresResponseSerializer(serializers.Serializer):
+    data = serializers.ListField(child=serializers.UUIDField())
+
+
 class CreateCategoryRequestSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255,  allow_blank=False)
     description = serializers.CharField()
@@ -44,4 +88,12 @@ class PartialUpdateRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     name = serializers.CharField(max_length=255, required=False)
     description = serializers.CharField(required=False)
-    is_active = serializers.BooleanField(required=False)
\ No newline at end of file
+    is_active = serializers.BooleanField(required=False)
+
+
+# Read responses are built with precompiled converters, see _shared/converters.py.
+category_response = compile_converter(CategoryResponseSerializer)
+list_category_response = compile_converter(ListCategoryResponseSerializer)
+get_many_category_response = compile_converter(GetManyCategoriesResponseSerializer)
+retrieve_category_response = compile_converter(RetrieveCategoryResponseSerializer)
+category_genres_response = compile_converter(CategoryGenresResponseSerializer)
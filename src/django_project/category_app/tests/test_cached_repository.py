@@ -0,0 +1,201 @@
+from unittest.mock import create_autospec
+
+import pytest
+from django.core.cache import cache
+
+from src.core._shared.pagination import PageCursor
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_category_repository import InMemoryGenreRepository
+from src.django_project._shared.lru import LRUCache
+from src.django_project.category_app.repository import CachedCategoryRepository
+from src.django_project.genre_app.repository import CachedGenreRepository
+
+
+@pytest.fixture
+def category_movie() -> Category:
+    return Category(name='Movie')
+
+
+@pytest.fixture
+def mock_repository(category_movie) -> CategoryRepository:
+    repository = create_autospec(CategoryRepository)
+    repository.get_by_id.return_value = category_movie
+    repository.list_rows.return_value = [(category_movie.id, category_movie.name)]
+    return repository
+
+
+class TestReadThrough:
+    def test_second_list_rows_is_served_from_cache(self, category_movie, mock_repository):
+        repository = CachedCategoryRepository(mock_repository)
+
+        assert repository.list_rows(('id', 'name')) == [(category_movie.id, 'Movie')]
+        assert repository.list_rows(('id', 'name')) == [(category_movie.id, 'Movie')]
+
+        mock_repository.list_rows.assert_called_once()
+        assert repository.stats.hits == 1
+        assert repository.stats.misses == 1
+
+    def test_list_rows_is_cached_per_page(self, category_movie, mock_repository):
+        repository = CachedCategoryRepository(mock_repository)
+
+        repository.list_rows(('id', 'name'), limit=10)
+        repository.list_rows(('id', 'name'), limit=10)
+        repository.list_rows(('id', 'name'), cursor=PageCursor(id=category_movie.id), limit=10)
+
+        assert mock_repository.list_rows.call_count == 2
+        assert repository.stats.hits == 1
+        assert repository.stats.misses == 2
+
+    def test_get_many_is_cached_per_set_of_ids(self, category_movie, mock_repository):
+        mock_repository.get_rows.return_value = [(category_movie.id, 'Movie')]
+        repository = CachedCategoryRepository(mock_repository)
+        other_id = Category(name='Series').id
+
+        repository.get_rows({category_movie.id, other_id}, ('id', 'name'))
+        repository.get_rows({other_id, category_movie.id}, ('id', 'name'))
+        repository.get_rows({category_movie.id}, ('id', 'name'))
+
+        assert mock_repository.get_rows.call_count == 2
+
+    def test_missing_row_is_not_cached(self, mock_repository):
+        mock_repository.get_row.return_value = None
+        repository = CachedCategoryRepository(mock_repository)
+
+        category = Category(name='Series')
+        assert repository.get_row(category.id, ('name',)) is None
+        assert repository.get_row(category.id, ('name',)) is None
+
+        assert mock_repository.get_row.call_count == 2
+
+    def test_entity_reads_are_not_cached(self, category_movie, mock_repository):
+        # The write use cases load the entity they modify with them.
+        repository = CachedCategoryRepository(mock_repository)
+
+        repository.get_by_id(category_movie.id)
+        repository.get_by_id(category_movie.id)
+        repository.list()
+        repository.list()
+
+        assert mock_repository.get_by_id.call_count == 2
+        assert mock_repository.list.call_count == 2
+
+
+class TestInvalidation:
+    @pytest.mark.parametrize('write', [
+        lambda repository, category: repository.save(Category(name='Series')),
+        lambda repository, category: repository.update(category),
+        lambda repository, category: repository.delete(category.id),
+        lambda repository, category: repository.update_many([category]),
+        lambda repository, category: repository.delete_many({category.id}),
+    ])
+    def test_writes_invalidate_cached_reads(self, category_movie, mock_repository, write):
+        repository = CachedCategoryRepository(mock_repository)
+        repository.list_rows(('id', 'name'))
+
+        write(repository, category_movie)
+        repository.list_rows(('id', 'name'))
+
+        assert mock_repository.list_rows.call_count == 2
+
+    def test_cache_is_shared_between_decorator_instances(self, category_movie):
+        inner = InMemoryCategoryRepository(categories=[category_movie])
+        CachedCategoryRepository(inner).list_rows(('id',))
+
+        CachedCategoryRepository(inner).delete(category_movie.id)
+
+        assert CachedCategoryRepository(inner).list_rows(('id',)) == []
+
+    def test_category_writes_invalidate_cached_genres(self, category_movie):
+        genre = Genre(name='Drama', categories={category_movie.id})
+        genre_repository = CachedGenreRepository(InMemoryGenreRepository(genres=[genre]))
+        category_repository = CachedCategoryRepository(InMemoryCategoryRepository(categories=[category_movie]))
+
+        genre_repository.list_rows(('id',))
+        category_repository.delete(category_movie.id)
+        genre_repository.list_rows(('id',))
+
+        assert genre_repository.stats.misses == 2
+        assert genre_repository.stats.hits == 0
+
+
+class TestHotRows:
+    def test_get_row_is_served_from_memory_without_the_cache(self, category_movie, mock_repository):
+        mock_repository.get_row.return_value = (category_movie.id, 'Movie')
+        repository = CachedCategoryRepository(mock_repository)
+        repository.get_row(category_movie.id, ('id', 'name'))
+
+        cache.clear()
+
+        assert repository.get_row(category_movie.id, ('id', 'name')) == (category_movie.id, 'Movie')
+        mock_repository.get_row.assert_called_once()
+        assert repository.stats.hits == 1
+
+    def test_expired_row_is_read_again_from_the_repository(self, category_movie):
+        inner = InMemoryCategoryRepository(categories=[category_movie])
+        repository = CachedCategoryRepository(inner)
+        repository.get_row(category_movie.id, ('name',))
+
+        # Another process renames it, and the hot entry expires.
+        inner.update(Category(id=category_movie.id, name='Films'))
+        repository.hot_rows.clear()
+
+        assert repository.get_row(category_movie.id, ('name',)) == ('Films',)
+
+    def test_writes_evict_only_the_ids_they_touched(self, category_movie, mock_repository):
+        series = Category(name='Series')
+        mock_repository.get_row.side_effect = lambda id, fields: (id,)
+        repository = CachedCategoryRepository(mock_repository)
+        repository.get_row(category_movie.id, ('id',))
+        repository.get_row(series.id, ('id',))
+
+        repository.update(category_movie)
+        repository.get_row(category_movie.id, ('id',))
+        repository.get_row(series.id, ('id',))
+
+        assert [call.args[0] for call in mock_repository.get_row.call_args_list] == [
+            category_movie.id, series.id, category_movie.id,
+        ]
+
+    def test_category_writes_clear_hot_genres(self, category_movie):
+        genre = Genre(name='Drama', categories={category_movie.id})
+        inner = InMemoryGenreRepository(genres=[genre])
+        genre_repository = CachedGenreRepository(inner)
+        category_repository = CachedCategoryRepository(InMemoryCategoryRepository(categories=[category_movie]))
+        genre_repository.get_row(genre.id, ('categories',))
+
+        # As the ORM repository does when a category is deleted.
+        inner.update(Genre(id=genre.id, name='Drama'))
+        category_repository.delete(category_movie.id)
+
+        assert genre_repository.get_row(genre.id, ('categories',)) == (set(),)
+
+
+class TestLRUCache:
+    def test_least_recently_used_id_is_dropped_first(self):
+        rows = LRUCache(maxsize=2, timeout=60)
+        rows.set('a', 'fields', 1)
+        rows.set('b', 'fields', 2)
+        rows.get('a', 'fields')
+
+        rows.set('c', 'fields', 3)
+
+        assert (rows.get('a', 'fields'), rows.get('b', 'fields'), rows.get('c', 'fields')) == (1, None, 3)
+
+    def test_expired_entries_are_not_served(self):
+        rows = LRUCache(maxsize=2, timeout=0)
+        rows.set('a', 'fields', 1)
+
+        assert rows.get('a', 'fields') is None
+        assert len(rows) == 0
+
+    def test_value_loaded_before_an_eviction_is_not_stored(self):
+        rows = LRUCache(maxsize=2, timeout=60)
+        generation = rows.generation
+
+        rows.evict(['a'])
+        rows.set('a', 'fields', 'stale', generation)
+
+        assert rows.get('a', 'fields') is None
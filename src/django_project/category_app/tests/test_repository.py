@@ -1,7 +1,17 @@
+import uuid
+from functools import partial
+
 import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from src.django_project._shared.bulk import chunked
+from src.django_project._shared.sqlite3.base import DatabaseWrapper
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.category_app.models import Category as CategoryModel
+from src.core._shared.pagination import PageCursor
 from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryFilter
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
 
 
 @pytest.mark.django_db
@@ -22,4 +32,158 @@ class TestSave:
         assert category_db.id == category.id
         assert category_db.name == category.name
         assert category_db.description == category.description
-        assert category_db.is_active == category.is_active
\ No newline at end of file
+        assert category_db.is_active == category.is_active
+
+@pytest.mark.django_db
+class TestExistingIds:
+    def test_return_only_ids_saved_in_database_with_a_single_query(self, django_assert_num_queries):
+        movie = Category(name='Movie')
+        documentary = Category(name='Documentary')
+        repository = DjangoORMCategoryRepository()
+        repository.save(movie)
+        repository.save(documentary)
+        missing_id = uuid.uuid4()
+
+        with django_assert_num_queries(1):
+            existing_ids = repository.existing_ids({movie.id, missing_id})
+
+        assert existing_ids == {movie.id}
+
+    def test_when_no_ids_are_given_then_do_not_query(self, django_assert_num_queries):
+        repository = DjangoORMCategoryRepository()
+
+        with django_assert_num_queries(0):
+            assert repository.existing_ids(set()) == set()
+
+
+@pytest.mark.django_db
+class TestBulkOperations:
+    def test_save_update_and_delete_many_categories(self, monkeypatch):
+        # Small chunks so that the batching path is exercised.
+        monkeypatch.setattr('src.django_project.category_app.repository.chunked', partial(chunked, size=2))
+        repository = DjangoORMCategoryRepository()
+        categories = [Category(name=f'Category {index}') for index in range(5)]
+
+        repository.save_many(categories)
+        assert CategoryModel.objects.count() == 5
+
+        for category in categories:
+            category.deactivate()
+        repository.update_many(categories)
+        assert CategoryModel.objects.filter(is_active=False).count() == 5
+
+        repository.delete_many({category.id for category in categories[:3]})
+        assert set(CategoryModel.objects.values_list('id', flat=True)) == {
+            category.id for category in categories[3:]
+        }
+
+
+@pytest.mark.django_db
+class TestListFiltered:
+    def test_name_ordered_page_after_cursor_is_a_single_query(self, django_assert_num_queries):
+        repository = DjangoORMCategoryRepository()
+        for name in ['A', 'B', 'C', 'D']:
+            repository.save(Category(name=name))
+        first_page = repository.list(limit=2, order_by='name')
+
+        with django_assert_num_queries(1):
+            second_page = repository.list(
+                cursor=PageCursor(id=first_page[-1].id, field='name', value=first_page[-1].name), limit=2, order_by='name',
+            )
+
+        assert [category.name for category in first_page] == ['A', 'B']
+        assert [category.name for category in second_page] == ['C', 'D']
+
+    def test_in_memory_repository_pages_from_the_cursor_key(self):
+        categories = [Category(name=name) for name in ['A', 'B', 'C', 'D']]
+        repository = InMemoryCategoryRepository(categories=categories)
+        first_page = repository.list(limit=2, order_by='name')
+        repository.delete(first_page[-1].id)
+
+        second_page = repository.list(
+            cursor=PageCursor(id=first_page[-1].id, field='name', value=first_page[-1].name), limit=2, order_by='name',
+        )
+
+        assert [category.name for category in second_page] == ['C', 'D']
+
+    def test_in_memory_repository_matches_orm_ordering(self):
+        categories = [Category(name=name, is_active=name != 'B') for name in ['C', 'A', 'B', 'Ab']]
+        orm_repository = DjangoORMCategoryRepository()
+        orm_repository.save_many(categories)
+        in_memory_repository = InMemoryCategoryRepository(categories=categories)
+
+        for order_by in ['name', '-name', 'id', '-id']:
+            for filters in [None, CategoryFilter(is_active=True), CategoryFilter(name_prefix='A')]:
+                assert [category.id for category in in_memory_repository.list(filters=filters, order_by=order_by)] \
+                    == [category.id for category in orm_repository.list(filters=filters, order_by=order_by)]
+
+
+@pytest.mark.django_db
+class TestRows:
+    def test_list_rows_match_in_memory_projection(self):
+        categories = [
+            Category(name='Movie', description='Movies'),
+            Category(name='Documentary', is_active=False),
+        ]
+        repository = DjangoORMCategoryRepository()
+        repository.save_many(categories)
+        fields = ('id', 'name', 'description', 'is_active')
+
+        rows = repository.list_rows(fields, order_by='name', filters=CategoryFilter(search='o'))
+
+        assert rows == InMemoryCategoryRepository(categories).list_rows(
+            fields, order_by='name', filters=CategoryFilter(search='o'),
+        )
+        assert [row[1] for row in rows] == ['Documentary', 'Movie']
+
+    def test_get_row(self):
+        category = Category(name='Movie', description='Movies')
+        repository = DjangoORMCategoryRepository()
+        repository.save(category)
+
+        assert repository.get_row(category.id, ('name', 'is_active')) == ('Movie', True)
+        assert repository.get_row(uuid.uuid4(), ('name',)) is None
+
+
+@pytest.mark.django_db
+class TestGetMany:
+    def test_get_many_reads_every_id_in_one_query(self, django_assert_num_queries):
+        movie, documentary, series = Category(name='Movie'), Category(name='Documentary'), Category(name='Series')
+        repository = DjangoORMCategoryRepository()
+        repository.save_many([movie, documentary, series])
+
+        with django_assert_num_queries(1):
+            categories = repository.get_many({movie.id, series.id, uuid.uuid4()})
+
+        assert sorted(category.name for category in categories) == ['Movie', 'Series']
+
+    def test_get_rows_match_in_memory_projection(self, django_assert_num_queries):
+        categories = [Category(name='Movie'), Category(name='Documentary', is_active=False)]
+        repository = DjangoORMCategoryRepository()
+        repository.save_many(categories)
+        ids = {category.id for category in categories}
+        fields = ('id', 'name', 'is_active')
+
+        with django_assert_num_queries(1):
+            rows = repository.get_rows(ids, fields)
+
+        assert sorted(rows) == sorted(InMemoryCategoryRepository(categories).get_rows(ids, fields))
+
+
+@pytest.mark.django_db
+class TestSQLiteBackend:
+    def test_applies_pragmas_on_connect(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            assert cursor.fetchone()[0] == 5000
+            cursor.execute('PRAGMA synchronous')
+            assert cursor.fetchone()[0] == 1  # NORMAL
+
+    def test_atomic_begins_immediate_transactions(self):
+        assert connection.transaction_mode == 'IMMEDIATE'
+
+    def test_rejects_unknown_transaction_mode(self):
+        wrapper = DatabaseWrapper({**connection.settings_dict, 'OPTIONS': {'transaction_mode': 'LAZY'}})
+
+        with pytest.raises(ImproperlyConfigured):
+            wrapper.get_connection_params()
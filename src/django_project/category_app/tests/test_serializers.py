@@ -0,0 +1,94 @@
+import uuid
+
+import pytest
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from src.core._shared.pagination import ListOutputMeta, PageCursor
+from src.core.category.application.use_cases.get_category import GetCategoryResponse
+from src.core.category.application.use_cases.list_category import CategoryOutput, ListCategoryResponse
+from src.django_project._shared.converters import compile_converter
+from src.django_project._shared.renderers import ORJSONRenderer
+from src.django_project.category_app.serializers import (
+    ListCategoryResponseSerializer,
+    RetrieveCategoryResponseSerializer,
+    list_category_response,
+    retrieve_category_response,
+)
+
+
+def legacy_bytes(serializer_class, instance) -> bytes:
+    return JSONRenderer().render(serializer_class(instance=instance).data)
+
+
+class TestListCategoryResponse:
+    @pytest.mark.parametrize('next_cursor', [None, PageCursor(id=uuid.uuid4()).encode()])
+    def test_matches_serializer_byte_for_byte(self, next_cursor):
+        output = ListCategoryResponse(
+            data=[
+                CategoryOutput(id=uuid.uuid4(), name='Filme', description='Ação e aventura', is_active=True),
+                CategoryOutput(id=uuid.uuid4(), name='Line\u2028break "quoted" \\ \u2029', description='', is_active=False),
+                CategoryOutput(id=uuid.uuid4(), name='Emoji 🎬', description='tab\tnewline\n', is_active=True),
+            ],
+            meta=ListOutputMeta(next_cursor=next_cursor, page_size=3),
+        )
+
+        assert list_category_response(output) == ListCategoryResponseSerializer(instance=output).data
+        assert ORJSONRenderer().render(list_category_response(output)) == legacy_bytes(
+            ListCategoryResponseSerializer, output)
+
+    def test_empty_page(self):
+        output = ListCategoryResponse(data=[], meta=ListOutputMeta())
+
+        assert ORJSONRenderer().render(list_category_response(output)) == legacy_bytes(
+            ListCategoryResponseSerializer, output)
+
+
+class TestRetrieveCategoryResponse:
+    def test_matches_serializer_byte_for_byte(self):
+        output = GetCategoryResponse(id=uuid.uuid4(), name='Movie', description='Movie description', is_active=True)
+
+        assert ORJSONRenderer().render(retrieve_category_response(output)) == legacy_bytes(
+            RetrieveCategoryResponseSerializer, output)
+
+
+class TestCompileConverter:
+    def test_falls_back_to_field_representation(self):
+        class Output:
+            created_at = None
+            version = '3'
+            tags = ['a', None]
+
+        class OutputSerializer(serializers.Serializer):
+            created_at = serializers.DateTimeField()
+            version = serializers.IntegerField()
+            tags = serializers.ListField(child=serializers.CharField())
+
+        assert compile_converter(OutputSerializer)(Output()) == OutputSerializer(instance=Output()).data
+
+    def test_rejects_dotted_sources(self):
+        class OutputSerializer(serializers.Serializer):
+            name = serializers.CharField(source='category.name')
+
+        with pytest.raises(ValueError):
+            compile_converter(OutputSerializer)
+
+
+class TestORJSONRenderer:
+    @pytest.mark.parametrize('data', [
+        {'nested': {'list': [1, -2, True, False, None, 'ç']}},
+        [{'big': 2 ** 70}],
+        {1: 'non-string key'},
+    ])
+    def test_matches_json_renderer(self, data):
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_renders_none_as_empty_body(self):
+        assert ORJSONRenderer().render(None) == b''
+
+    def test_indented_output_uses_json_renderer(self):
+        data = {'name': 'Movie'}
+        context = {'indent': 4}
+
+        assert ORJSONRenderer().render(data, renderer_context=context) == JSONRenderer().render(
+            data, renderer_context=context)
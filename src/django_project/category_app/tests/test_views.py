@@ -1,10 +1,23 @@
+import json
 import uuid
+from datetime import timedelta
 import pytest
 
+from asgiref.sync import async_to_sync
+from django.db.models import F
+from django.test import AsyncClient, AsyncRequestFactory
 from rest_framework import status
 from rest_framework.test import APIClient
+from src.core._shared.pagination import PageCursor
+from src.core.category.application.use_cases.list_category import ListCategory
 from src.core.category.domain.category import Category
-from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.domain.genre import Genre
+from src.django_project._shared.streaming import ndjson_response
+from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.category_app.repository import CachedCategoryRepository, DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.container import IN_MEMORY_REPOSITORIES, Container, container
 
 
 @pytest.fixture
@@ -40,7 +53,7 @@ class TestListCategoryAPI:
         response = APIClient().get(url)
 
         expected_data = {
-            'data': [
+            'data': sorted([
                 {
                     "id": str(category_movie.id),
                     "name": category_movie.name,
@@ -53,12 +66,136 @@ class TestListCategoryAPI:
                     "description": category_documentary.description,
                     "is_active": category_documentary.is_active
                 }
-            ]
+            ], key=lambda category: category["id"]),
+            'meta': {
+                "next_cursor": None,
+                "page_size": 50,
+            }
         }
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == expected_data
 
+    def test_list_categories_paginated_by_cursor(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+        first, second = sorted([category_movie, category_documentary], key=lambda category: category.id)
+
+        url = '/api/categories/'
+        first_page = APIClient().get(url, {'page_size': 1})
+
+        assert first_page.status_code == status.HTTP_200_OK
+        assert [category["id"] for category in first_page.data["data"]] == [str(first.id)]
+        assert first_page.data["meta"] == {
+            "next_cursor": PageCursor(id=first.id).encode(),
+            "page_size": 1,
+        }
+
+        second_page = APIClient().get(url, {'page_size': 1, 'cursor': first_page.data["meta"]["next_cursor"]})
+
+        assert second_page.status_code == status.HTTP_200_OK
+        assert [category["id"] for category in second_page.data["data"]] == [str(second.id)]
+        assert second_page.data["meta"] == {
+            "next_cursor": None,
+            "page_size": 1,
+        }
+
+    def test_when_page_size_is_invalid_then_return_400(self) -> None:
+        url = '/api/categories/'
+        response = APIClient().get(url, {'page_size': 0})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_filter_by_is_active_and_name(self, category_repository: DjangoORMCategoryRepository) -> None:
+        for name, is_active in [('Movie', True), ('Movies', False), ('Documentary', True), ('Short movie', True)]:
+            category_repository.save(Category(name=name, is_active=is_active))
+        client = APIClient()
+        url = '/api/categories/'
+
+        def names(params: dict) -> list[str]:
+            response = client.get(url, {**params, 'order_by': 'name'})
+            assert response.status_code == status.HTTP_200_OK
+            return [category['name'] for category in response.data['data']]
+
+        assert names({'is_active': 'false'}) == ['Movies']
+        assert names({'name_prefix': 'Movie'}) == ['Movie', 'Movies']
+        assert names({'search': 'movie'}) == ['Movie', 'Movies', 'Short movie']
+        assert names({'search': 'movie', 'is_active': 'true'}) == ['Movie', 'Short movie']
+
+    def test_page_through_categories_ordered_by_name_descending(
+            self,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        for name in ['A', 'B', 'C']:
+            category_repository.save(Category(name=name))
+        client = APIClient()
+        url = '/api/categories/'
+
+        first_page = client.get(url, {'order_by': '-name', 'page_size': 2}).data
+        second_page = client.get(
+            url, {'order_by': '-name', 'page_size': 2, 'cursor': first_page['meta']['next_cursor']},
+        ).data
+
+        assert [category['name'] for category in first_page['data']] == ['C', 'B']
+        assert [category['name'] for category in second_page['data']] == ['A']
+        assert second_page['meta']['next_cursor'] is None
+
+    def test_keep_paging_after_the_cursor_row_is_deleted(
+            self,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        categories = {name: Category(name=name) for name in ['a', 'b', 'c', 'd']}
+        for category in categories.values():
+            category_repository.save(category)
+        client = APIClient()
+        url = '/api/categories/'
+
+        first_page = client.get(url, {'order_by': 'name', 'page_size': 2}).data
+        CategoryModel.objects.filter(id=categories['b'].id).delete()
+        second_page = client.get(
+            url, {'order_by': 'name', 'page_size': 2, 'cursor': first_page['meta']['next_cursor']},
+        ).data
+
+        assert [category['name'] for category in first_page['data']] == ['a', 'b']
+        assert [category['name'] for category in second_page['data']] == ['c', 'd']
+
+    def test_page_through_categories_ordered_by_created_at(
+            self,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        for name in ['A', 'B', 'C']:
+            category_repository.save(Category(name=name))
+        client = APIClient()
+        url = '/api/categories/'
+
+        first_page = client.get(url, {'order_by': 'created_at', 'page_size': 2}).data
+        second_page = client.get(
+            url, {'order_by': 'created_at', 'page_size': 2, 'cursor': first_page['meta']['next_cursor']},
+        ).data
+
+        assert len(first_page['data']) == 2
+        assert sorted(category['name'] for category in first_page['data'] + second_page['data']) == ['A', 'B', 'C']
+
+    @pytest.mark.parametrize('params', [
+        {'cursor': 'not-a-cursor'},
+        {'cursor': PageCursor(id=uuid.uuid4(), field='name', value='A').encode(), 'order_by': 'created_at'},
+    ])
+    def test_when_cursor_is_invalid_then_return_400(self, params: dict) -> None:
+        response = APIClient().get('/api/categories/', params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'cursor' in response.data
+
+    def test_when_order_by_is_invalid_then_return_400(self) -> None:
+        response = APIClient().get('/api/categories/', {'order_by': 'description'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
 
 @pytest.mark.django_db
 class TestRetrieveAPI:
@@ -308,6 +445,23 @@ class TestPartialUpdateAPI:
         assert updated_category.description == 'Movie description'
         assert updated_category.is_active is False
 
+    def test_keep_changes_made_outside_the_api(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        url = f'/api/categories/{category_movie.id}/'
+        container.repository(CategoryRepository).get_by_id(category_movie.id)
+
+        # e.g. the Django admin, or another worker process.
+        CategoryModel.objects.filter(id=category_movie.id).update(name='Films')
+        response = APIClient().patch(url, data={'is_active': False})
+
+        updated_category = category_repository.get_by_id(id=category_movie.id)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert (updated_category.name, updated_category.is_active) == ('Films', False)
+
     def test_when_category_doesnt_exist_return_404(self) -> None:
         url = f'/api/categories/{uuid.uuid4()}/'
         response = APIClient().patch(
@@ -318,3 +472,627 @@ class TestPartialUpdateAPI:
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestBulkAPI:
+    def test_create_update_and_delete_categories_in_one_request(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+
+        url = '/api/categories/bulk/'
+        response = APIClient().post(
+            url,
+            data={
+                'create': [
+                    {'name': 'Series', 'description': 'Series description'},
+                    {'name': 'Anime', 'description': 'Anime description', 'is_active': False},
+                ],
+                'update': [
+                    {
+                        'id': str(category_movie.id),
+                        'name': 'Movies',
+                        'description': 'Movies description',
+                        'is_active': False,
+                    },
+                ],
+                'delete': [str(category_documentary.id)],
+            }
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['created']) == 2
+        assert response.data['updated'] == [str(category_movie.id)]
+        assert response.data['deleted'] == [str(category_documentary.id)]
+        assert response.data['errors'] == []
+
+        categories = {category.name: category for category in category_repository.list()}
+        assert set(categories) == {'Series', 'Anime', 'Movies'}
+        assert categories['Anime'].is_active is False
+        assert categories['Movies'].description == 'Movies description'
+        assert categories['Movies'].is_active is False
+
+    def test_report_errors_per_item_and_apply_valid_items(
+            self,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        missing_id = uuid.uuid4()
+
+        url = '/api/categories/bulk/'
+        response = APIClient().post(
+            url,
+            data={
+                'create': [
+                    {'name': 'Series', 'description': 'Series description'},
+                    {'name': '', 'description': 'Blank name'},
+                    {'name': 'Anime', 'description': 'a' * 1025},
+                ],
+                'update': [
+                    {
+                        'id': str(missing_id),
+                        'name': 'Movies',
+                        'description': 'Movies description',
+                        'is_active': True,
+                    },
+                ],
+                'delete': ['invalid_id'],
+            }
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['created']) == 1
+        assert response.data['updated'] == []
+        assert response.data['deleted'] == []
+        assert response.data['errors'] == [
+            {'operation': 'create', 'index': 1, 'errors': {'name': ['This field may not be blank.']}},
+            {
+                'operation': 'create',
+                'index': 2,
+                'errors': {'non_field_errors': ['description cannot be longer than 1024']},
+            },
+            {
+                'operation': 'update',
+                'index': 0,
+                'errors': {'non_field_errors': [f'Category with id {missing_id} not found']},
+            },
+            {'operation': 'delete', 'index': 0, 'errors': {'id': ['Must be a valid UUID.']}},
+        ]
+        assert [category.name for category in category_repository.list()] == ['Series']
+
+
+@pytest.mark.django_db
+class TestExportAPI:
+    def test_stream_all_categories_as_ndjson(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+
+        url = '/api/categories/export/'
+        response = APIClient().get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Type'] == 'application/x-ndjson'
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        assert rows == sorted([
+            {
+                "id": str(category_movie.id),
+                "name": category_movie.name,
+                "description": category_movie.description,
+                "is_active": category_movie.is_active
+            },
+            {
+                "id": str(category_documentary.id),
+                "name": category_documentary.name,
+                "description": category_documentary.description,
+                "is_active": category_documentary.is_active
+            }
+        ], key=lambda category: category["id"])
+
+    def test_stream_blocks_lazily_under_asgi(self, category_repository: DjangoORMCategoryRepository) -> None:
+        for name in ['A', 'B', 'C']:
+            category_repository.save(Category(name=name))
+
+        async def export() -> tuple[bool, list[str]]:
+            response = await AsyncClient().get('/api/categories/export/')
+            return response.is_async, [
+                json.loads(line)['name'] async for block in response.streaming_content for line in block.splitlines()
+            ]
+
+        is_async, names = async_to_sync(export)()
+
+        assert is_async
+        assert sorted(names) == ['A', 'B', 'C']
+
+    def test_build_one_block_at_a_time_under_asgi(self) -> None:
+        consumed = []
+
+        def rows():
+            for index in range(5):
+                consumed.append(index)
+                yield {'index': index}
+
+        async def first_block(response) -> bytes:
+            return await anext(aiter(response.streaming_content))
+
+        request = AsyncRequestFactory().get('/api/categories/export/')
+        response = ndjson_response(request, rows(), chunk_size=2)
+
+        assert async_to_sync(first_block)(response) == b'{"index": 0}\n{"index": 1}\n'
+        assert consumed == [0, 1]
+
+
+@pytest.mark.django_db
+class TestGetManyAPI:
+    def test_return_requested_categories_in_order_with_one_read(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository,
+            django_assert_max_num_queries,
+    ) -> None:
+        category_repository.save_many([category_movie, category_documentary])
+        missing_id = uuid.uuid4()
+        ids = [category_documentary.id, missing_id, category_movie.id]
+
+        # The two change state queries of the ETag, then one read for every id.
+        with django_assert_max_num_queries(3):
+            response = APIClient().get('/api/categories/', {'ids': ','.join(map(str, ids))})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            'data': [
+                {
+                    'id': str(category_documentary.id),
+                    'name': 'Documentary',
+                    'description': 'Documentary description',
+                    'is_active': True,
+                },
+                {
+                    'id': str(category_movie.id),
+                    'name': 'Movie',
+                    'description': 'Movie description',
+                    'is_active': True,
+                },
+            ],
+            'not_found': [str(missing_id)],
+        }
+
+    def test_ids_can_be_repeated_parameters(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save_many([category_movie, category_documentary])
+
+        response = APIClient().get(
+            f'/api/categories/?ids={category_movie.id}&ids={category_documentary.id}',
+        )
+
+        assert [category['name'] for category in response.json()['data']] == ['Movie', 'Documentary']
+
+    @pytest.mark.parametrize('ids', ['', 'not-a-uuid', ','.join(str(uuid.uuid4()) for _ in range(501))])
+    def test_return_400_for_invalid_ids(self, ids: str) -> None:
+        response = APIClient().get('/api/categories/', {'ids': ids})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestCategoryGenresAPI:
+    def test_list_ids_of_genres_using_the_category(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save_many([category_movie, category_documentary])
+        genre_repository = DjangoORMGenreRepository()
+        romance = Genre(name='Romance', categories={category_movie.id})
+        drama = Genre(name='Drama', categories={category_movie.id, category_documentary.id})
+        genre_repository.save_many([romance, drama, Genre(name='Comedy')])
+
+        response = APIClient().get(f'/api/categories/{category_movie.id}/genres/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {'data': sorted([str(romance.id), str(drama.id)])}
+
+    def test_genre_written_through_api_shows_up(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        url = f'/api/categories/{category_movie.id}/genres/'
+        assert client.get(url).json() == {'data': []}
+
+        created = client.post(
+            '/api/genres/', data={'name': 'Romance', 'category_ids': [str(category_movie.id)]}, format='json',
+        )
+
+        assert client.get(url).json() == {'data': [created.data['id']]}
+
+    def test_return_404_when_category_does_not_exist(self) -> None:
+        response = APIClient().get(f'/api/categories/{uuid.uuid4()}/genres/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestConditionalGetAPI:
+    def test_list_returns_etag_and_last_modified(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+
+        response = APIClient().get('/api/categories/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'].startswith('"category-1-')
+        assert 'Last-Modified' in response
+
+    def test_no_last_modified_before_the_first_write(self) -> None:
+        response = APIClient().get('/api/categories/')
+
+        assert response['ETag'] == '"category-0-0"'
+        assert 'Last-Modified' not in response
+
+    def test_return_304_when_etag_matches(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        url = f'/api/categories/{category_movie.id}/'
+        etag = client.get(url)['ETag']
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+
+    def test_return_304_when_not_modified_since(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        last_modified = client.get('/api/categories/')['Last-Modified']
+
+        response = client.get('/api/categories/', HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_write_through_api_changes_etag(self) -> None:
+        client = APIClient()
+        etag = client.get('/api/categories/')['ETag']
+
+        client.post('/api/categories/', data={'name': 'Movie', 'description': 'Movie description'})
+        response = client.get('/api/categories/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+        assert len(response.data['data']) == 1
+
+    @pytest.mark.parametrize('write, names', [
+        # As the admin does: save() stamps updated_at, delete() leaves no tombstone.
+        (lambda category: rename(category, 'Films'), ['Films']),
+        (lambda category: CategoryModel.objects.filter(id=category.id).delete(), []),
+    ])
+    def test_write_outside_the_api_changes_etag(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+            write,
+            names: list[str],
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        etag = client.get('/api/categories/')['ETag']
+
+        write(category_movie)
+        response = client.get('/api/categories/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+        assert [category['name'] for category in response.data['data']] == names
+        assert client.get('/api/categories/', HTTP_IF_NONE_MATCH=response['ETag']).status_code == (
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+    def test_detail_written_outside_the_api_is_not_served_from_memory(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        url = f'/api/categories/{category_movie.id}/'
+        etag = client.get(url)['ETag']
+
+        rename(category_movie, 'Films')
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['data']['name'] == 'Films'
+
+    def test_async_detail_written_outside_the_api_is_not_served_from_memory(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        url = f'/api/async/categories/{category_movie.id}/'
+        async_to_sync(AsyncClient().get)(url)
+
+        rename(category_movie, 'Films')
+        response = async_to_sync(AsyncClient().get)(url)
+
+        assert response.json()['data']['name'] == 'Films'
+
+
+def rename(category: Category, name: str) -> None:
+    model = CategoryModel.objects.get(id=category.id)
+    model.name = name
+    model.save()
+
+
+@pytest.mark.django_db
+class TestChangesAPI:
+    @pytest.fixture(autouse=True)
+    def no_feed_lag(self, settings) -> None:
+        settings.CHANGE_FEED_LAG = 0
+
+    def test_keep_a_change_committed_after_a_later_stamped_one(
+            self,
+            settings,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        settings.CHANGE_FEED_LAG = 60
+        client = APIClient()
+        # B is stamped after A, but A's transaction commits after a client synced B.
+        category_b = Category(name='B')
+        category_repository.save(category_b)
+        first_sync = client.get('/api/categories/changes/').data
+        category_a = Category(name='A')
+        category_repository.save(category_a)
+        CategoryModel.objects.filter(id=category_a.id).update(
+            updated_at=CategoryModel.objects.get(id=category_b.id).updated_at - timedelta(seconds=1),
+        )
+
+        # A minute later both are past the lag.
+        CategoryModel.objects.update(updated_at=F('updated_at') - timedelta(seconds=60))
+        second_sync = client.get('/api/categories/changes/').data
+
+        assert first_sync['data'] == []
+        assert first_sync['meta']['next_token'] is None
+        assert [row['name'] for row in second_sync['data']] == ['A', 'B']
+
+    def test_first_sync_returns_every_category(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+
+        response = APIClient().get('/api/categories/changes/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {row['id'] for row in response.data['data']} == {str(category_movie.id), str(category_documentary.id)}
+        assert all(row['version'] == 1 for row in response.data['data'])
+        assert response.data['deleted'] == []
+        assert response.data['meta']['next_token'] is not None
+        assert response.data['meta']['has_more'] is False
+
+    def test_return_only_changes_and_tombstones_since_token(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+        client = APIClient()
+        token = client.get('/api/categories/changes/').data['meta']['next_token']
+
+        client.patch(f'/api/categories/{category_movie.id}/', data={'name': 'Movies'})
+        client.delete(f'/api/categories/{category_documentary.id}/')
+        response = client.get('/api/categories/changes/', {'since': token})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [(row['id'], row['name'], row['version']) for row in response.data['data']] == [
+            (str(category_movie.id), 'Movies', 2),
+        ]
+        assert [tombstone['id'] for tombstone in response.data['deleted']] == [str(category_documentary.id)]
+
+        response = client.get('/api/categories/changes/', {'since': response.data['meta']['next_token']})
+        assert response.data['data'] == []
+        assert response.data['deleted'] == []
+
+    def test_page_through_changes(self, category_repository: DjangoORMCategoryRepository) -> None:
+        for name in ['A', 'B', 'C']:
+            category_repository.save(Category(name=name))
+        client = APIClient()
+
+        first_page = client.get('/api/categories/changes/', {'page_size': 2}).data
+        second_page = client.get(
+            '/api/categories/changes/', {'page_size': 2, 'since': first_page['meta']['next_token']},
+        ).data
+
+        assert len(first_page['data']) == 2
+        assert first_page['meta']['has_more'] is True
+        assert len(second_page['data']) == 1
+        assert second_page['meta']['has_more'] is False
+
+    def test_return_400_for_invalid_token(self) -> None:
+        response = APIClient().get('/api/categories/changes/', {'since': 'not-a-token'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'since': ['Invalid change token.']}
+
+
+@pytest.mark.django_db
+class TestMetricsAPI:
+    def test_requests_are_counted_per_route(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        client.get('/api/categories/')
+        client.get(f'/api/categories/{uuid.uuid4()}/')
+
+        response = client.get('/metrics')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+        body = response.content.decode()
+        assert 'http_requests_total{route="category-list",method="GET",status="200"} 1.0' in body
+        assert 'http_requests_total{route="category-detail",method="GET",status="404"} 1.0' in body
+        assert 'http_request_duration_seconds_count{route="category-list",method="GET"} 1' in body
+
+    def test_records_queries_issued_by_the_request(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        APIClient().get('/api/categories/')
+
+        body = APIClient().get('/metrics').content.decode()
+
+        assert 'http_request_db_queries_bucket{route="category-list",method="GET",le="0.0"} 0' in body
+        assert 'http_request_db_queries_count{route="category-list",method="GET"} 1' in body
+
+    def test_records_serializer_time(self) -> None:
+        APIClient().post('/api/categories/', data={'name': 'Movie'}, format='json')
+
+        body = APIClient().get('/metrics').content.decode()
+
+        line = next(line for line in body.splitlines() if line.startswith(
+            'http_request_serializer_seconds_total{route="category-list",method="POST"}'
+        ))
+        assert float(line.split()[-1]) > 0
+
+    def test_metrics_are_only_served_to_allowed_peers(self, settings) -> None:
+        settings.METRICS_ALLOWED_IPS = ['10.0.0.5']
+
+        assert APIClient().get('/metrics').status_code == status.HTTP_403_FORBIDDEN
+        assert APIClient().get('/metrics', REMOTE_ADDR='10.0.0.5').status_code == status.HTTP_200_OK
+
+    def test_server_timing_header_is_opt_in(self, settings) -> None:
+        assert 'Server-Timing' not in APIClient().get('/api/categories/')
+
+        settings.METRICS_SERVER_TIMING = True
+        response = APIClient().get('/api/categories/')
+
+        assert response['Server-Timing'].startswith('db;dur=')
+        assert 'serializer;dur=' in response['Server-Timing']
+        assert 'total;dur=' in response['Server-Timing']
+
+
+@pytest.mark.django_db
+class TestAsyncAPI:
+    def test_list_categories(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+
+        response = async_to_sync(AsyncClient().get)('/api/async/categories/', {'order_by': 'name'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [category['name'] for category in response.json()['data']] == ['Documentary', 'Movie']
+        assert response['ETag'].startswith('"category-')
+
+    def test_list_matches_sync_endpoint(
+            self,
+            category_movie: Category,
+            category_documentary: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+
+        response = async_to_sync(AsyncClient().get)('/api/async/categories/', {'page_size': 1})
+
+        assert response.json() == json.loads(APIClient().get('/api/categories/?page_size=1').content)
+
+    def test_retrieve_category(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+
+        response = async_to_sync(AsyncClient().get)(f'/api/async/categories/{category_movie.id}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['data']['name'] == 'Movie'
+
+    def test_return_404_when_category_does_not_exist(self) -> None:
+        response = async_to_sync(AsyncClient().get)(f'/api/async/categories/{uuid.uuid4()}/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_return_400_for_invalid_query(self) -> None:
+        response = async_to_sync(AsyncClient().get)('/api/async/categories/', {'page_size': 0})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'page_size' in response.json()
+
+    def test_queries_are_recorded_in_metrics(
+            self,
+            category_movie: Category,
+            category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        async_to_sync(AsyncClient().get)(f'/api/async/categories/{category_movie.id}/')
+
+        body = APIClient().get('/metrics').content.decode()
+
+        # The two change state queries of the ETag and the row.
+        assert 'http_request_db_queries_bucket{route="async-category-detail",method="GET",le="2.0"} 0' in body
+        assert 'http_request_db_queries_bucket{route="async-category-detail",method="GET",le="5.0"} 1' in body
+
+
+class TestContainer:
+    def test_use_cases_are_built_once_and_share_repositories(self) -> None:
+        container = Container()
+
+        use_case = container.use_case(ListCategory)
+
+        assert container.use_case(ListCategory) is use_case
+        assert use_case.repository is container.repository(CategoryRepository)
+        assert isinstance(use_case.repository, CachedCategoryRepository)
+        assert isinstance(use_case.repository.repository, DjangoORMCategoryRepository)
+
+    def test_api_runs_on_in_memory_repositories_without_a_database(self) -> None:
+        with container.override(IN_MEMORY_REPOSITORIES):
+            created = APIClient().post('/api/categories/', {'name': 'Movie', 'description': 'Movie description'})
+            response = APIClient().get('/api/categories/')
+
+        assert created.status_code == status.HTTP_201_CREATED
+        assert [category['id'] for category in response.data['data']] == [created.data['id']]
+        assert isinstance(container.repository(CategoryRepository).repository, DjangoORMCategoryRepository)
@@ -1,5 +1,7 @@
 from uuid import UUID
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.status import (
@@ -10,73 +12,130 @@ from rest_framework.status import (
     HTTP_404_NOT_FOUND,
 )
 
-from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.core.category.application.use_cases.list_category_changes import ListCategoryChanges, ListCategoryChangesRequest
+from src.django_project._shared.bulk import (
+    BulkRequestSerializer,
+    BulkResponseSerializer,
+    bulk_item_errors,
+    validate_bulk_items,
+)
+from src.django_project._shared.conditional import conditional_on, conditional_view
+from src.django_project._shared.metrics import serializer_timer
+from src.django_project._shared.streaming import EXPORT_CHUNK_SIZE, ndjson_response
+from src.django_project.container import container
+from src.core.category.application.use_cases.bulk_category import (
+    BulkCreateCategory,
+    BulkCreateCategoryRequest,
+    BulkDeleteCategory,
+    BulkDeleteCategoryRequest,
+    BulkUpdateCategory,
+    BulkUpdateCategoryItem,
+    BulkUpdateCategoryRequest,
+)
 from src.core.category.application.use_cases.create_category import CreateCategory, CreateCategoryRequest
+from src.core.category.application.use_cases.export_category import ExportCategory, ExportCategoryRequest
 from src.core.category.application.use_cases.delete_category import DeleteCategory, DeleteCategoryRequest
 from src.core.category.application.use_cases.list_category import (
     ListCategory,
     ListCategoryRequest,
 )
+from src.core.category.application.use_cases.get_many_category import GetManyCategories, GetManyCategoriesRequest
 from src.core.category.application.use_cases.get_category import (
     GetCategory,
     GetCategoryRequest
 )
 from src.core.category.application.exceptions import CategoryNotFound
 from src.core.category.application.use_cases.update_category import UpdateCategory, UpdateCategoryRequest
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.application.use_cases.list_genres_by_category import ListGenresByCategory
+from src.core.genre.domain.genre_repository import GenreRepository
 from src.django_project.category_app.serializers import (
     CreateCategoryRequestSerializer,
     CreateCategoryResponseSerializer,
     DeleteCategoryRequestSerializer,
-    ListCategoryResponseSerializer,
+    GetManyCategoriesRequestSerializer,
+    ListCategoryChangesRequestSerializer,
+    ListCategoryChangesResponseSerializer,
+    ListCategoryRequestSerializer,
     PartialUpdateRequestSerializer,
     RetrieveCategoryRequestSerializer,
-    RetrieveCategoryResponseSerializer,
     UpdateCategoryRequestSerializer,
+    category_genres_response,
+    category_response,
+    get_many_category_response,
+    list_category_response,
+    retrieve_category_response,
 )
 
 
 class CategoryViewSet(viewsets.ViewSet):
+    @conditional_on(CategoryRepository)
     def list(self, request: Request) -> Response:
-        input = ListCategoryRequest()
-        use_case = ListCategory(repository=DjangoORMCategoryRepository())
-        output = use_case.execute(input)
+        # ?ids=a,b,c reads those ids in one round trip instead of listing.
+        if 'ids' in request.query_params:
+            return self._get_many(request)
+
+        request_serializer = ListCategoryRequestSerializer(data=request.query_params)
+        with serializer_timer():
+            request_serializer.is_valid(raise_exception=True)
 
-        serializer = ListCategoryResponseSerializer(instance=output)
+        input = ListCategoryRequest(**request_serializer.validated_data)
+        use_case = container.use_case(ListCategory)
+        output = use_case.execute(input)
 
         return Response(
             status=HTTP_200_OK,
-            data =serializer.data
+            data=list_category_response(output),
         )
     
+    @conditional_on(CategoryRepository)
     def retrieve(self, request: Request, pk=None) -> Response:
         serializer = RetrieveCategoryRequestSerializer(data={'id':pk})
-        serializer.is_valid(raise_exception=True)        
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
         
         input = GetCategoryRequest(**serializer.validated_data)
-        use_case = GetCategory(repository=DjangoORMCategoryRepository())
+        use_case = container.use_case(GetCategory)
 
         try:
             output = use_case.execute(request=input)
         except CategoryNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
         
-        response_serializer = RetrieveCategoryResponseSerializer(instance=output)
         return Response(
             status=HTTP_200_OK,
-            data=response_serializer.data
+            data=retrieve_category_response(output),
         )
     
+    def _get_many(self, request: Request) -> Response:
+        request_serializer = GetManyCategoriesRequestSerializer(data=request.query_params)
+        with serializer_timer():
+            request_serializer.is_valid(raise_exception=True)
+
+        input = GetManyCategoriesRequest(**request_serializer.validated_data)
+        use_case = container.use_case(GetManyCategories)
+        output = use_case.execute(input)
+
+        return Response(
+            status=HTTP_200_OK,
+            data=get_many_category_response(output),
+        )
+
     def create(self, request: Request) -> Response:
         serializer = CreateCategoryRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
 
         input = CreateCategoryRequest(**serializer.validated_data)
-        use_case = CreateCategory(repository=DjangoORMCategoryRepository())
+        use_case = container.use_case(CreateCategory)
         output = use_case.execute(request=input)
 
+        with serializer_timer():
+            data = CreateCategoryResponseSerializer(output).data
+
         return Response(
             status=HTTP_201_CREATED,
-            data=CreateCategoryResponseSerializer(output).data,
+            data=data,
         )
 
     def update(self, request: Request, pk=None) -> Response:
@@ -86,10 +145,11 @@ class CategoryViewSet(viewsets.ViewSet):
                 'id':pk,
             }
         )
-        serializer.is_valid(raise_exception=True)
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
 
         input = UpdateCategoryRequest(**serializer.validated_data)
-        use_case = UpdateCategory(repository=DjangoORMCategoryRepository())
+        use_case = container.use_case(UpdateCategory)
         try:
             output = use_case.execute(request=input)
         except CategoryNotFound:
@@ -99,10 +159,11 @@ class CategoryViewSet(viewsets.ViewSet):
 
     def destroy(self, request: Request, pk=None) -> Response:
         serializer = DeleteCategoryRequestSerializer(data={'id':pk})
-        serializer.is_valid(raise_exception=True)
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
 
         input = DeleteCategoryRequest(**serializer.validated_data)
-        use_case = DeleteCategory(repository=DjangoORMCategoryRepository())
+        use_case = container.use_case(DeleteCategory)
 
         try:
             use_case.execute(request=input)
@@ -118,14 +179,140 @@ class CategoryViewSet(viewsets.ViewSet):
                 'id':pk
             }
         )
-        serializer.is_valid(raise_exception=True)
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
 
         input = UpdateCategoryRequest(**serializer.validated_data)
-        use_case = UpdateCategory(DjangoORMCategoryRepository())
+        use_case = container.use_case(UpdateCategory)
         
         try:
             use_case.execute(request=input)
         except CategoryNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
         
-        return Response(status=HTTP_204_NO_CONTENT)
\ No newline at end of file
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request: Request) -> Response:
+        serializer = BulkRequestSerializer(data=request.data)
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
+
+        create_positions, create_items, create_errors = validate_bulk_items(
+            CreateCategoryRequestSerializer, serializer.validated_data['create'], operation='create')
+        created = container.use_case(BulkCreateCategory).execute(
+            BulkCreateCategoryRequest(items=[CreateCategoryRequest(**item) for item in create_items])
+        )
+
+        update_positions, update_items, update_errors = validate_bulk_items(
+            UpdateCategoryRequestSerializer, serializer.validated_data['update'], operation='update')
+        updated = container.use_case(BulkUpdateCategory).execute(
+            BulkUpdateCategoryRequest(items=[BulkUpdateCategoryItem(**item) for item in update_items])
+        )
+
+        delete_positions, delete_items, delete_errors = validate_bulk_items(
+            DeleteCategoryRequestSerializer,
+            [{'id': id} for id in serializer.validated_data['delete']],
+            operation='delete',
+        )
+        deleted = container.use_case(BulkDeleteCategory).execute(
+            BulkDeleteCategoryRequest(ids=[item['id'] for item in delete_items])
+        )
+
+        response_serializer = BulkResponseSerializer(instance={
+            'created': created.ids,
+            'updated': updated.ids,
+            'deleted': deleted.ids,
+            'errors': [
+                *create_errors, *bulk_item_errors(created.errors, create_positions, operation='create'),
+                *update_errors, *bulk_item_errors(updated.errors, update_positions, operation='update'),
+                *delete_errors, *bulk_item_errors(deleted.errors, delete_positions, operation='delete'),
+            ],
+        })
+
+        with serializer_timer():
+            data = response_serializer.data
+
+        return Response(
+            status=HTTP_200_OK,
+            data=data,
+        )
+
+    # The genres using a category come from the genre aggregate, so the ETag follows the
+    # genre version (which also moves on category writes, see CachedGenreRepository).
+    @action(detail=True, methods=['get'])
+    @conditional_on(GenreRepository, CategoryRepository)
+    def genres(self, request: Request, pk=None) -> Response:
+        serializer = RetrieveCategoryRequestSerializer(data={'id': pk})
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
+
+        input = ListGenresByCategory.Input(category_id=serializer.validated_data['id'])
+        use_case = container.use_case(ListGenresByCategory)
+
+        try:
+            output = use_case.execute(input)
+        except CategoryNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+
+        return Response(
+            status=HTTP_200_OK,
+            data=category_genres_response(output),
+        )
+
+    @action(detail=False, methods=['get'])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        use_case = container.use_case(ExportCategory)
+        output = use_case.execute(request=ExportCategoryRequest(chunk_size=EXPORT_CHUNK_SIZE))
+
+        return ndjson_response(request, map(category_response, output))
+
+    @action(detail=False, methods=['get'])
+    def changes(self, request: Request) -> Response:
+        request_serializer = ListCategoryChangesRequestSerializer(data=request.query_params)
+        with serializer_timer():
+            request_serializer.is_valid(raise_exception=True)
+
+        input = ListCategoryChangesRequest(**request_serializer.validated_data)
+        use_case = container.use_case(ListCategoryChanges)
+        output = use_case.execute(input)
+        serializer = ListCategoryChangesResponseSerializer(instance=output)
+
+        with serializer_timer():
+            data = serializer.data
+
+        return Response(
+            status=HTTP_200_OK,
+            data=data,
+        )
+
+
+# Async read endpoints for ASGI deployments: the same use cases and converters as the
+# viewset, awaiting the repository instead of blocking a worker thread on it.
+
+@conditional_view(CategoryRepository)
+async def async_list(request: HttpRequest) -> HttpResponse:
+    request_serializer = ListCategoryRequestSerializer(data=request.GET)
+    with serializer_timer():
+        is_valid = request_serializer.is_valid()
+    if not is_valid:
+        return JsonResponse(request_serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+    input = ListCategoryRequest(**request_serializer.validated_data)
+    use_case = container.use_case(ListCategory)
+    output = await use_case.aexecute(input)
+
+    return JsonResponse(list_category_response(output), status=HTTP_200_OK)
+
+
+@conditional_view(CategoryRepository)
+async def async_retrieve(request: HttpRequest, pk: UUID) -> HttpResponse:
+    input = GetCategoryRequest(id=pk)
+    use_case = container.use_case(GetCategory)
+
+    try:
+        output = await use_case.aexecute(request=input)
+    except CategoryNotFound:
+        return HttpResponse(status=HTTP_404_NOT_FOUND)
+
+    return JsonResponse(retrieve_category_response(output), status=HTTP_200_OK)
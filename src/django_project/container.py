@@ -0,0 +1,113 @@
+"""Repositories and use cases, built once per process and shared by every request.
+
+    container.use_case(ListCategory)          # ListCategory(repository=<cached ORM repository>)
+    container.repository(CategoryRepository)  # the same repository instance
+
+Use cases are wired from the annotations of their ``__init__``: each parameter typed
+with a repository interface gets that repository. Repositories are the backend
+implementation (``ORM_REPOSITORIES`` or ``IN_MEMORY_REPOSITORIES``) wrapped in its
+decorator (``CACHED_REPOSITORIES``), which is also where instrumentation would go.
+
+Sharing the instances is safe because none of them keeps per-request state: the ORM
+repositories use the current thread's connection (and its transaction) when a query
+runs, and the cached repositories look up the current thread's cache handle on use.
+
+Tests and benchmarks swap the backend in one place::
+
+    with container.override(IN_MEMORY_REPOSITORIES):
+        ...
+"""
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Mapping, TypeVar, get_type_hints
+
+from src.core.castmembers.domain.castmember_repository import CastMemberRepository
+from src.core.castmembers.infra.in_memory_castmember_repository import InMemoryCastMemberRepository
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
+from src.core.genre.domain.genre_repository import GenreRepository
+from src.core.genre.infra.in_memory_category_repository import InMemoryGenreRepository
+from src.django_project.castmember_app.repository import CachedCastMemberRepository, DjangoORMCastMemberRepository
+from src.django_project.category_app.repository import CachedCategoryRepository, DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import CachedGenreRepository, DjangoORMGenreRepository
+
+
+T = TypeVar('T')
+
+# Repository interface -> factory of the backend implementation.
+Repositories = Mapping[type, Callable[[], Any]]
+# Repository interface -> decorator taking the backend implementation.
+Decorators = Mapping[type, Callable[[Any], Any]]
+
+ORM_REPOSITORIES: Repositories = {
+    CategoryRepository: DjangoORMCategoryRepository,
+    GenreRepository: DjangoORMGenreRepository,
+    CastMemberRepository: DjangoORMCastMemberRepository,
+}
+
+IN_MEMORY_REPOSITORIES: Repositories = {
+    CategoryRepository: InMemoryCategoryRepository,
+    GenreRepository: InMemoryGenreRepository,
+    CastMemberRepository: InMemoryCastMemberRepository,
+}
+
+CACHED_REPOSITORIES: Decorators = {
+    CategoryRepository: CachedCategoryRepository,
+    GenreRepository: CachedGenreRepository,
+    CastMemberRepository: CachedCastMemberRepository,
+}
+
+
+class Container:
+    def __init__(
+        self,
+        repositories: Repositories = ORM_REPOSITORIES,
+        decorators: Decorators = CACHED_REPOSITORIES,
+    ) -> None:
+        self.repositories = dict(repositories)
+        self.decorators = dict(decorators)
+        self._instances: dict[type, Any] = {}
+        # Reentrant: building a use case builds its repositories.
+        self._lock = threading.RLock()
+
+    def repository(self, repository_type: type[T]) -> T:
+        return self._get(repository_type, self._build_repository)
+
+    def use_case(self, use_case_class: type[T]) -> T:
+        return self._get(use_case_class, self._build_use_case)
+
+    @contextmanager
+    def override(self, repositories: Repositories) -> Iterator['Container']:
+        """Use other backends for ``repositories`` (and everything built on them) inside
+        the block, e.g. the in-memory ones."""
+        with self._lock:
+            previous = self.repositories, self._instances
+            self.repositories = {**self.repositories, **repositories}
+            self._instances = {}
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self.repositories, self._instances = previous
+
+    def _get(self, key: type, build: Callable[[type], Any]) -> Any:
+        instance = self._instances.get(key)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(key)
+                if instance is None:
+                    instance = self._instances[key] = build(key)
+        return instance
+
+    def _build_repository(self, repository_type: type) -> Any:
+        repository = self.repositories[repository_type]()
+        decorator = self.decorators.get(repository_type)
+        return decorator(repository) if decorator is not None else repository
+
+    def _build_use_case(self, use_case_class: type) -> Any:
+        hints = get_type_hints(use_case_class.__init__)
+        hints.pop('return', None)
+        return use_case_class(**{name: self.repository(hint) for name, hint in hints.items()})
+
+
+container = Container()
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0003_category_category_name_id_idx_and_more'),
+        ('genre_app', '0002_genretombstone_genre_created_at_genre_updated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='genre',
+            index=models.Index(fields=['name', 'id'], name='genre_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='genre',
+            index=models.Index(fields=['is_active', 'id'], name='genre_is_active_id_idx'),
+        ),
+    ]
@@ -10,9 +10,30 @@ class Genre(models.Model):
     name = models.CharField(max_length=255)
     categories = models.ManyToManyField('category_app.Category', related_name='genres')
     is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    version = models.PositiveIntegerField(default=1)
 
     class Meta:
         db_table = 'genre'
+        indexes = [
+            # Keyset index for the change feed, ordered by (updated_at, id).
+            models.Index(fields=['updated_at', 'id'], name='genre_updated_at_id_idx'),
+            # Filtered and name-ordered listings, paged by id.
+            models.Index(fields=['name', 'id'], name='genre_name_id_idx'),
+            models.Index(fields=['is_active', 'id'], name='genre_is_active_id_idx'),
+        ]
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+
+class GenreTombstone(models.Model):
+    id = models.UUIDField(primary_key=True)
+    deleted_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'genre_tombstone'
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='genre_tomb_deleted_idx'),
+        ]
@@ -1,17 +1,34 @@
-
-
+import hashlib
+from collections import defaultdict
+from typing import Iterable, Iterator, Sequence
 from uuid import UUID
 from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 
+from src.core._shared.changes import ChangeState, ChangeToken, Tombstone
+from src.core._shared.pagination import PageCursor
 from src.core.genre.domain.genre import Genre
-from src.core.genre.domain.genre_repository import GenreRepository
-from src.django_project.genre_app.models import Genre as GenreORM
+from src.core.genre.domain.events import GenreCategoriesChanged, GenreDeleted
+from src.core.genre.domain.genre_repository import GenreFilter, GenreRepository
+from src.django_project._shared.bulk import chunked
+from src.django_project._shared.cached_repository import CachedRepository
+from src.django_project._shared.changes import change_state, changed_after
+from src.django_project._shared.listing import filter_by_name, keyset_page
+from src.django_project.genre_app.models import Genre as GenreORM, GenreTombstone
+from src.django_project.outbox_app import outbox
 
 
 class DjangoORMGenreRepository(GenreRepository):
     def save(self, genre: Genre):
-        genre_model = GenreModelMapper.to_model(genre)
-        genre_model.save()
+        GenreCategory = GenreORM.categories.through
+        # The genre row has to exist before its through rows reference it.
+        with transaction.atomic():
+            GenreModelMapper.to_model(genre).save()
+            GenreCategory.objects.bulk_create([
+                GenreCategory(genre_id=genre.id, category_id=category_id) for category_id in genre.categories
+            ])
+            outbox.add(genre.pull_events())
     
     def get_by_id(self, id: UUID) -> Genre | None:
         try:
@@ -19,50 +36,359 @@ class DjangoORMGenreRepository(GenreRepository):
         except GenreORM.DoesNotExist:
             return None
         
-        return GenreModelMapper.to_entity(genre_model)
+        categories_by_genre = self._categories_by_genre(genre_ids=[genre_model.id])
+        return GenreModelMapper.to_entity(genre_model, categories=categories_by_genre[genre_model.id])
 
     def delete(self, id: UUID) -> None:
-        GenreORM.objects.filter(id=id).delete()
+        with transaction.atomic():
+            self._delete([id])
 
-    def list(self) -> list[Genre]:
-        return [
-            GenreModelMapper.to_entity(genre_model) for genre_model in GenreORM.objects.all()
-        ]
+    def _delete(self, ids: Iterable[UUID]) -> None:
+        GenreORM.objects.filter(id__in=ids).delete()
+        GenreTombstone.objects.bulk_create(
+            [GenreTombstone(id=id, deleted_at=timezone.now()) for id in ids],
+            ignore_conflicts=True,
+        )
+        outbox.add(GenreDeleted(aggregate_id=id) for id in ids)
 
-    def update(self, genre: Genre) -> None:
+    def save_many(self, genres: list[Genre]) -> None:
+        GenreCategory = GenreORM.categories.through
+        for chunk in chunked(genres):
+            with transaction.atomic():
+                GenreORM.objects.bulk_create([
+                    GenreORM(id=genre.id, name=genre.name, is_active=genre.is_active) for genre in chunk
+                ])
+                GenreCategory.objects.bulk_create(self._category_pairs(chunk))
+                outbox.add(event for genre in chunk for event in genre.pull_events())
+
+    def update_many(self, genres: list[Genre]) -> None:
+        GenreCategory = GenreORM.categories.through
+        for chunk in chunked(genres):
+            updated_at = timezone.now()
+            with transaction.atomic():
+                GenreORM.objects.bulk_update(
+                    [
+                        GenreORM(
+                            id=genre.id,
+                            name=genre.name,
+                            is_active=genre.is_active,
+                            updated_at=updated_at,
+                            version=F('version') + 1,
+                        ) for genre in chunk
+                    ],
+                    fields=['name', 'is_active', 'updated_at', 'version'],
+                )
+                GenreCategory.objects.filter(genre_id__in=[genre.id for genre in chunk]).delete()
+                GenreCategory.objects.bulk_create(self._category_pairs(chunk))
+                outbox.add(event for genre in chunk for event in genre.pull_events())
+
+    def delete_many(self, ids: set[UUID]) -> None:
+        for chunk in chunked(list(ids)):
+            with transaction.atomic():
+                self._delete(chunk)
+
+    @staticmethod
+    def _category_pairs(genres: list[Genre]) -> list:
+        # Once per (genre, category): a genre repeated in the batch would otherwise
+        # break the unique constraint of the through table.
+        GenreCategory = GenreORM.categories.through
+        pairs = dict.fromkeys((genre.id, category_id) for genre in genres for category_id in genre.categories)
+        return [GenreCategory(genre_id=genre_id, category_id=category_id) for genre_id, category_id in pairs]
+
+    def existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        existing_ids = set()
+        for chunk in chunked(list(ids)):
+            existing_ids.update(GenreORM.objects.filter(id__in=chunk).values_list('id', flat=True))
+
+        return existing_ids
+
+    def genre_ids_for_categories(self, category_ids: set[UUID]) -> set[UUID]:
+        # Reads the through table alone, by its category_id index, without joining genre.
+        GenreCategory = GenreORM.categories.through
+        genre_ids = set()
+        for chunk in chunked(list(category_ids)):
+            genre_ids.update(
+                GenreCategory.objects.filter(category_id__in=chunk).values_list('genre_id', flat=True)
+            )
+
+        return genre_ids
+
+    def changes_since(self, since: ChangeToken | None, limit: int) -> tuple[list[Genre], list[Tombstone]]:
+        genre_models = list(
+            GenreORM.objects.filter(changed_after(since, 'updated_at')).order_by('updated_at', 'id')[:limit]
+        )
+        tombstones = GenreTombstone.objects.filter(
+            changed_after(since, 'deleted_at')
+        ).order_by('deleted_at', 'id')[:limit]
+
+        categories_by_genre = self._categories_by_genre(genre_ids=[genre_model.id for genre_model in genre_models])
+        return (
+            [
+                GenreModelMapper.to_entity(genre_model, categories=categories_by_genre[genre_model.id])
+                for genre_model in genre_models
+            ],
+            [Tombstone(id=tombstone.id, deleted_at=tombstone.deleted_at) for tombstone in tombstones],
+        )
+
+    def stream(self, chunk_size: int = 1000) -> Iterator[Genre]:
+        genre_models = GenreORM.objects.order_by('id').iterator(chunk_size=chunk_size)
+        for chunk in chunked(genre_models, size=chunk_size):
+            categories_by_genre = self._categories_by_genre(genre_ids=[genre_model.id for genre_model in chunk])
+            for genre_model in chunk:
+                yield GenreModelMapper.to_entity(genre_model, categories=categories_by_genre[genre_model.id])
+
+    def change_state(self) -> ChangeState:
+        return change_state(GenreORM.objects.all(), GenreTombstone.objects.all())
+
+    async def aget_by_id(self, id: UUID) -> Genre | None:
         try:
-            genre_model = GenreORM.objects.get(id=genre.id)
+            genre_model = await GenreORM.objects.aget(id=id)
         except GenreORM.DoesNotExist:
             return None
-        
+
+        categories_by_genre = await self._acategories_by_genre(genre_ids=[genre_model.id])
+        return GenreModelMapper.to_entity(genre_model, categories=categories_by_genre[genre_model.id])
+
+    async def alist(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: GenreFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[Genre]:
+        genre_models = [
+            genre_model async for genre_model in self._list_queryset(cursor, limit, filters, order_by)
+        ]
+        categories_by_genre = await self._acategories_by_genre(
+            genre_ids=self._listed_ids([genre_model.id for genre_model in genre_models], cursor, limit, filters)
+        )
+
+        return [
+            GenreModelMapper.to_entity(genre_model, categories=categories_by_genre[genre_model.id])
+            for genre_model in genre_models
+        ]
+
+    def get_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        values = GenreORM.objects.filter(id=id).values(*self._row_columns(fields)).first()
+        if values is None:
+            return None
+
+        categories_by_genre = self._categories_by_genre(genre_ids=[id]) if 'categories' in fields else defaultdict(set)
+        return self._to_row(values, fields, categories_by_genre)
+
+    def get_many(self, ids: set[UUID]) -> list[Genre]:
+        genres = []
+        for chunk in chunked(list(ids)):
+            genre_models = list(GenreORM.objects.filter(id__in=chunk))
+            categories_by_genre = self._categories_by_genre(genre_ids=[genre_model.id for genre_model in genre_models])
+            genres.extend(
+                GenreModelMapper.to_entity(genre_model, categories=categories_by_genre[genre_model.id])
+                for genre_model in genre_models
+            )
+
+        return genres
+
+    def get_rows(self, ids: set[UUID], fields: Sequence[str]) -> list[tuple]:
+        rows = []
+        for chunk in chunked(list(ids)):
+            chunk_rows = list(GenreORM.objects.filter(id__in=chunk).values(*self._row_columns(fields)))
+            categories_by_genre = defaultdict(set)
+            if 'categories' in fields:
+                categories_by_genre = self._categories_by_genre(genre_ids=[values['id'] for values in chunk_rows])
+            rows.extend(self._to_row(values, fields, categories_by_genre) for values in chunk_rows)
+
+        return rows
+
+    def list_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: GenreFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        rows = list(self._list_queryset(cursor, limit, filters, order_by).values(*self._row_columns(fields)))
+        categories_by_genre = defaultdict(set)
+        if 'categories' in fields:
+            categories_by_genre = self._categories_by_genre(
+                genre_ids=self._listed_ids([values['id'] for values in rows], cursor, limit, filters)
+            )
+
+        return [self._to_row(values, fields, categories_by_genre) for values in rows]
+
+    async def aget_row(self, id: UUID, fields: Sequence[str]) -> tuple | None:
+        values = await GenreORM.objects.filter(id=id).values(*self._row_columns(fields)).afirst()
+        if values is None:
+            return None
+
+        categories_by_genre = (
+            await self._acategories_by_genre(genre_ids=[id]) if 'categories' in fields else defaultdict(set)
+        )
+        return self._to_row(values, fields, categories_by_genre)
+
+    async def alist_rows(
+        self,
+        fields: Sequence[str],
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: GenreFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[tuple]:
+        rows = [
+            values async for values in self._list_queryset(cursor, limit, filters, order_by).values(*self._row_columns(fields))
+        ]
+        categories_by_genre = defaultdict(set)
+        if 'categories' in fields:
+            categories_by_genre = await self._acategories_by_genre(
+                genre_ids=self._listed_ids([values['id'] for values in rows], cursor, limit, filters)
+            )
+
+        return [self._to_row(values, fields, categories_by_genre) for values in rows]
+
+    def list(
+        self,
+        cursor: PageCursor | None = None,
+        limit: int | None = None,
+        filters: GenreFilter | None = None,
+        order_by: str | None = None,
+    ) -> list[Genre]:
+        genre_models = list(self._list_queryset(cursor, limit, filters, order_by))
+        categories_by_genre = self._categories_by_genre(
+            genre_ids=self._listed_ids([genre_model.id for genre_model in genre_models], cursor, limit, filters)
+        )
+
+        return [
+            GenreModelMapper.to_entity(genre_model, categories=categories_by_genre[genre_model.id])
+            for genre_model in genre_models
+        ]
+
+    def _list_queryset(self, cursor: PageCursor | None, limit: int | None, filters: GenreFilter | None, order_by: str | None):
+        queryset = GenreORM.objects.all()
+        if filters is not None:
+            if filters.is_active is not None:
+                queryset = queryset.filter(is_active=filters.is_active)
+            if filters.category_id is not None:
+                queryset = queryset.filter(categories__id=filters.category_id)
+            queryset = filter_by_name(queryset, name_prefix=filters.name_prefix, search=filters.search)
+        if cursor is not None or limit is not None or order_by is not None:
+            queryset = keyset_page(queryset, cursor, limit, order_by or 'id')
+
+        return queryset
+
+    @staticmethod
+    def _listed_ids(ids: Iterable[UUID], cursor: PageCursor | None, limit: int | None, filters: GenreFilter | None) -> Iterable[UUID] | None:
+        # Listing everything reads the whole through table; otherwise only the listed genres.
+        is_everything = filters is None and cursor is None and limit is None
+        return None if is_everything else ids
+
+    @staticmethod
+    def _row_columns(fields: Sequence[str]) -> set[str]:
+        # Categories come from the through table, keyed by the genre id.
+        return {'id', *fields} - {'categories'}
+
+    @staticmethod
+    def _to_row(values: dict, fields: Sequence[str], categories_by_genre: defaultdict[UUID, set[UUID]]) -> tuple:
+        return tuple(
+            categories_by_genre[values['id']] if field == 'categories' else values[field] for field in fields
+        )
+
+    def _categories_by_genre(self, genre_ids: Iterable[UUID] | None = None) -> defaultdict[UUID, set[UUID]]:
+        # Reads the (genre_id, category_id) pairs straight from the through table in a
+        # single query, so mapping N genres does not cost N extra category queries.
+        pairs = GenreORM.categories.through.objects.all()
+        if genre_ids is not None:
+            pairs = pairs.filter(genre_id__in=genre_ids)
+
+        categories_by_genre = defaultdict(set)
+        for genre_id, category_id in pairs.values_list('genre_id', 'category_id'):
+            categories_by_genre[genre_id].add(category_id)
+
+        return categories_by_genre
+
+    async def _acategories_by_genre(self, genre_ids: Iterable[UUID] | None = None) -> defaultdict[UUID, set[UUID]]:
+        pairs = GenreORM.categories.through.objects.all()
+        if genre_ids is not None:
+            pairs = pairs.filter(genre_id__in=genre_ids)
+
+        categories_by_genre = defaultdict(set)
+        async for genre_id, category_id in pairs.values_list('genre_id', 'category_id'):
+            categories_by_genre[genre_id].add(category_id)
+
+        return categories_by_genre
+
+    def update(self, genre: Genre) -> None:
+        GenreCategory = GenreORM.categories.through
         with transaction.atomic():
-            GenreORM.objects.filter(id=genre.id).update(
+            updated = GenreORM.objects.filter(id=genre.id).update(
                 name=genre.name,
-                is_active=genre.is_active
+                is_active=genre.is_active,
+                updated_at=timezone.now(),
+                version=F('version') + 1,
             )
+            events = genre.pull_events()
+            if not updated:
+                return None
 
-            genre_model.categories.set(genre.categories)
+            # Write only the pairs that changed since the genre was loaded (get_by_id), as
+            # recorded by its GenreCategoriesChanged events, and nothing when none did.
+            changes = self._categories_changed(events)
+            if changes is not None and changes.removed:
+                GenreCategory.objects.filter(genre_id=genre.id, category_id__in=changes.removed).delete()
+            if changes is not None and changes.added:
+                GenreCategory.objects.bulk_create(
+                    [GenreCategory(genre_id=genre.id, category_id=category_id) for category_id in changes.added],
+                    ignore_conflicts=True,
+                )
+            outbox.add(events)
+
+    @staticmethod
+    def _categories_changed(events: list) -> GenreCategoriesChanged | None:
+        # Events of other types can sit between them, so they have not all coalesced.
+        changes = None
+        for event in events:
+            if isinstance(event, GenreCategoriesChanged):
+                changes = event if changes is None else changes.merge(event)
+
+        return changes
+
+
+class CachedGenreRepository(CachedRepository, GenreRepository):
+    namespace = 'genre'
+    # Deleting a category removes it from the genres that used it.
+    depends_on = ('category',)
+
+    def __init__(self, repository: GenreRepository | None = None, **kwargs) -> None:
+        super().__init__(repository or DjangoORMGenreRepository(), **kwargs)
+
+    def genre_ids_for_categories(self, category_ids: set[UUID]) -> set[UUID]:
+        key = hashlib.md5(repr(sorted(category_ids)).encode()).hexdigest()
+        return self._cached(
+            f'genre_ids_for_categories:{key}', lambda: self.repository.genre_ids_for_categories(category_ids),
+        )
 
 
 class GenreModelMapper:
 
     @staticmethod
     def to_model(genre: Genre) -> GenreORM:
-        genre_model = GenreORM(
+        return GenreORM(
             id=genre.id,
             name=genre.name,
             is_active=genre.is_active
         )
-        genre_model.categories.set(genre.categories)
-
-        return genre_model
 
 
     @staticmethod
-    def to_entity(genre_model: GenreORM) -> Genre:
-        return Genre(
+    def to_entity(genre_model: GenreORM, categories: set[UUID] | None = None) -> Genre:
+        if categories is None:
+            categories = {category.id for category in genre_model.categories.all()}
+
+        return Genre.rehydrate(
             id=genre_model.id,
             name=genre_model.name,
             is_active=genre_model.is_active,
-            categories={category.id for category in genre_model.categories.all()}
+            categories=set(categories),
+            created_at=genre_model.created_at,
+            updated_at=genre_model.updated_at,
+            version=genre_model.version,
         )
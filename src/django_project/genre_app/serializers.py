@@ -1,5 +1,15 @@
 from rest_framework import serializers
 
+from src.django_project._shared.converters import compile_converter
+from src.django_project._shared.serializers import (
+    ChangesMetaSerializer,
+    ChangesRequestSerializer,
+    GetManyRequestSerializer,
+    ListOutputMetaSerializer,
+    ListRequestSerializer,
+    TombstoneSerializer,
+)
+
 
 class GenreOutputSerializer(serializers.Serializer):
     id = serializers.UUIDField()
@@ -8,8 +18,71 @@ class GenreOutputSerializer(serializers.Serializer):
     categories = serializers.ListField(child=serializers.UUIDField())
 
 
+class CategorySummarySerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255)
+    is_active = serializers.BooleanField()
+
+
+class ExpandedGenreOutputSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255)
+    is_active = serializers.BooleanField()
+    categories = CategorySummarySerializer(many=True)
+
+
+class ListGenreInputSerializer(ListRequestSerializer):
+    is_active = serializers.BooleanField(required=False, default=None, allow_null=True)
+    category_id = serializers.UUIDField(required=False, default=None)
+    expand = serializers.ChoiceField(choices=['categories'], required=False, default=None)
+
+
 class ListGenreOutputSerializer(serializers.Serializer):
     data = GenreOutputSerializer(many=True)
+    meta = ListOutputMetaSerializer()
+
+
+class ListExpandedGenreOutputSerializer(serializers.Serializer):
+    data = ExpandedGenreOutputSerializer(many=True)
+    meta = ListOutputMetaSerializer()
+
+
+class RetrieveGenreRequestSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    expand = serializers.ChoiceField(choices=['categories'], required=False, default=None)
+
+
+class RetrieveGenreOutputSerializer(serializers.Serializer):
+    data = GenreOutputSerializer(source='*')
+
+
+class RetrieveExpandedGenreOutputSerializer(serializers.Serializer):
+    data = ExpandedGenreOutputSerializer(source='*')
+
+
+class GetManyGenresInputSerializer(GetManyRequestSerializer):
+    pass
+
+
+class GetManyGenresOutputSerializer(serializers.Serializer):
+    data = GenreOutputSerializer(many=True)
+    not_found = serializers.ListField(child=serializers.UUIDField())
+
+
+class GenreChangeSerializer(GenreOutputSerializer):
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+    version = serializers.IntegerField()
+
+
+class ListGenreChangesInputSerializer(ChangesRequestSerializer):
+    pass
+
+
+class ListGenreChangesOutputSerializer(serializers.Serializer):
+    data = GenreChangeSerializer(many=True)
+    deleted = TombstoneSerializer(many=True)
+    meta = ChangesMetaSerializer()
 
 
 class SetField(serializers.ListField):
@@ -35,4 +108,13 @@ class UpdateGenreRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     name = serializers.CharField(max_length=255)
     is_active = serializers.BooleanField(default=True)
-    categories = SetField(child=serializers.UUIDField())
\ No newline at end of file
+    categories = SetField(child=serializers.UUIDField())
+
+
+# Read responses are built with precompiled converters, see _shared/converters.py.
+genre_output = compile_converter(GenreOutputSerializer)
+list_genre_output = compile_converter(ListGenreOutputSerializer)
+list_expanded_genre_output = compile_converter(ListExpandedGenreOutputSerializer)
+retrieve_genre_output = compile_converter(RetrieveGenreOutputSerializer)
+retrieve_expanded_genre_output = compile_converter(RetrieveExpandedGenreOutputSerializer)
+get_many_genre_output = compile_converter(GetManyGenresOutputSerializer)
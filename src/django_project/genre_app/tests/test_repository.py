@@ -1,6 +1,9 @@
+from uuid import uuid4
 
 import pytest
+from django.db import connection
 
+from src.core._shared.changes import ChangeToken
 from src.core.category.domain.category import Category
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.core.genre.domain.genre import Genre
@@ -41,3 +44,260 @@ class TestSave:
         related_category = genre_model.categories.first()
         assert related_category.id == category.id
         assert related_category.name == 'Movie'
+
+
+@pytest.mark.django_db
+class TestUpdate:
+    def test_update_scalars_diff_categories_and_write_events_in_four_statements(self, django_assert_num_queries):
+        genre_repository = DjangoORMGenreRepository()
+        category_repository = DjangoORMCategoryRepository()
+        kept, removed, added = Category(name='Kept'), Category(name='Removed'), Category(name='Added')
+        category_repository.save_many([kept, removed, added])
+        genre = Genre(name='Romance', categories={kept.id, removed.id})
+        genre_repository.save(genre)
+
+        genre.change_name('Drama')
+        genre.deactivate()
+        genre.remove_category(removed.id)
+        genre.add_category(added.id)
+        # UPDATE genre, DELETE the removed pair, INSERT the added one and INSERT the events
+        # into the outbox, inside one savepoint.
+        with django_assert_num_queries(6) as captured:
+            genre_repository.update(genre)
+
+        assert [query['sql'].split()[0] for query in captured.captured_queries] == [
+            'SAVEPOINT', 'UPDATE', 'DELETE', 'INSERT', 'INSERT', 'RELEASE',
+        ]
+        genre_model = GenreORM.objects.get(id=genre.id)
+        assert genre_model.name == 'Drama'
+        assert genre_model.is_active is False
+        assert genre_model.version == 2
+        assert {category.id for category in genre_model.categories.all()} == {kept.id, added.id}
+
+    def test_update_without_category_changes_leaves_the_pairs_alone(self, django_assert_num_queries):
+        genre_repository = DjangoORMGenreRepository()
+        movie = Category(name='Movie')
+        DjangoORMCategoryRepository().save(movie)
+        genre_repository.save(Genre(name='Romance', categories={movie.id}))
+        genre = genre_repository.get_by_id(GenreORM.objects.get().id)
+
+        genre.change_name('Drama')
+        genre.change_categories({movie.id})
+        with django_assert_num_queries(4) as captured:
+            genre_repository.update(genre)
+
+        assert [query['sql'].split()[0] for query in captured.captured_queries] == [
+            'SAVEPOINT', 'UPDATE', 'INSERT', 'RELEASE',
+        ]
+        assert genre_repository.get_by_id(genre.id).categories == {movie.id}
+
+    def test_update_only_deletes_the_removed_pairs(self, django_assert_num_queries):
+        genre_repository = DjangoORMGenreRepository()
+        category_repository = DjangoORMCategoryRepository()
+        kept, removed = Category(name='Kept'), Category(name='Removed')
+        category_repository.save_many([kept, removed])
+        genre_repository.save(Genre(name='Romance', categories={kept.id, removed.id}))
+        genre = genre_repository.get_by_id(GenreORM.objects.get().id)
+
+        genre.remove_category(removed.id)
+        with django_assert_num_queries(5) as captured:
+            genre_repository.update(genre)
+
+        assert [query['sql'].split()[0] for query in captured.captured_queries] == [
+            'SAVEPOINT', 'UPDATE', 'DELETE', 'INSERT', 'RELEASE',
+        ]
+        assert genre_repository.get_by_id(genre.id).categories == {kept.id}
+
+    def test_update_many_writes_each_category_pair_once(self):
+        genre_repository = DjangoORMGenreRepository()
+        movie = Category(name='Movie')
+        DjangoORMCategoryRepository().save(movie)
+        genre = Genre(name='Romance')
+        genre_repository.save(genre)
+
+        genre_repository.update_many([
+            Genre(id=genre.id, name='Drama', categories={movie.id}),
+            Genre(id=genre.id, name='Drama', categories={movie.id}),
+        ])
+
+        assert genre_repository.get_by_id(genre.id).categories == {movie.id}
+
+    def test_clear_categories(self):
+        genre_repository = DjangoORMGenreRepository()
+        category_repository = DjangoORMCategoryRepository()
+        movie = Category(name='Movie')
+        category_repository.save(movie)
+        genre = Genre(name='Romance', categories={movie.id})
+        genre_repository.save(genre)
+
+        genre.clean_categories()
+        genre_repository.update(genre)
+
+        assert genre_repository.get_by_id(genre.id).categories == set()
+
+    def test_update_missing_genre_does_nothing(self):
+        genre_repository = DjangoORMGenreRepository()
+
+        genre_repository.update(Genre(name='Romance'))
+
+        assert GenreORM.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestList:
+    def test_list_genres_with_categories(self):
+        genre_repository = DjangoORMGenreRepository()
+        category_repository = DjangoORMCategoryRepository()
+
+        movie = Category(name='Movie')
+        documentary = Category(name='Documentary')
+        category_repository.save(movie)
+        category_repository.save(documentary)
+
+        romance = Genre(name='Romance', categories={movie.id, documentary.id})
+        drama = Genre(name='Drama')
+        genre_repository.save(romance)
+        genre_repository.save(drama)
+
+        genres = {genre.id: genre for genre in genre_repository.list()}
+
+        assert genres[romance.id].categories == {movie.id, documentary.id}
+        assert genres[drama.id].categories == set()
+
+    @pytest.mark.parametrize('page', [{}, {'limit': 10}])
+    def test_list_uses_constant_number_of_queries(self, django_assert_num_queries, page):
+        genre_repository = DjangoORMGenreRepository()
+        category_repository = DjangoORMCategoryRepository()
+
+        categories = [Category(name=f'Category {index}') for index in range(3)]
+        for category in categories:
+            category_repository.save(category)
+
+        for index in range(5):
+            genre_repository.save(
+                Genre(name=f'Genre {index}', categories={category.id for category in categories})
+            )
+
+        with django_assert_num_queries(2):
+            genres = genre_repository.list(**page)
+
+        assert len(genres) == 5
+        assert all(len(genre.categories) == 3 for genre in genres)
+
+
+@pytest.mark.django_db
+class TestGenreIdsForCategories:
+    def test_return_genres_using_any_of_the_categories(self, django_assert_num_queries):
+        genre_repository = DjangoORMGenreRepository()
+        movie, documentary, series = Category(name='Movie'), Category(name='Documentary'), Category(name='Series')
+        DjangoORMCategoryRepository().save_many([movie, documentary, series])
+        romance = Genre(name='Romance', categories={movie.id})
+        drama = Genre(name='Drama', categories={movie.id, documentary.id})
+        genre_repository.save_many([romance, drama, Genre(name='Comedy', categories={series.id})])
+
+        with django_assert_num_queries(1):
+            genre_ids = genre_repository.genre_ids_for_categories({movie.id, documentary.id})
+
+        assert genre_ids == {romance.id, drama.id}
+        assert genre_repository.genre_ids_for_categories({uuid4()}) == set()
+
+    @pytest.mark.skipif(connection.vendor != 'sqlite', reason='reads the SQLite query plan')
+    def test_lookup_searches_the_through_table_by_category_index(self):
+        queryset = GenreORM.categories.through.objects.filter(category_id__in=[uuid4()]).values_list('genre_id')
+
+        assert 'SEARCH genre_categories USING INDEX' in queryset.explain()
+
+
+@pytest.mark.django_db
+class TestRows:
+    def test_list_rows_match_projected_entities(self, django_assert_num_queries):
+        genre_repository = DjangoORMGenreRepository()
+        movie = Category(name='Movie')
+        DjangoORMCategoryRepository().save(movie)
+        romance = Genre(name='Romance', categories={movie.id})
+        drama = Genre(name='Drama')
+        genre_repository.save(romance)
+        genre_repository.save(drama)
+        fields = ('id', 'name', 'is_active', 'categories')
+
+        with django_assert_num_queries(2):
+            rows = genre_repository.list_rows(fields, limit=10, order_by='name')
+
+        assert rows == [
+            (drama.id, 'Drama', True, set()),
+            (romance.id, 'Romance', True, {movie.id}),
+        ]
+
+    def test_list_rows_without_categories_skip_through_table(self, django_assert_num_queries):
+        genre_repository = DjangoORMGenreRepository()
+        drama = Genre(name='Drama')
+        genre_repository.save(drama)
+
+        with django_assert_num_queries(1):
+            rows = genre_repository.list_rows(('name', 'id'))
+
+        assert rows == [('Drama', drama.id)]
+
+    def test_get_row(self):
+        genre_repository = DjangoORMGenreRepository()
+        movie = Category(name='Movie')
+        DjangoORMCategoryRepository().save(movie)
+        romance = Genre(name='Romance', categories={movie.id})
+        genre_repository.save(romance)
+
+        assert genre_repository.get_row(romance.id, ('name', 'categories')) == ('Romance', {movie.id})
+        assert genre_repository.get_row(uuid4(), ('name',)) is None
+
+    def test_get_many_and_get_rows_read_genres_with_their_categories_in_two_queries(self, django_assert_num_queries):
+        genre_repository = DjangoORMGenreRepository()
+        movie = Category(name='Movie')
+        DjangoORMCategoryRepository().save(movie)
+        romance = Genre(name='Romance', categories={movie.id})
+        drama = Genre(name='Drama')
+        genre_repository.save_many([romance, drama, Genre(name='Comedy')])
+
+        with django_assert_num_queries(2):
+            genres = genre_repository.get_many({romance.id, drama.id, uuid4()})
+        with django_assert_num_queries(2):
+            rows = genre_repository.get_rows({romance.id, drama.id}, ('name', 'categories'))
+
+        assert {genre.name: genre.categories for genre in genres} == {'Romance': {movie.id}, 'Drama': set()}
+        assert sorted(rows) == [('Drama', set()), ('Romance', {movie.id})]
+
+
+@pytest.mark.django_db
+class TestChangesSince:
+    @pytest.fixture(autouse=True)
+    def no_feed_lag(self, settings) -> None:
+        settings.CHANGE_FEED_LAG = 0
+
+    def test_deleting_a_category_marks_its_genres_as_changed(self):
+        genre_repository = DjangoORMGenreRepository()
+        category_repository = DjangoORMCategoryRepository()
+
+        movie = Category(name='Movie')
+        category_repository.save(movie)
+        romance = Genre(name='Romance', categories={movie.id})
+        drama = Genre(name='Drama')
+        genre_repository.save(romance)
+        genre_repository.save(drama)
+        changed, _ = genre_repository.changes_since(None, limit=10)
+        since = ChangeToken(timestamp=changed[-1].updated_at, id=changed[-1].id)
+
+        category_repository.delete(movie.id)
+        changed, deleted = genre_repository.changes_since(since, limit=10)
+
+        assert changed == [Genre(id=romance.id, name='Romance', categories=set())]
+        assert changed[0].version == 2
+        assert deleted == []
+
+    def test_deleted_genre_leaves_a_tombstone(self):
+        genre_repository = DjangoORMGenreRepository()
+        romance = Genre(name='Romance')
+        genre_repository.save(romance)
+
+        genre_repository.delete(romance.id)
+        changed, deleted = genre_repository.changes_since(None, limit=10)
+
+        assert changed == []
+        assert [tombstone.id for tombstone in deleted] == [romance.id]
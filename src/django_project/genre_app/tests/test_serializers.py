@@ -0,0 +1,22 @@
+import uuid
+
+from rest_framework.renderers import JSONRenderer
+
+from src.core._shared.pagination import ListOutputMeta, PageCursor
+from src.core.genre.application.use_cases.list_genre import GenreOutput, ListGenre
+from src.django_project._shared.renderers import ORJSONRenderer
+from src.django_project.genre_app.serializers import ListGenreOutputSerializer, list_genre_output
+
+
+class TestListGenreOutput:
+    def test_matches_serializer_byte_for_byte(self):
+        output = ListGenre.Output(
+            data=[
+                GenreOutput(id=uuid.uuid4(), name='Drama', is_active=True, categories={uuid.uuid4(), uuid.uuid4()}),
+                GenreOutput(id=uuid.uuid4(), name='Comédia', is_active=False, categories=set()),
+            ],
+            meta=ListOutputMeta(next_cursor=PageCursor(id=uuid.uuid4()).encode(), page_size=2),
+        )
+
+        assert ORJSONRenderer().render(list_genre_output(output)) == JSONRenderer().render(
+            ListGenreOutputSerializer(instance=output).data)
@@ -1,6 +1,9 @@
+import json
 import pytest
 from uuid import UUID, uuid4
 
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -54,6 +57,30 @@ def genre_repository() -> DjangoORMGenreRepository:
     return DjangoORMGenreRepository()
 
 
+@pytest.mark.django_db
+class TestGetManyAPI:
+    def test_return_requested_genres_with_their_categories(
+        self,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_romance: Genre,
+        genre_drama: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save_many([category_movie, category_documentary])
+        genre_repository.save_many([genre_romance, genre_drama])
+
+        response = APIClient().get('/api/genres/', {'ids': f'{genre_romance.id},{genre_drama.id}'})
+
+        assert response.status_code == status.HTTP_200_OK
+        romance, drama = response.json()['data']
+        assert (romance['name'], drama['name']) == ('Romance', 'Drama')
+        assert set(romance['categories']) == {str(category_movie.id), str(category_documentary.id)}
+        assert drama['categories'] == []
+        assert response.json()['not_found'] == []
+
+
 @pytest.mark.django_db
 class TestListAPI:
     def test_list_genres_and_categories(
@@ -75,17 +102,146 @@ class TestListAPI:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["data"]
-        assert response.data["data"][0]["id"] == str(genre_romance.id)
-        assert response.data["data"][0]["name"] == "Romance"
-        assert response.data["data"][0]["is_active"] is True
-        assert set(response.data["data"][0]["categories"]) == {
+        genres = {genre["id"]: genre for genre in response.data["data"]}
+        assert [genre["id"] for genre in response.data["data"]] == sorted(genres)
+        assert genres[str(genre_romance.id)]["name"] == "Romance"
+        assert genres[str(genre_romance.id)]["is_active"] is True
+        assert set(genres[str(genre_romance.id)]["categories"]) == {
             str(category_documentary.id),
             str(category_movie.id),
         }
-        assert response.data["data"][1]["id"] == str(genre_drama.id)
-        assert response.data["data"][1]["name"] == "Drama"
-        assert response.data["data"][1]["is_active"] is True
-        assert response.data["data"][1]["categories"] == []
+        assert genres[str(genre_drama.id)]["name"] == "Drama"
+        assert genres[str(genre_drama.id)]["is_active"] is True
+        assert genres[str(genre_drama.id)]["categories"] == []
+        assert response.data["meta"] == {
+            "next_cursor": None,
+            "page_size": 50,
+        }
+
+    @pytest.mark.parametrize("genre_count", [2, 20])
+    def test_expand_categories_in_a_fixed_number_of_queries(
+        self,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+        django_assert_num_queries,
+        genre_count: int,
+    ) -> None:
+        category_repository.save_many([category_movie, category_documentary])
+        genre_repository.save_many([
+            Genre(name=f"Genre {index:02}", categories={category_movie.id, category_documentary.id})
+            for index in range(genre_count)
+        ])
+
+        # The change state of genres and categories (two queries each) for the ETag, then
+        # genres, their through-table rows and one read for every category of the page.
+        with django_assert_num_queries(7):
+            response = APIClient().get("/api/genres/", {"expand": "categories", "order_by": "name"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["data"]) == genre_count
+        assert response.json()["data"][0]["categories"] == [
+            {"id": str(category_documentary.id), "name": "Documentary", "is_active": True},
+            {"id": str(category_movie.id), "name": "Movie", "is_active": True},
+        ]
+
+    def test_reject_unknown_expand(self) -> None:
+        response = APIClient().get("/api/genres/", {"expand": "videos"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestRetrieveAPI:
+    def test_return_genre_with_category_ids(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        romance = Genre(name="Romance", categories={category_movie.id})
+        genre_repository.save(romance)
+
+        response = APIClient().get(f"/api/genres/{romance.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "data": {
+                "id": str(romance.id),
+                "name": "Romance",
+                "is_active": True,
+                "categories": [str(category_movie.id)],
+            },
+        }
+
+    def test_expand_categories(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        romance = Genre(name="Romance", categories={category_movie.id})
+        genre_repository.save(romance)
+
+        response = APIClient().get(f"/api/genres/{romance.id}/", {"expand": "categories"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["categories"] == [
+            {"id": str(category_movie.id), "name": "Movie", "is_active": True},
+        ]
+
+    def test_return_updated_genre_after_it_was_served_from_memory(
+        self,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        romance = Genre(name="Romance")
+        genre_repository.save(romance)
+        url = f"/api/genres/{romance.id}/"
+        APIClient().get(url)
+
+        APIClient().put(url, {"name": "Drama", "is_active": False, "categories": []}, format="json")
+        response = APIClient().get(url)
+
+        assert (response.json()["data"]["name"], response.json()["data"]["is_active"]) == ("Drama", False)
+
+    def test_when_genre_does_not_exist_then_return_404(self) -> None:
+        response = APIClient().get(f"/api/genres/{uuid4()}/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_when_pk_is_invalid_then_return_400(self) -> None:
+        response = APIClient().get("/api/genres/invalid-pk/")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestFilterAPI:
+    def test_filter_genres_by_category(
+        self,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_romance: Genre,
+        genre_drama: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+        genre_repository.save(genre_romance)
+        genre_repository.save(genre_drama)
+
+        response = APIClient().get("/api/genres/", {"category_id": str(category_movie.id)})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [genre["id"] for genre in response.data["data"]] == [str(genre_romance.id)]
+        assert set(response.data["data"][0]["categories"]) == {
+            str(category_movie.id),
+            str(category_documentary.id),
+        }
 
 
 @pytest.mark.django_db
@@ -251,4 +407,238 @@ class TestUpdateAPI:
         }
         response = APIClient().put(url, data=data)
 
-        assert response.status_code == status.HTTP_404_NOT_FOUND
\ No newline at end of file
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.django_db
+class TestBulkAPI:
+    def test_create_update_and_delete_genres_in_one_request(
+        self,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_romance: Genre,
+        genre_drama: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+        genre_repository.save(genre_romance)
+        genre_repository.save(genre_drama)
+        missing_category_id = uuid4()
+
+        url = "/api/genres/bulk/"
+        response = APIClient().post(
+            url,
+            data={
+                "create": [
+                    {"name": "Action", "category_ids": [str(category_movie.id)]},
+                    {"name": "Horror", "category_ids": [str(missing_category_id)]},
+                ],
+                "update": [
+                    {
+                        "id": str(genre_romance.id),
+                        "name": "Romantic Comedy",
+                        "is_active": False,
+                        "categories": [str(category_documentary.id)],
+                    },
+                ],
+                "delete": [str(genre_drama.id)],
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["created"]) == 1
+        assert response.data["updated"] == [str(genre_romance.id)]
+        assert response.data["deleted"] == [str(genre_drama.id)]
+        assert response.data["errors"] == [
+            {
+                "operation": "create",
+                "index": 1,
+                "errors": {"non_field_errors": [f"Categories not found: {{UUID('{missing_category_id}')}}"]},
+            },
+        ]
+
+        created_genre = genre_repository.get_by_id(UUID(response.data["created"][0]))
+        assert created_genre.name == "Action"
+        assert created_genre.categories == {category_movie.id}
+
+        updated_genre = genre_repository.get_by_id(genre_romance.id)
+        assert updated_genre.name == "Romantic Comedy"
+        assert updated_genre.is_active is False
+        assert updated_genre.categories == {category_documentary.id}
+
+        assert genre_repository.get_by_id(genre_drama.id) is None
+
+    def test_reject_genre_repeated_in_update(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_romance: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        genre_romance.categories = {category_movie.id}
+        genre_repository.save(genre_romance)
+        item = {"id": str(genre_romance.id), "name": "Drama", "categories": [str(category_movie.id)]}
+
+        response = APIClient().post(
+            "/api/genres/bulk/",
+            data={"create": [{"name": "Action", "category_ids": []}], "update": [item, item], "delete": []},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["created"]) == 1
+        assert response.data["updated"] == []
+        assert [(error["operation"], error["index"]) for error in response.data["errors"]] == [
+            ("update", 0), ("update", 1),
+        ]
+        assert genre_repository.get_by_id(genre_romance.id).name == "Romance"
+
+
+@pytest.mark.django_db
+class TestExportAPI:
+    def test_stream_all_genres_with_categories_as_ndjson(
+        self,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_romance: Genre,
+        genre_drama: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+        genre_repository.save(genre_romance)
+        genre_repository.save(genre_drama)
+
+        url = "/api/genres/export/"
+        response = APIClient().get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = {
+            row["id"]: row
+            for row in map(json.loads, b"".join(response.streaming_content).splitlines())
+        }
+        assert set(rows) == {str(genre_romance.id), str(genre_drama.id)}
+        assert set(rows[str(genre_romance.id)]["categories"]) == {
+            str(category_movie.id),
+            str(category_documentary.id),
+        }
+        assert rows[str(genre_drama.id)] == {
+            "id": str(genre_drama.id),
+            "name": "Drama",
+            "is_active": True,
+            "categories": [],
+        }
+
+
+@pytest.mark.django_db
+class TestConditionalGetAPI:
+    def test_return_304_when_etag_matches(self) -> None:
+        client = APIClient()
+        etag = client.get('/api/genres/')['ETag']
+
+        response = client.get('/api/genres/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_category_write_changes_genre_etag(self) -> None:
+        client = APIClient()
+        etag = client.get('/api/genres/')['ETag']
+
+        client.post('/api/categories/', data={'name': 'Movie', 'description': 'Movie description'})
+        response = client.get('/api/genres/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+
+@pytest.fixture
+def staff_client(django_user_model) -> APIClient:
+    client = APIClient()
+    client.force_login(django_user_model.objects.create_user(username='staff', is_staff=True))
+    return client
+
+
+@pytest.mark.django_db
+class TestProfilingAPI:
+    def test_return_profile_report_instead_of_body(self, settings, staff_client) -> None:
+        settings.PROFILING_ENABLED = True
+
+        response = staff_client.get('/api/genres/', HTTP_X_PROFILE='1')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'].startswith('text/plain')
+        assert response['X-Profile-Status'] == '200'
+        assert b'function calls' in response.content
+
+    def test_write_profile_to_output_dir(self, settings, staff_client, tmp_path) -> None:
+        settings.PROFILING_ENABLED = True
+        settings.PROFILING_OUTPUT_DIR = str(tmp_path)
+
+        response = staff_client.get('/api/genres/?profile=1')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['data'] == []
+        assert (tmp_path / response['X-Profile-Report']).exists()
+
+    def test_ignore_flag_from_non_staff_users(self, settings) -> None:
+        settings.PROFILING_ENABLED = True
+
+        response = APIClient().get('/api/genres/', HTTP_X_PROFILE='1')
+
+        assert response['Content-Type'] == 'application/json'
+        assert 'X-Profile-Status' not in response
+
+    def test_ignore_flag_when_disabled(self, staff_client) -> None:
+        response = staff_client.get('/api/genres/', HTTP_X_PROFILE='1')
+
+        assert response['Content-Type'] == 'application/json'
+        assert 'X-Profile-Status' not in response
+
+
+@pytest.mark.django_db
+class TestAsyncListAPI:
+    def test_list_matches_sync_endpoint(
+        self,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_romance: Genre,
+        genre_drama: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+        genre_repository.save(genre_romance)
+        genre_repository.save(genre_drama)
+
+        response = async_to_sync(AsyncClient().get)("/api/async/genres/", {"order_by": "name"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [genre["name"] for genre in response.json()["data"]] == ["Drama", "Romance"]
+        expected = json.loads(APIClient().get("/api/genres/?order_by=name").content)
+        for genre in (*response.json()["data"], *expected["data"]):
+            genre["categories"] = sorted(genre["categories"])
+        assert response.json() == expected
+
+    def test_expand_categories_matches_sync_endpoint(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_romance: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        genre_repository.save(Genre(name="Romance", categories={category_movie.id}))
+        query = {"order_by": "name", "expand": "categories"}
+
+        response = async_to_sync(AsyncClient().get)("/api/async/genres/", query)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"][0]["categories"] == [
+            {"id": str(category_movie.id), "name": "Movie", "is_active": True},
+        ]
+        assert response.json() == APIClient().get("/api/genres/", query).json()
@@ -1,5 +1,6 @@
-from uuid import UUID
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.status import (
@@ -11,53 +12,128 @@ from rest_framework.status import (
 )
 
 
+from src.core.genre.application.use_cases.bulk_genre import BulkCreateGenre, BulkDeleteGenre, BulkUpdateGenre
+from src.core.genre.application.use_cases.export_genre import ExportGenre
 from src.core.genre.application.use_cases.update_genre import UpdateGenre
 from src.core.genre.application.use_cases.delete_genre import DeleteGenre
-from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.core.genre.application.use_cases.create_genre import CreateGenre
+from src.core.genre.application.use_cases.get_genre import GetGenre
 from src.core.genre.application.use_cases.list_genre import ListGenre
-from src.django_project.genre_app.repository import DjangoORMGenreRepository
-from src.django_project.genre_app.serializers import CreateGenreInputSerializer, CreateGenreOutputSerializer, DeleteGenreRequestSerializer, ListGenreOutputSerializer, UpdateGenreRequestSerializer
+from src.core.genre.application.use_cases.get_many_genre import GetManyGenres
+from src.core.genre.application.use_cases.list_genre_changes import ListGenreChanges
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.domain.genre_repository import GenreRepository
+from src.django_project._shared.bulk import (
+    BulkRequestSerializer,
+    BulkResponseSerializer,
+    bulk_item_errors,
+    validate_bulk_items,
+)
+from src.django_project._shared.conditional import conditional_on, conditional_view
+from src.django_project._shared.metrics import serializer_timer
+from src.django_project._shared.streaming import EXPORT_CHUNK_SIZE, ndjson_response
+from src.django_project.container import container
+from src.django_project.genre_app.serializers import (
+    CreateGenreInputSerializer,
+    CreateGenreOutputSerializer,
+    DeleteGenreRequestSerializer,
+    GetManyGenresInputSerializer,
+    ListGenreChangesInputSerializer,
+    ListGenreChangesOutputSerializer,
+    ListGenreInputSerializer,
+    RetrieveGenreRequestSerializer,
+    UpdateGenreRequestSerializer,
+    genre_output,
+    get_many_genre_output,
+    list_expanded_genre_output,
+    list_genre_output,
+    retrieve_expanded_genre_output,
+    retrieve_genre_output,
+)
 from src.core.genre.application.exceptions import GenreNotFound, InvalidGenre, RelatedCategoriesNotFound
 
 class GenreViewSet(viewsets.ViewSet):
+    @conditional_on(GenreRepository, CategoryRepository)
     def list(self, request: Request) -> Response:
-        input = ListGenre.Input()
-        use_case = ListGenre(repository=DjangoORMGenreRepository())
+        # ?ids=a,b,c reads those ids in one round trip instead of listing.
+        if 'ids' in request.query_params:
+            return self._get_many(request)
+
+        request_serializer = ListGenreInputSerializer(data=request.query_params)
+        with serializer_timer():
+            request_serializer.is_valid(raise_exception=True)
+
+        input = ListGenre.Input(**request_serializer.validated_data)
+        use_case = container.use_case(ListGenre)
         output: ListGenre.Output = use_case.execute(input)
-        serializer = ListGenreOutputSerializer(instance=output)
+        convert = list_expanded_genre_output if input.expand == 'categories' else list_genre_output
+
+        return Response(
+            status=HTTP_200_OK,
+            data=convert(output),
+        )
+
+    @conditional_on(GenreRepository, CategoryRepository)
+    def retrieve(self, request: Request, pk=None) -> Response:
+        serializer = RetrieveGenreRequestSerializer(data={**request.query_params.dict(), 'id': pk})
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
+
+        input = GetGenre.Input(**serializer.validated_data)
+        use_case = container.use_case(GetGenre)
+        try:
+            output = use_case.execute(input)
+        except GenreNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+        convert = retrieve_expanded_genre_output if input.expand == 'categories' else retrieve_genre_output
+
+        return Response(
+            status=HTTP_200_OK,
+            data=convert(output),
+        )
+
+    def _get_many(self, request: Request) -> Response:
+        request_serializer = GetManyGenresInputSerializer(data=request.query_params)
+        with serializer_timer():
+            request_serializer.is_valid(raise_exception=True)
+
+        input = GetManyGenres.Input(**request_serializer.validated_data)
+        use_case = container.use_case(GetManyGenres)
+        output = use_case.execute(input)
 
         return Response(
             status=HTTP_200_OK,
-            data =serializer.data
+            data=get_many_genre_output(output),
         )
-    
+
     def create(self, request: Request) -> Response:
         serializer = CreateGenreInputSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
 
         input = CreateGenre.Input(**serializer.validated_data)
-        use_case = CreateGenre(
-            repository=DjangoORMGenreRepository(),
-            category_repository=DjangoORMCategoryRepository(),
-        )
+        use_case = container.use_case(CreateGenre)
         try:
             output = use_case.execute(input)
         except (InvalidGenre, RelatedCategoriesNotFound) as err:
             return Response(data={"error": str(err)}, status=HTTP_400_BAD_REQUEST)
 
+        with serializer_timer():
+            data = CreateGenreOutputSerializer(output).data
+
         return Response(
             status=HTTP_201_CREATED,
-            data=CreateGenreOutputSerializer(output).data,
+            data=data,
         )
 
 
     def destroy(self, request: Request, pk=None) -> Response:
         serializer = DeleteGenreRequestSerializer(data={'id':pk})
-        serializer.is_valid(raise_exception=True)
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
 
         input = DeleteGenre.Input(**serializer.validated_data)
-        use_case = DeleteGenre(repository=DjangoORMGenreRepository())
+        use_case = container.use_case(DeleteGenre)
 
         try:
             use_case.execute(input)
@@ -73,13 +149,11 @@ class GenreViewSet(viewsets.ViewSet):
                 'id':pk,
             }
         )
-        serializer.is_valid(raise_exception=True)
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
 
         input = UpdateGenre.Input(**serializer.validated_data)
-        use_case = UpdateGenre(
-            repository=DjangoORMGenreRepository(),
-            category_repository=DjangoORMCategoryRepository()
-        )
+        use_case = container.use_case(UpdateGenre)
         try:
             output = use_case.execute(input)
         except GenreNotFound:
@@ -88,3 +162,94 @@ class GenreViewSet(viewsets.ViewSet):
             return Response(status=HTTP_400_BAD_REQUEST, data={"error": str(err)})
 
         return Response(status=HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request: Request) -> Response:
+        serializer = BulkRequestSerializer(data=request.data)
+        with serializer_timer():
+            serializer.is_valid(raise_exception=True)
+
+        create_positions, create_items, create_errors = validate_bulk_items(
+            CreateGenreInputSerializer, serializer.validated_data['create'], operation='create')
+        created = container.use_case(BulkCreateGenre).execute(
+            BulkCreateGenre.Input(items=[CreateGenre.Input(**item) for item in create_items])
+        )
+
+        update_positions, update_items, update_errors = validate_bulk_items(
+            UpdateGenreRequestSerializer, serializer.validated_data['update'], operation='update')
+        updated = container.use_case(BulkUpdateGenre).execute(
+            BulkUpdateGenre.Input(items=[BulkUpdateGenre.Item(**item) for item in update_items])
+        )
+
+        delete_positions, delete_items, delete_errors = validate_bulk_items(
+            DeleteGenreRequestSerializer,
+            [{'id': id} for id in serializer.validated_data['delete']],
+            operation='delete',
+        )
+        deleted = container.use_case(BulkDeleteGenre).execute(
+            BulkDeleteGenre.Input(ids=[item['id'] for item in delete_items])
+        )
+
+        response_serializer = BulkResponseSerializer(instance={
+            'created': created.ids,
+            'updated': updated.ids,
+            'deleted': deleted.ids,
+            'errors': [
+                *create_errors, *bulk_item_errors(created.errors, create_positions, operation='create'),
+                *update_errors, *bulk_item_errors(updated.errors, update_positions, operation='update'),
+                *delete_errors, *bulk_item_errors(deleted.errors, delete_positions, operation='delete'),
+            ],
+        })
+
+        with serializer_timer():
+            data = response_serializer.data
+
+        return Response(
+            status=HTTP_200_OK,
+            data=data,
+        )
+
+    @action(detail=False, methods=['get'])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        use_case = container.use_case(ExportGenre)
+        output = use_case.execute(ExportGenre.Input(chunk_size=EXPORT_CHUNK_SIZE))
+
+        return ndjson_response(request, map(genre_output, output))
+
+    @action(detail=False, methods=['get'])
+    def changes(self, request: Request) -> Response:
+        request_serializer = ListGenreChangesInputSerializer(data=request.query_params)
+        with serializer_timer():
+            request_serializer.is_valid(raise_exception=True)
+
+        input = ListGenreChanges.Input(**request_serializer.validated_data)
+        use_case = container.use_case(ListGenreChanges)
+        output: ListGenreChanges.Output = use_case.execute(input)
+        serializer = ListGenreChangesOutputSerializer(instance=output)
+
+        with serializer_timer():
+            data = serializer.data
+
+        return Response(
+            status=HTTP_200_OK,
+            data=data,
+        )
+
+
+# Async read endpoints for ASGI deployments: the same use cases and converters as the
+# viewset, awaiting the repository instead of blocking a worker thread on it.
+
+@conditional_view(GenreRepository, CategoryRepository)
+async def async_list(request: HttpRequest) -> HttpResponse:
+    request_serializer = ListGenreInputSerializer(data=request.GET)
+    with serializer_timer():
+        is_valid = request_serializer.is_valid()
+    if not is_valid:
+        return JsonResponse(request_serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+    input = ListGenre.Input(**request_serializer.validated_data)
+    use_case = container.use_case(ListGenre)
+    output = await use_case.aexecute(input)
+    convert = list_expanded_genre_output if input.expand == 'categories' else list_genre_output
+
+    return JsonResponse(convert(output), status=HTTP_200_OK)
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from src.django_project.outbox_app.models import OutboxEvent
+
+
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ('id', 'name', 'aggregate_id', 'occurred_at')
+
+
+admin.site.register(OutboxEvent, OutboxEventAdmin)
@@ -0,0 +1,77 @@
+from django.db import transaction
+
+from src.django_project.outbox_app.models import OutboxEvent
+from src.django_project.outbox_app.sinks import Sink
+
+
+def dispatch_batch(sink: Sink, batch_size: int = 500) -> int:
+    """Publish the oldest ``batch_size`` outbox events to ``sink`` and remove them,
+    returning how many went out.
+
+    The rows are locked with SKIP LOCKED (on databases that have it) for the duration of
+    the batch, so several dispatchers can run side by side without publishing the same
+    event twice; the rows are only deleted once ``publish`` returned, in the same
+    transaction, so a failing sink leaves them for the next run (at-least-once delivery).
+
+    Events keep their write order per aggregate, not across aggregates: see
+    ``held_back_aggregates``.
+    """
+    with transaction.atomic():
+        outbox_events = lock_oldest(batch_size)
+        held_back = held_back_aggregates(outbox_events)
+        outbox_events = [
+            outbox_event for outbox_event in outbox_events if outbox_event.aggregate_id not in held_back
+        ]
+        if not outbox_events:
+            return 0
+
+        sink.publish([to_message(outbox_event) for outbox_event in outbox_events])
+        OutboxEvent.objects.filter(id__in=[outbox_event.id for outbox_event in outbox_events]).delete()
+
+    return len(outbox_events)
+
+
+def lock_oldest(batch_size: int) -> list[OutboxEvent]:
+    return list(OutboxEvent.objects.select_for_update(skip_locked=True).order_by('id')[:batch_size])
+
+
+def held_back_aggregates(outbox_events: list[OutboxEvent]) -> set:
+    """The aggregates of ``outbox_events`` with an older event left out of the batch.
+
+    Writes to one aggregate lock its row, so its events get their ids in commit order;
+    across aggregates they do not, and ids say nothing. An older event missing from a
+    batch taken oldest-first was skipped because another dispatcher holds it, so the
+    aggregate's newer events wait for the next run instead of overtaking it.
+    """
+    if not outbox_events:
+        return set()
+
+    return set(
+        OutboxEvent.objects.filter(
+            aggregate_id__in={outbox_event.aggregate_id for outbox_event in outbox_events},
+            id__lt=outbox_events[-1].id,
+        ).exclude(
+            id__in=[outbox_event.id for outbox_event in outbox_events],
+        ).values_list('aggregate_id', flat=True)
+    )
+
+
+def drain(sink: Sink, batch_size: int = 500) -> int:
+    """Dispatch batches until the outbox is empty, returning how many events went out."""
+    dispatched = 0
+    while True:
+        count = dispatch_batch(sink, batch_size)
+        dispatched += count
+        if count < batch_size:
+            return dispatched
+
+
+def to_message(outbox_event: OutboxEvent) -> dict:
+    return {
+        'id': str(outbox_event.event_id),
+        'aggregate': outbox_event.aggregate,
+        'aggregate_id': str(outbox_event.aggregate_id),
+        'name': outbox_event.name,
+        'payload': outbox_event.payload,
+        'occurred_at': outbox_event.occurred_at.isoformat(),
+    }
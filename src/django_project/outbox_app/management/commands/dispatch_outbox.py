@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.django_project.outbox_app.dispatcher import drain
+from src.django_project.outbox_app.sinks import get_sink
+
+
+class Command(BaseCommand):
+    help = 'Publish the outbox events to the configured sink (settings.OUTBOX_SINK), in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Events per batch (and transaction).')
+        parser.add_argument(
+            '--interval', type=float, default=1.0,
+            help='Seconds to wait before polling again once the outbox is empty.',
+        )
+        parser.add_argument('--once', action='store_true', help='Drain the outbox once and exit.')
+
+    def handle(self, *args, batch_size, interval, once, **options):
+        sink = get_sink()
+        if once:
+            self.stdout.write(f'Dispatched {drain(sink, batch_size)} events')
+            return
+
+        try:
+            while True:
+                if not drain(sink, batch_size):
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:28
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('event_id', models.UUIDField(unique=True)),
+                ('aggregate', models.CharField(max_length=64)),
+                ('aggregate_id', models.UUIDField()),
+                ('name', models.CharField(max_length=128)),
+                ('payload', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('occurred_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'outbox_event',
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class OutboxEvent(models.Model):
+    # The auto-incremented id is the dispatch order. It follows the commit order only
+    # per aggregate (whose row the write locks), which is the order dispatch keeps.
+    id = models.BigAutoField(primary_key=True)
+    event_id = models.UUIDField(unique=True)
+    aggregate = models.CharField(max_length=64)
+    aggregate_id = models.UUIDField()
+    name = models.CharField(max_length=128)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    occurred_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'outbox_event'
+
+    def __str__(self):
+        return f'{self.name} ({self.aggregate_id})'
@@ -0,0 +1,35 @@
+from typing import Iterable
+
+from src.core._shared.events import DomainEvent
+from src.django_project.outbox_app.models import OutboxEvent
+
+
+def add(events: Iterable[DomainEvent]) -> None:
+    """Write ``events`` to the outbox table, in one insert.
+
+    Call it inside the ``transaction.atomic()`` block of the repository write the events
+    describe: both commit or neither does, so an event is never published for a change
+    that rolled back, nor lost for one that committed.
+    """
+    outbox_events = [
+        OutboxEvent(
+            event_id=event.id,
+            aggregate=event.aggregate,
+            aggregate_id=event.aggregate_id,
+            name=event.event_type,
+            payload=to_payload(event),
+            occurred_at=event.occurred_at,
+        )
+        for event in events
+    ]
+    if outbox_events:
+        OutboxEvent.objects.bulk_create(outbox_events)
+
+
+def to_payload(event: DomainEvent) -> dict:
+    # Sets of ids (e.g. genre categories) become sorted lists; the rest is left to the
+    # JSON encoder of the payload column.
+    return {
+        key: sorted(str(item) for item in value) if isinstance(value, (set, frozenset)) else value
+        for key, value in event.payload().items()
+    }
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import orjson
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class Sink(ABC):
+    """Where the dispatcher publishes outbox events (a broker, a webhook, a file...).
+
+    ``publish`` gets a batch of messages in outbox order and must either deliver all of
+    them or raise: the batch stays in the outbox and is published again on the next
+    run, so delivery is at least once and consumers deduplicate by message ``id``.
+    """
+    @abstractmethod
+    def publish(self, messages: list[dict]) -> None:
+        raise NotImplementedError
+
+
+class InMemorySink(Sink):
+    """Keeps the messages in the process, for tests and in-process consumers."""
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    def publish(self, messages: list[dict]) -> None:
+        self.messages.extend(messages)
+
+
+class FileSink(Sink):
+    """Appends the messages to a file, one JSON document per line (NDJSON)."""
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path or settings.OUTBOX_FILE_PATH)
+
+    def publish(self, messages: list[dict]) -> None:
+        lines = b''.join(orjson.dumps(message) + b'\n' for message in messages)
+        with self.path.open('ab') as file:
+            file.write(lines)
+
+
+def get_sink() -> Sink:
+    """The sink configured in ``settings.OUTBOX_SINK`` (a dotted path to a Sink class)."""
+    return import_string(settings.OUTBOX_SINK)()
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+from django.core.management import call_command
+
+from src.core.category.domain.category import Category
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.outbox_app import dispatcher
+from src.django_project.outbox_app.dispatcher import dispatch_batch, drain
+from src.django_project.outbox_app.models import OutboxEvent
+from src.django_project.outbox_app.sinks import FileSink, InMemorySink, Sink
+
+
+class FailingSink(Sink):
+    def publish(self, messages: list[dict]) -> None:
+        raise ConnectionError('broker is down')
+
+
+def create_categories(count: int) -> list[Category]:
+    categories = [Category.create(name=f'Category {index}') for index in range(count)]
+    DjangoORMCategoryRepository().save_many(categories)
+    return categories
+
+
+@pytest.mark.django_db
+class TestDispatch:
+    def test_dispatch_batch_publishes_the_oldest_events_and_removes_them(self):
+        categories = create_categories(3)
+        sink = InMemorySink()
+
+        assert dispatch_batch(sink, batch_size=2) == 2
+
+        assert [message['aggregate_id'] for message in sink.messages] == [
+            str(category.id) for category in categories[:2]
+        ]
+        assert OutboxEvent.objects.count() == 1
+
+    def test_message_format(self):
+        [category] = create_categories(1)
+        sink = InMemorySink()
+
+        dispatch_batch(sink)
+
+        [message] = sink.messages
+        assert message.keys() == {'id', 'aggregate', 'aggregate_id', 'name', 'payload', 'occurred_at'}
+        assert message['aggregate'] == 'category'
+        assert message['name'] == 'CategoryCreated'
+        assert message['payload'] == {'name': 'Category 0', 'description': '', 'is_active': True}
+
+    def test_drain_publishes_everything_in_batches(self):
+        create_categories(5)
+        sink = InMemorySink()
+
+        assert drain(sink, batch_size=2) == 5
+
+        assert [message['payload']['name'] for message in sink.messages] == [f'Category {index}' for index in range(5)]
+        assert not OutboxEvent.objects.exists()
+
+    def test_aggregate_waits_while_an_older_event_is_locked_elsewhere(self, monkeypatch):
+        renamed, other = create_categories(2)
+        renamed.update_category(name='Renamed', description='')
+        DjangoORMCategoryRepository().update(renamed)
+        created_event, _, renamed_event = OutboxEvent.objects.order_by('id')
+        # Another dispatcher holds the first event, so SKIP LOCKED leaves it out.
+        lock_oldest = dispatcher.lock_oldest
+        monkeypatch.setattr(
+            dispatcher, 'lock_oldest',
+            lambda batch_size: [event for event in lock_oldest(batch_size) if event.id != created_event.id],
+        )
+        sink = InMemorySink()
+
+        assert dispatch_batch(sink) == 1
+
+        assert [message['aggregate_id'] for message in sink.messages] == [str(other.id)]
+        assert set(OutboxEvent.objects.values_list('id', flat=True)) == {created_event.id, renamed_event.id}
+
+    def test_failing_sink_leaves_the_batch_in_the_outbox(self):
+        create_categories(2)
+
+        with pytest.raises(ConnectionError):
+            dispatch_batch(FailingSink())
+
+        assert OutboxEvent.objects.count() == 2
+
+    def test_file_sink_appends_ndjson(self, tmp_path):
+        create_categories(2)
+        path = tmp_path / 'outbox.ndjson'
+
+        drain(FileSink(path), batch_size=1)
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)['payload']['name'] for line in lines] == ['Category 0', 'Category 1']
+
+    def test_command_drains_once_to_the_configured_sink(self, settings, tmp_path, capsys):
+        settings.OUTBOX_SINK = 'src.django_project.outbox_app.sinks.FileSink'
+        settings.OUTBOX_FILE_PATH = tmp_path / 'events.ndjson'
+        create_categories(3)
+
+        call_command('dispatch_outbox', '--once', '--batch-size', '2')
+
+        assert 'Dispatched 3 events' in capsys.readouterr().out
+        assert len(settings.OUTBOX_FILE_PATH.read_text().splitlines()) == 3
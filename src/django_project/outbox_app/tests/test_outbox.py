@@ -0,0 +1,93 @@
+import pytest
+from django.db import transaction
+
+from src.core.castmembers.domain.castmember import CastMember, CastMemberType
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.django_project.castmember_app.repository import DjangoORMCastMemberRepository
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.outbox_app.models import OutboxEvent
+
+
+def outbox_names() -> list[str]:
+    return list(OutboxEvent.objects.order_by('id').values_list('name', flat=True))
+
+
+@pytest.mark.django_db
+class TestRepositoryWrites:
+    def test_save_update_and_delete_write_their_events(self):
+        repository = DjangoORMCategoryRepository()
+        category = Category.create(name='Filme')
+
+        repository.save(category)
+        category.update_category(name='Série', description='')
+        repository.update(category)
+        repository.delete(category.id)
+
+        assert outbox_names() == ['CategoryCreated', 'CategoryUpdated', 'CategoryDeleted']
+        created = OutboxEvent.objects.order_by('id').first()
+        assert created.aggregate == 'category'
+        assert created.aggregate_id == category.id
+        assert created.payload == {'name': 'Filme', 'description': '', 'is_active': True}
+
+    def test_unchanged_entity_writes_no_event(self, django_assert_num_queries):
+        repository = DjangoORMCastMemberRepository()
+        cast_member = CastMember(name='Adriana Esteves', type=CastMemberType.ACTOR)
+        repository.save(cast_member)
+
+        # SAVEPOINT, INSERT and RELEASE: no outbox insert without events.
+        with django_assert_num_queries(3):
+            repository.save(CastMember(name='Wagner Moura', type=CastMemberType.ACTOR))
+
+        assert outbox_names() == []
+
+    def test_events_roll_back_with_the_write(self):
+        repository = DjangoORMCategoryRepository()
+
+        with pytest.raises(RuntimeError), transaction.atomic():
+            repository.save(Category.create(name='Filme'))
+            raise RuntimeError
+
+        assert outbox_names() == []
+
+    def test_bulk_writes_record_one_event_per_entity(self):
+        repository = DjangoORMCastMemberRepository()
+        cast_members = [
+            CastMember.create(name=f'Cast member {index}', type=CastMemberType.ACTOR) for index in range(3)
+        ]
+
+        repository.save_many(cast_members)
+        repository.delete_many({cast_member.id for cast_member in cast_members})
+
+        assert outbox_names() == ['CastMemberCreated'] * 3 + ['CastMemberDeleted'] * 3
+
+    def test_genre_category_changes_are_published_as_a_diff(self):
+        category_repository = DjangoORMCategoryRepository()
+        genre_repository = DjangoORMGenreRepository()
+        kept, removed, added = Category(name='Kept'), Category(name='Removed'), Category(name='Added')
+        category_repository.save_many([kept, removed, added])
+        genre = Genre(name='Romance', categories={kept.id, removed.id})
+        genre_repository.save(genre)
+
+        genre.change_categories({kept.id, added.id})
+        genre_repository.update(genre)
+
+        event = OutboxEvent.objects.get()
+        assert event.name == 'GenreCategoriesChanged'
+        assert event.payload == {'added': [str(added.id)], 'removed': [str(removed.id)]}
+
+    def test_deleting_a_category_changes_the_categories_of_its_genres(self):
+        category_repository = DjangoORMCategoryRepository()
+        genre_repository = DjangoORMGenreRepository()
+        movie = Category(name='Movie')
+        category_repository.save(movie)
+        romance = Genre(name='Romance', categories={movie.id})
+        genre_repository.save(romance)
+
+        category_repository.delete(movie.id)
+
+        events = {event.name: event for event in OutboxEvent.objects.all()}
+        assert events.keys() == {'CategoryDeleted', 'GenreCategoriesChanged'}
+        assert events['GenreCategoriesChanged'].aggregate_id == romance.id
+        assert events['GenreCategoriesChanged'].payload == {'added': [], 'removed': [str(movie.id)]}
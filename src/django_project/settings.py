@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -23,9 +26,11 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 SECRET_KEY = 'django-insecure-!3s%hb%j*nhp6-7y1$6#ar@6z5(@s!-ih!9b)7t%r9vsrzrq8t'
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# Off unless asked for: DEBUG=true for local runs, django_debug_mode in pytest.ini for
+# the tests.
+DEBUG = os.environ.get('DEBUG', 'false').lower() == 'true'
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [host for host in os.environ.get('ALLOWED_HOSTS', '').split(',') if host]
 
 
 # Application definition
@@ -42,9 +47,11 @@ INSTALLED_APPS = [
     'src.django_project.category_app',
     'src.django_project.genre_app',
     'src.django_project.castmember_app',
+    'src.django_project.outbox_app',
 ]
 
 MIDDLEWARE = [
+    'src.django_project._shared.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -52,6 +59,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'src.django_project._shared.profiling.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'src.django_project.urls'
@@ -78,13 +86,100 @@ WSGI_APPLICATION = 'src.django_project.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
+# DATABASE_ENGINE picks the database: 'sqlite' (default, for local runs and tests) or
+# 'postgresql'. Connections are kept open for DATABASE_CONN_MAX_AGE seconds and reused
+# by the following requests of the same worker thread (checked first when
+# DATABASE_CONN_HEALTH_CHECKS is on), instead of connecting on every request.
+DATABASE_ENGINE = os.environ.get('DATABASE_ENGINE', 'sqlite')
+DATABASE_CONN_MAX_AGE = int(os.environ.get('DATABASE_CONN_MAX_AGE', 60))
+DATABASE_CONN_HEALTH_CHECKS = os.environ.get('DATABASE_CONN_HEALTH_CHECKS', 'true').lower() == 'true'
+
+if DATABASE_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DATABASE_NAME', 'codeflix'),
+            'USER': os.environ.get('DATABASE_USER', 'postgres'),
+            'PASSWORD': os.environ.get('DATABASE_PASSWORD', ''),
+            'HOST': os.environ.get('DATABASE_HOST', 'localhost'),
+            'PORT': os.environ.get('DATABASE_PORT', '5432'),
+            'CONN_MAX_AGE': DATABASE_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': DATABASE_CONN_HEALTH_CHECKS,
+            # Behind a transaction-pooling PgBouncer (DATABASE_PGBOUNCER=true) a cursor
+            # cannot outlive its transaction, so the exports fetch in chunks instead.
+            'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('DATABASE_PGBOUNCER', 'false').lower() == 'true',
+            'OPTIONS': {
+                'connect_timeout': int(os.environ.get('DATABASE_CONNECT_TIMEOUT', 5)),
+            },
+        }
+    }
+elif DATABASE_ENGINE == 'sqlite':
+    DATABASES = {
+        'default': {
+            # Django's backend plus pragmas and transaction_mode, see _shared/sqlite3/base.py
+            'ENGINE': 'src.django_project._shared.sqlite3',
+            'NAME': os.environ.get('DATABASE_NAME', BASE_DIR / 'db.sqlite3'),
+            'CONN_MAX_AGE': DATABASE_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': DATABASE_CONN_HEALTH_CHECKS,
+            'OPTIONS': {},
+        }
+    }
+    # DATABASE_SQLITE_TUNED=false keeps SQLite's defaults (rollback journal, full sync,
+    # deferred transactions), e.g. to compare with src.benchmarks.load.
+    if os.environ.get('DATABASE_SQLITE_TUNED', 'true').lower() == 'true':
+        DATABASES['default']['OPTIONS'] = {
+            'pragmas': {
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'busy_timeout': int(os.environ.get('DATABASE_BUSY_TIMEOUT', 5000)),
+                'temp_store': 'MEMORY',
+            },
+            'transaction_mode': 'IMMEDIATE',
+        }
+else:
+    raise ImproperlyConfigured(f"DATABASE_ENGINE must be 'sqlite' or 'postgresql', not {DATABASE_ENGINE!r}")
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'codeflix-catalog-admin'),
     }
 }
 
+if CACHES['default']['BACKEND'] == 'django.core.cache.backends.locmem.LocMemCache':
+    CACHES['default']['OPTIONS'] = {'MAX_ENTRIES': 10000}
+
+# Read-through cache used by the Cached*Repository decorators
+REPOSITORY_CACHE_ALIAS = 'default'
+REPOSITORY_CACHE_TIMEOUT = int(os.environ.get('REPOSITORY_CACHE_TIMEOUT', 300))
+# Per-process LRU of the rows read by id (entries per namespace, seconds a hit may be stale)
+REPOSITORY_LRU_SIZE = int(os.environ.get('REPOSITORY_LRU_SIZE', 1024))
+REPOSITORY_LRU_TIMEOUT = float(os.environ.get('REPOSITORY_LRU_TIMEOUT', 5))
+
+# Request metrics (see src/django_project/_shared/metrics.py), exposed on /metrics
+METRICS_SERVER_TIMING = os.environ.get('METRICS_SERVER_TIMING', 'false').lower() == 'true'
+# Peers allowed to read /metrics (comma separated), e.g. the Prometheus scraper
+METRICS_ALLOWED_IPS = [ip for ip in os.environ.get('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',') if ip]
+
+# Seconds a change stays out of the changes feed, to let transactions that stamped an
+# older updated_at/deleted_at commit first; keep it above the longest write transaction
+CHANGE_FEED_LAG = float(os.environ.get('CHANGE_FEED_LAG', 5))
+
+# Per-request cProfile for staff (see src/django_project/_shared/profiling.py)
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'false').lower() == 'true'
+PROFILING_OUTPUT_DIR = os.environ.get('PROFILING_OUTPUT_DIR', '')
+PROFILING_SORT = os.environ.get('PROFILING_SORT', 'cumulative')
+PROFILING_LIMIT = int(os.environ.get('PROFILING_LIMIT', 50))
+
+# Domain events written by the repositories to the outbox table, published by
+# `manage.py dispatch_outbox` to OUTBOX_SINK (see src/django_project/outbox_app/sinks.py)
+OUTBOX_SINK = os.environ.get('OUTBOX_SINK', 'src.django_project.outbox_app.sinks.FileSink')
+OUTBOX_FILE_PATH = os.environ.get('OUTBOX_FILE_PATH', BASE_DIR / 'outbox.ndjson')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -130,4 +225,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
+    'DEFAULT_RENDERER_CLASSES': [
+        'src.django_project._shared.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
\ No newline at end of file
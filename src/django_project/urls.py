@@ -19,8 +19,12 @@ from django.urls import path
 
 from rest_framework.routers import DefaultRouter
 
+from src.django_project._shared.metrics import metrics_view
+from src.django_project.genre_app import views as genre_views
 from src.django_project.genre_app.views import GenreViewSet
+from src.django_project.category_app import views as category_views
 from src.django_project.category_app.views import CategoryViewSet
+from src.django_project.castmember_app import views as castmember_views
 from src.django_project.castmember_app.views import CastMemberViewSet
 
 router = DefaultRouter()
@@ -30,4 +34,10 @@ router.register(r'api/genres', GenreViewSet, basename='genre')
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
+    # Async (ASGI-native) reads; writes stay on the viewsets.
+    path('api/async/castmembers/', castmember_views.async_list, name='async-castmembers-list'),
+    path('api/async/categories/', category_views.async_list, name='async-category-list'),
+    path('api/async/categories/<uuid:pk>/', category_views.async_retrieve, name='async-category-detail'),
+    path('api/async/genres/', genre_views.async_list, name='async-genre-list'),
 ] + router.urls
@@ -11,7 +11,7 @@ class TestCreateAndEditCategory:
 
         # Check if category list is empty
         list_response = api_client.get(url)
-        assert list_response.data == {'data': []}
+        assert list_response.data == {'data': [], 'meta': {'next_cursor': None, 'page_size': 50}}
 
         # Create a category
         create_response = api_client.post(
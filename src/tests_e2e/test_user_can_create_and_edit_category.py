@@ -11,7 +11,7 @@ class TestCreateAndEditCategory:
 
         # Check if category list is empty
         list_response = api_client.get(url)
-        assert list_response.data == {'data': []}
+        assert list_response.data == {'data': [], 'meta': {'next_cursor': None, 'page_size': 50}}
 
         # Create a category
         create_response = api_client.post(
@@ -35,7 +35,8 @@ class TestCreateAndEditCategory:
                     'description': 'Movie description',
                     'is_active': True,
                 }
-            ]
+            ],
+            'meta': {'next_cursor': None, 'page_size': 50},
         }
 
         # Edit created category
@@ -61,5 +62,6 @@ class TestCreateAndEditCategory:
                     'description': 'Documentary description',
                     'is_active': False,
                 }
-            ]
+            ],
+            'meta': {'next_cursor': None, 'page_size': 50},
         }
\ No newline at end of file
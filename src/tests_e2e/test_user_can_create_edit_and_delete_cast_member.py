@@ -12,7 +12,7 @@ class TestE2ECastMember:
 
         # Check if cast member list is empty
         list_response = api_client.get(url)
-        assert list_response.data == {"data": []}
+        assert list_response.data == {'data': [], 'meta': {'next_cursor': None, 'page_size': 50}}
 
         # Create a cast member
         create_response = api_client.post(
@@ -35,7 +35,8 @@ class TestE2ECastMember:
                     'name': "Adriana Esteves",
                     'type': 'ATOR',
                 }
-            ]
+            ],
+            'meta': {'next_cursor': None, 'page_size': 50},
         }
 
         # Edit created cast member
@@ -59,7 +60,8 @@ class TestE2ECastMember:
                     'name': 'Quentin Tarantino',
                     "type": "DIRETOR"
                 }
-            ]
+            ],
+            'meta': {'next_cursor': None, 'page_size': 50},
         }
 
         # Check if can delete created cast member
@@ -69,4 +71,4 @@ class TestE2ECastMember:
 
         # Check if deleted cast member doesn't exist
         get_response = api_client.get(f'{url}')
-        assert get_response.data == {"data": []}
\ No newline at end of file
+        assert get_response.data == {'data': [], 'meta': {'next_cursor': None, 'page_size': 50}}
\ No newline at end of file